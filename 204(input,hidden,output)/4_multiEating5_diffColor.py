@@ -21,11 +21,10 @@ def get_color_from_id(id):
     if id <= 0:
         return (0, 150, 0)
 
-    random.seed(id)  # ID를 기반으로 랜덤 고정
-    r = random.randint(50, 200)
-    g = random.randint(50, 200)
-    b = random.randint(50, 200)
-    random.seed(None)  # 랜덤 시드 초기화
+    rng = random.Random(id)  # ID를 기반으로 랜덤 고정 (전역 random 상태는 건드리지 않음)
+    r = rng.randint(50, 200)
+    g = rng.randint(50, 200)
+    b = rng.randint(50, 200)
 
     return (r, g, b)
 
@@ -3,6 +3,8 @@ import neat
 import os
 import random
 import math
+import json
+from collections import deque
 
 # --- 1. 전역 설정 ---
 WIN_WIDTH = 800
@@ -14,11 +16,16 @@ MAX_GEN_TIME = 600
 FOOD_COUNT = 3
 
 # --- Fitness 로그 저장 ---
-fitness_log_best = []
-fitness_log_avg = []
+# 전체 기록은 FITNESS_LOG_PATH 에 세대마다 한 줄씩 추가 (JSONL),
+# 메모리에는 그래프에 그릴 최근 GRAPH_WINDOW 세대만 남김
+FITNESS_LOG_PATH = "fitness_log.jsonl"
+GRAPH_WINDOW = 100
+fitness_log_gen = deque(maxlen=GRAPH_WINDOW)
+fitness_log_best = deque(maxlen=GRAPH_WINDOW)
+fitness_log_avg = deque(maxlen=GRAPH_WINDOW)
 
 # --- 선택된 Generation ---
-selected_gen = None  # None이면 선택 안함
+selected_gen = None  # 그래프 창 안의 위치, None이면 선택 안함
 selected_gen_box_height = 80
 
 
@@ -29,11 +36,10 @@ def get_color_from_id(id):
     if id <= 0:
         return (0, 150, 0)
 
-    random.seed(id)
-    r = random.randint(50, 200)
-    g = random.randint(50, 200)
-    b = random.randint(50, 200)
-    random.seed(None)
+    rng = random.Random(id)
+    r = rng.randint(50, 200)
+    g = rng.randint(50, 200)
+    b = rng.randint(50, 200)
     return (r, g, b)
 
 
@@ -120,10 +126,12 @@ def draw_selected_gen_box(screen, font):
 
     pygame.draw.rect(screen, (50, 50, 50), (panel_x, box_y, INFO_PANEL_WIDTH, selected_gen_box_height))
 
+    if selected_gen >= len(fitness_log_best):
+        return
     best = fitness_log_best[selected_gen]
     avg = fitness_log_avg[selected_gen]
 
-    text1 = font.render(f"Selected Gen: {selected_gen}", True, (255, 255, 255))
+    text1 = font.render(f"Selected Gen: {fitness_log_gen[selected_gen]}", True, (255, 255, 255))
     text2 = font.render(f"Best: {best:.2f}", True, (255, 255, 0))
     text3 = font.render(f"Avg: {avg:.2f}", True, (0, 180, 255))
 
@@ -212,7 +220,7 @@ def handle_graph_click(mouse_pos):
 # genome 평가 함수
 # --------------------------------
 def eval_genomes(genomes, config):
-    global GEN
+    global GEN, selected_gen
     GEN += 1
 
     pygame.init()
@@ -299,10 +307,20 @@ def eval_genomes(genomes, config):
         pygame.display.update()
         clock.tick(FPS)
 
-    # 세대 종료 데이터 저장
-    fitness_values = [g.fitness for g in ge]
-    fitness_log_best.append(max(fitness_values))
-    fitness_log_avg.append(sum(fitness_values) / len(fitness_values))
+    # 세대 종료 데이터 저장 (살아남은 genome 기준)
+    fitness_values = [g.fitness for g in ge] or [0]
+    best = max(fitness_values)
+    avg = sum(fitness_values) / len(fitness_values)
+
+    # 그래프 창이 한 칸 밀리면 선택 위치도 같이 당김
+    if selected_gen is not None and len(fitness_log_best) == GRAPH_WINDOW:
+        selected_gen = selected_gen - 1 if selected_gen > 0 else None
+    fitness_log_gen.append(GEN)
+    fitness_log_best.append(best)
+    fitness_log_avg.append(avg)
+
+    with open(FITNESS_LOG_PATH, "a") as f:
+        f.write(json.dumps({"generation": GEN, "best": best, "avg": avg}) + "\n")
 
 
 # --------------------------------
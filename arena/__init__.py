@@ -0,0 +1,4 @@
+"""
+큰 월드(아레나)용 공용 모듈 모음.
+실행: python -m arena --scenario big_world --mode windowed  (또는 python -m arena.big_world)
+"""
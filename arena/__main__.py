@@ -0,0 +1,4 @@
+# python -m arena --scenario <시나리오> --mode headless|windowed|replay  (arena/cli.py)
+from .cli import main
+
+main()
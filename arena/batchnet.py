@@ -0,0 +1,191 @@
+import numpy as np
+from neat.graphs import feed_forward_layers
+
+
+# --------------------------------
+# ▣ 활성화 함수 (neat.activations 와 같은 식을 배열로)
+# --------------------------------
+def _sigmoid(z):
+    z = np.clip(5.0 * z, -60.0, 60.0)
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def _tanh(z):
+    return np.tanh(np.clip(2.5 * z, -60.0, 60.0))
+
+
+def _relu(z):
+    return np.maximum(z, 0.0)
+
+
+def _identity(z):
+    return z
+
+
+def _clamped(z):
+    return np.clip(z, -1.0, 1.0)
+
+
+def _gauss(z):
+    z = np.clip(z, -3.4, 3.4)
+    return np.exp(-5.0 * z ** 2)
+
+
+def _sin(z):
+    return np.sin(np.clip(5.0 * z, -60.0, 60.0))
+
+
+def _abs(z):
+    return np.abs(z)
+
+
+ACTIVATIONS = {
+    "sigmoid": _sigmoid,
+    "tanh": _tanh,
+    "relu": _relu,
+    "identity": _identity,
+    "clamped": _clamped,
+    "gauss": _gauss,
+    "sin": _sin,
+    "abs": _abs,
+}
+
+
+ACTIVATION_NAMES = sorted(ACTIVATIONS)
+
+
+class _Piece:
+    """genome 하나를 컴파일한 결과 (노드 인덱스는 0부터 시작하는 지역 인덱스)"""
+
+    def __init__(self, genome, gc):
+        # CompactGenome 의 nodes / connections 는 읽을 때마다 dict 를 새로 만드므로 한 번씩만 읽는다
+        genome_nodes = genome.nodes
+        genome_connections = genome.connections
+        if any(ng.aggregation != "sum" for ng in genome_nodes.values()):
+            raise ValueError("BatchNetwork only supports the 'sum' aggregation")
+
+        # 입력/출력 노드 자리 먼저 배정 (neat 처럼 출력 노드 초기값은 0)
+        slot = {}
+        for key in gc.input_keys + gc.output_keys:
+            slot[key] = len(slot)
+        self.inputs = np.array([slot[k] for k in gc.input_keys], dtype=np.int64)
+        self.outputs = np.array([slot[k] for k in gc.output_keys], dtype=np.int64)
+
+        connections = [cg.key for cg in genome_connections.values() if cg.enabled]
+        incoming = {}
+        for i, o in connections:
+            incoming.setdefault(o, []).append(i)
+
+        # 깊이별 (노드, bias, response, 활성화 코드, 연결 src, 연결 dst 위치, weight)
+        self.layers = []
+        for layer_nodes in feed_forward_layers(gc.input_keys, gc.output_keys, connections):
+            nodes, bias, response, activation = [], [], [], []
+            edge_src, edge_dst, edge_weight = [], [], []
+            for node in sorted(layer_nodes):
+                if node not in slot:
+                    slot[node] = len(slot)
+                ng = genome_nodes[node]
+                for i in incoming.get(node, ()):
+                    edge_src.append(slot[i])
+                    edge_dst.append(len(nodes))
+                    edge_weight.append(genome_connections[(i, node)].weight)
+                nodes.append(slot[node])
+                bias.append(ng.bias)
+                response.append(ng.response)
+                activation.append(ACTIVATION_NAMES.index(ng.activation))
+
+            self.layers.append((np.array(nodes, dtype=np.int64), np.array(bias), np.array(response),
+                                np.array(activation, dtype=np.int64), np.array(edge_src, dtype=np.int64),
+                                np.array(edge_dst, dtype=np.int64), np.array(edge_weight)))
+        self.size = len(slot)
+
+
+class _Layer:
+    """같은 깊이에 있는 모든 네트워크의 노드를 한 번에 계산하기 위한 배열 묶음"""
+
+    def __init__(self, parts):
+        columns = list(zip(*parts))
+        self.nodes, self.bias, self.response, codes, self.edge_src, self.edge_dst, self.edge_weight = \
+            [np.concatenate(c) for c in columns]
+
+        # 활성화 함수별 노드 위치 (보통 sigmoid 하나뿐)
+        self.activation = [(ACTIVATIONS[ACTIVATION_NAMES[code]], np.flatnonzero(codes == code))
+                           for code in np.unique(codes)]
+
+
+# --------------------------------
+# ▣ 여러 genome 을 한 번에 계산하는 FeedForward 네트워크
+# --------------------------------
+class BatchNetwork:
+    """
+    neat.nn.FeedForwardNetwork 여러 개를 하나로 합친 것.
+    모든 네트워크의 노드 값을 한 배열에 두고, 같은 깊이(layer)의 노드를
+    네트워크 구분 없이 bincount 한 번으로 계산한다.
+
+    groups: [(genomes, config), ...]  (genomes 는 eval_genomes 가 받는 (id, genome) 리스트)
+    config 가 다른 여러 population(예: 먹이 생명체 + 포식자)도 같이 넣을 수 있다.
+    """
+
+    def __init__(self, groups):
+        self.genome_configs = [config.genome_config for genomes, config in groups]
+        self.pieces = [[_Piece(genome, config.genome_config) for genome_id, genome in genomes]
+                       for genomes, config in groups]
+        self.assemble()
+
+    def replace(self, group, row, genome):
+        """group 의 row 번째 네트워크만 새 genome 으로 바꾼다 (다음 activate 때 다시 합침)"""
+        self.pieces[group][row] = _Piece(genome, self.genome_configs[group])
+        self.dirty = True
+
+    def assemble(self):
+        """genome 별로 컴파일한 조각들을 전역 인덱스로 옮겨 깊이별로 이어 붙인다"""
+        self.input_slots = []
+        self.output_slots = []
+        parts = []
+        size = 0
+
+        for pieces in self.pieces:
+            inputs = []
+            outputs = []
+            for piece in pieces:
+                inputs.append(piece.inputs + size)
+                outputs.append(piece.outputs + size)
+                for depth, (nodes, bias, response, codes, edge_src, edge_dst, edge_weight) in \
+                        enumerate(piece.layers):
+                    if depth == len(parts):
+                        parts.append(([], 0))
+                    layer_parts, count = parts[depth]
+                    layer_parts.append((nodes + size, bias, response, codes,
+                                        edge_src + size, edge_dst + count, edge_weight))
+                    parts[depth] = (layer_parts, count + len(nodes))
+                size += piece.size
+
+            n_in = len(self.genome_configs[len(self.input_slots)].input_keys)
+            n_out = len(self.genome_configs[len(self.output_slots)].output_keys)
+            self.input_slots.append(np.array(inputs, dtype=np.int64).reshape(-1, n_in))
+            self.output_slots.append(np.array(outputs, dtype=np.int64).reshape(-1, n_out))
+
+        self.layers = [_Layer(layer_parts) for layer_parts, count in parts]
+        self.values = np.zeros(size)
+        self.dirty = False
+
+    def activate(self, inputs):
+        """
+        inputs: 그룹별 (네트워크 수, 입력 수) 배열 리스트
+        반환값: 그룹별 (네트워크 수, 출력 수) 배열 리스트
+        """
+        if self.dirty:
+            self.assemble()
+
+        values = self.values
+        for slots, x in zip(self.input_slots, inputs):
+            values[slots] = x
+
+        for layer in self.layers:
+            s = np.bincount(layer.edge_dst, weights=values[layer.edge_src] * layer.edge_weight,
+                            minlength=len(layer.nodes))
+            z = layer.bias + layer.response * s
+            for func, where in layer.activation:
+                values[layer.nodes[where]] = func(z[where])
+
+        return [values[slots] for slots in self.output_slots]
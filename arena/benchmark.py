@@ -0,0 +1,274 @@
+import argparse
+import concurrent.futures
+import contextlib
+import importlib.metadata
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --- 벤치마크 대상 (스크립트 경로, config 경로, 먹이/포식자 수 전역 변수) ---
+SCENARIOS = {
+    "1_test": ("204(input,hidden,output)/1_test.py", "204(input,hidden,output)/config-feedforward.txt", ()),
+    "4_multiEating": ("204(input,hidden,output)/4_multiEating5_diffColor.py",
+                      "204(input,hidden,output)/config-feedforward.txt", ("FOOD_COUNT",)),
+    "eat2+pre2": ("second/eat2+pre2.py", "second/config-feedforward.txt", ("NUM_FOODS", "NUM_PREDATORS")),
+    "angle": ("11_24/angle.py", "11_24/config-feedforward.txt", ("NUM_FOODS", "NUM_PREDATORS")),
+    "big_world": (None, "arena/config-feedforward.txt", ("food_count", "num_predators")),
+}
+POP_SIZES = (30, 100, 1000, 10000)
+ENTITY_SCALES = (1, 4)     # 먹이/포식자 수를 기본값의 몇 배로
+MODES = ("headless", "windowed")
+FRAMES = 300               # 한 세대에서 잴 최대 프레임
+
+
+class _EpisodeDone(Exception):
+    """기존 스크립트의 세대 루프를 FRAMES 프레임에서 끊을 때 씀"""
+
+
+def load_script(path):
+    spec = importlib.util.spec_from_file_location("bench_" + os.path.basename(path)[:-3].replace("+", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# --------------------------------
+# ▣ 시나리오 한 세대 (벤치마크와 tests/perf 가 같이 씀)
+# --------------------------------
+def scenario_config(scenario, overrides=None):
+    """시나리오 config 를 읽는다 (overrides 가 있으면 그 값만 바꾼 임시 파일로)"""
+    from arena.evolution import derive_config, load_config
+
+    path = os.path.join(ROOT, SCENARIOS[scenario][1])
+    if not overrides:
+        return load_config(path)
+    with tempfile.TemporaryDirectory() as tmp:
+        return load_config(derive_config(path, overrides, os.path.join(tmp, "config.txt")))
+
+
+@contextlib.contextmanager
+def uncapped_clock():
+    """이 안에서 만든 pygame.time.Clock 은 tick(FPS) 를 해도 기다리지 않는다"""
+    import pygame
+
+    clock_type = pygame.time.Clock
+
+    class Uncapped:
+        def __init__(self):
+            self.clock = clock_type()
+
+        def tick(self, framerate=0):
+            return self.clock.tick()
+
+        def __getattr__(self, name):
+            return getattr(self.clock, name)
+
+    pygame.time.Clock = Uncapped
+    try:
+        yield
+    finally:
+        pygame.time.Clock = clock_type
+
+
+def episode(scenario, config, genomes, frames, scale=1, screen=None, on_frame=None):
+    """
+    시나리오의 한 세대를 최대 frames 프레임까지 FPS 제한 없이 돌린다.
+    기존 스크립트는 파일을 그대로 새로 읽어 eval_genomes 를 부르고 (먹이/포식자 전역 변수만 scale 배),
+    big_world 는 play 를 부른다 (screen 이 없으면 pygame 을 import 하지 않음).
+    on_frame(프레임 번호, world 또는 None) 을 매 프레임 부른다.
+    반환: {"steps", "activations", "entities", "evaluate_seconds"}
+    """
+    import neat
+
+    from arena import big_world
+
+    script, config_path, entity_names = SCENARIOS[scenario]
+    counts = {"steps": 0, "activations": 0}
+    entities = {}
+
+    if script is None:
+        from arena import world as world_module
+        entities = {"food_count": world_module.FOOD_COUNT * scale, "num_predators": world_module.NUM_PREDATORS * scale}
+        alive = [len(genomes)]
+
+        def observer(frame, world):
+            counts["steps"] += 1
+            counts["activations"] += alive[0]
+            alive[0] = int(world.alive.sum())
+            if on_frame is not None:
+                on_frame(frame, world)
+
+        start = time.perf_counter()
+        try:
+            with uncapped_clock() if screen is not None else contextlib.nullcontext():
+                big_world.play(genomes, config, screen=screen, observer=observer, max_frames=frames, **entities)
+        finally:
+            evaluate = time.perf_counter() - start
+    else:
+        import pygame
+
+        module = load_script(os.path.join(ROOT, script))
+        for name in entity_names:
+            entities[name] = getattr(module, name) * scale
+            setattr(module, name, entities[name])
+
+        update, activate = pygame.display.update, neat.nn.FeedForwardNetwork.activate
+
+        def counted_update(*args):
+            update(*args)
+            counts["steps"] += 1
+            if on_frame is not None:
+                on_frame(counts["steps"], None)
+            if counts["steps"] >= frames:
+                raise _EpisodeDone()
+
+        def counted_activate(self, inputs):
+            counts["activations"] += 1
+            return activate(self, inputs)
+
+        pygame.display.update = counted_update
+        neat.nn.FeedForwardNetwork.activate = counted_activate
+        start = time.perf_counter()
+        try:
+            with uncapped_clock():
+                module.eval_genomes(genomes, config)
+        except _EpisodeDone:
+            pass
+        finally:
+            evaluate = time.perf_counter() - start
+            pygame.display.update, neat.nn.FeedForwardNetwork.activate = update, activate
+
+    return {"steps": counts["steps"], "activations": counts["activations"], "entities": entities,
+            "evaluate_seconds": evaluate}
+
+
+# --------------------------------
+# ▣ 측정 하나 (새 프로세스에서: 최대 RSS 를 측정마다 따로 재려고)
+# --------------------------------
+def measure(scenario, mode, pop_size, scale, frames):
+    if mode == "headless":
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    sys.path.insert(0, ROOT)
+
+    import neat
+
+    from arena import big_world
+    from arena.evolution import advance
+
+    config = scenario_config(scenario, {"pop_size": pop_size})
+    p = neat.Population(config)
+    genomes = list(p.population.items())
+
+    screen = None
+    if SCENARIOS[scenario][0] is None and mode == "windowed":
+        screen = big_world.open_window()
+    result = episode(scenario, config, genomes, frames, scale, screen)
+
+    for genome_id, genome in genomes:
+        if genome.fitness is None:
+            genome.fitness = 0.0
+    start = time.perf_counter()
+    advance(p)
+    reproduce = time.perf_counter() - start
+
+    evaluate = result["evaluate_seconds"]
+    result.update({
+        "steps_per_sec": result["steps"] / evaluate,
+        "activations_per_sec": result["activations"] / evaluate,
+        "reproduce_seconds": reproduce,
+        "generation_seconds": evaluate + reproduce,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+    })
+    return result
+
+
+# --------------------------------
+# ▣ 전체 스윕
+# --------------------------------
+def _meta():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip()
+    except OSError:
+        commit = None
+    import numpy
+    return {"commit": commit, "python": platform.python_version(), "platform": platform.platform(),
+            "neat": importlib.metadata.version("neat-python"), "numpy": numpy.__version__, "time": time.time()}
+
+
+def run(out_path, scenarios=tuple(SCENARIOS), modes=MODES, pop_sizes=POP_SIZES, scales=ENTITY_SCALES,
+        frames=FRAMES):
+    """모든 조합을 하나씩 새 프로세스에서 재고 out_path 에 JSON 으로 저장"""
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for scenario in scenarios:
+        for mode in modes:
+            for pop_size in pop_sizes:
+                # 먹이/포식자 수를 바꿀 수 없는 시나리오는 첫 배율만
+                for scale in scales if SCENARIOS[scenario][2] else scales[:1]:
+                    row = {"scenario": scenario, "mode": mode, "pop_size": pop_size, "entity_scale": scale,
+                           "frames": frames}
+                    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                        try:
+                            row.update(pool.submit(measure, scenario, mode, pop_size, scale, frames).result())
+                        except Exception as e:
+                            row["error"] = repr(e)
+                    results.append(row)
+                    if "error" in row:
+                        print("{scenario:<14} {mode:<9} pop {pop_size:>6} x{entity_scale}  error: {error}".format(**row))
+                    else:
+                        print("{scenario:<14} {mode:<9} pop {pop_size:>6} x{entity_scale}  "
+                              "{steps_per_sec:9.1f} steps/s {activations_per_sec:12.0f} act/s  "
+                              "gen {generation_seconds:7.2f}s  rss {peak_rss_mb:7.1f}MB".format(**row))
+
+    with open(out_path, "w") as f:
+        json.dump({"meta": _meta(), "results": results}, f, indent=1)
+    return results
+
+
+def compare(old_path, new_path):
+    """두 JSON 결과에서 같은 조합끼리 steps/sec, 세대 시간, 최대 RSS 비율 (new / old)"""
+    def load(path):
+        with open(path) as f:
+            rows = json.load(f)["results"]
+        return {(r["scenario"], r["mode"], r["pop_size"], r["entity_scale"]): r for r in rows if "error" not in r}
+
+    old, new = load(old_path), load(new_path)
+    for key in sorted(set(old) & set(new)):
+        o, n = old[key], new[key]
+        print("{0:<14} {1:<9} pop {2:>6} x{3}  steps/s x{4:.2f}  gen time x{5:.2f}  rss x{6:.2f}".format(
+            *key, n["steps_per_sec"] / o["steps_per_sec"], n["generation_seconds"] / o["generation_seconds"],
+            n["peak_rss_mb"] / o["peak_rss_mb"]))
+
+
+def _list(text, kind=str):
+    return tuple(kind(v) for v in text.split(","))
+
+
+# python -m arena.benchmark --out bench.json [--scenarios 1_test,big_world] [--pops 30,1000] [--modes headless]
+# python -m arena.benchmark --compare main.json branch.json
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default="benchmark.json")
+    parser.add_argument("--scenarios", type=_list, default=tuple(SCENARIOS))
+    parser.add_argument("--modes", type=_list, default=MODES)
+    parser.add_argument("--pops", type=lambda text: _list(text, int), default=POP_SIZES)
+    parser.add_argument("--scales", type=lambda text: _list(text, int), default=ENTITY_SCALES)
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        run(args.out, args.scenarios, args.modes, args.pops, args.scales, args.frames)
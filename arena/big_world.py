@@ -0,0 +1,216 @@
+import neat
+import os
+import numpy as np
+
+from .batchnet import BatchNetwork
+from .bounded_stats import BoundedStatisticsReporter, spill_file
+from .evolution import load_config
+from .compact_genome import load_compact_config
+from .profiling import timer
+from .collision import CREATURE_COLLISION, CROWDING_COST, resolve_collisions
+from .world import World
+
+# --- 1. 전역 설정 ---
+WIN_WIDTH = 800       # 화면(뷰포트) 너비, 월드는 world.WORLD_WIDTH
+WIN_HEIGHT = 600      # 화면(뷰포트) 높이
+GEN = 0
+FPS = 60
+MAX_GEN_TIME = 1800   # 한 세대 최대 시간 (약 30초)
+CATCH_REWARD = 100    # 진화하는 포식자가 생명체를 잡았을 때 보상
+COMPACT_GENOME = False  # True 면 배열 기반 CompactGenome 사용 (큰 population 용)
+
+
+# --------------------------------
+# ▣ 한 프레임 진행
+# --------------------------------
+def step(world, net, inputs, fitness, predator_fitness):
+    """
+    월드를 한 프레임 진행하고 보상을 fitness / predator_fitness 배열에 더한다.
+    보상 규칙은 second/eat2+pre2.py 와 같음 (생존 +0.1, 포식자 -20, 먹이 +100).
+    net 의 첫 그룹은 생명체, 포식자가 진화하는 경우("evolved") 두 번째 그룹은 포식자 신경망.
+    """
+    # 1. 감지 → 판단 → 이동
+    t = timer.mark()
+    alive = np.flatnonzero(world.alive)
+    # 포식자 이동은 두 경로 모두 "predators" 로 잰다 (스크립트 포식자는 감지 전, 진화 포식자는 판단 뒤)
+    if world.swarm.policy != "evolved":
+        world.move_predators()
+        t = timer.lap("predators", t)
+        inputs[alive] = world.sense(alive)
+        t = timer.lap("sense", t)
+        outputs, = net.activate([inputs])
+        t = timer.lap("think", t)
+    else:
+        # 생명체와 포식자가 동시에 감지하고 한 번의 배치 계산으로 판단
+        world.update_creature_grid()
+        inputs[alive] = world.sense(alive)
+        predator_inputs = world.sense_predators()
+        t = timer.lap("sense", t)
+        outputs, predator_outputs = net.activate([inputs, predator_inputs])
+        t = timer.lap("think", t)
+        world.swarm.steer(predator_outputs)
+        world.move_predators()
+        t = timer.lap("predators", t)
+    world.move_creatures(alive, outputs[alive])
+
+    # 2. 수명 감소 (붐비면 더 빨리), 생존 보너스, 포식자 충돌
+    world.life[alive] -= 1
+    if CREATURE_COLLISION:
+        world.life[alive] -= CROWDING_COST * resolve_collisions(world, alive)
+    fitness[alive] += 0.1
+    t = timer.lap("act", t)
+
+    caught, by = world.catches(alive)
+    world.life[caught] = 0
+    fitness[caught] -= 20
+    np.add.at(predator_fitness, by, CATCH_REWARD)
+
+    dead = alive[world.life[alive] <= 0]
+    world.alive[dead] = False
+    alive = np.flatnonzero(world.alive)
+
+    # 3. 먹이
+    eaters = world.eat(alive)
+    fitness[eaters] += 100
+    world.life[eaters] += 600
+    timer.lap("interact", t)
+
+
+# --------------------------------
+# ▣ 그리기 (pygame 은 화면이 필요할 때만 import: 창 없는 실행/작업 프로세스는 SDL 을 띄우지 않음)
+# --------------------------------
+def open_window():
+    """pygame 을 켜고 WIN_WIDTH x WIN_HEIGHT 창을 연다"""
+    import pygame
+
+    pygame.init()
+    return pygame.display.set_mode((WIN_WIDTH, WIN_HEIGHT))
+
+
+def draw(screen, viewport, world, font, text):
+    import pygame
+
+    screen.fill((0, 0, 0))
+    viewport.draw(screen, world)
+    screen.blit(font.render(text, 1, (255, 255, 255)), (10, 10))
+    pygame.display.update()
+
+
+def handle_events(viewport):
+    import pygame
+
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            quit()
+        viewport.handle_event(event)
+    viewport.handle_keys(pygame.key.get_pressed())
+
+
+# --------------------------------
+# ▣ 한 세대 시뮬레이션
+# --------------------------------
+def play(genomes, config, screen=None, predators=None, observer=None, max_frames=None, **world_options):
+    """
+    genome 들을 하나의 청크 월드에 풀어놓고 fitness 를 계산한다.
+    screen 이 None 이면 그리지 않고 최대 속도로 돈다.
+    observer 가 있으면 매 프레임 observer(프레임 번호, world) 를 부른다 (행동 기록 등).
+    max_frames 는 이번 세대 최대 프레임 (기본 MAX_GEN_TIME),
+    world_options 는 World 로 그대로 넘긴다 (food_count, num_predators 등).
+
+    predators 에 (포식자 genomes, 포식자 config) 를 주면 스크립트 포식자 대신
+    포식자 genome 하나당 포식자 한 마리가 신경망으로 움직이고, 잡을 때마다 CATCH_REWARD.
+    """
+    ge = []
+    for genome_id, genome in genomes:
+        genome.fitness = 0
+        ge.append(genome)
+
+    # 모든 genome 의 신경망을 하나로 묶어 한 번에 계산 (포식자 신경망도 같은 배치)
+    groups = [(genomes, config)]
+    if predators is not None:
+        predator_genomes, predator_config = predators
+        for genome_id, genome in predator_genomes:
+            genome.fitness = 0
+        groups.append((predator_genomes, predator_config))
+        world = World(len(ge), num_predators=len(predator_genomes), predator_policy="evolved", **world_options)
+    else:
+        world = World(len(ge), **world_options)
+
+    t = timer.mark()
+    net = BatchNetwork(groups)
+    timer.lap("build networks", t)
+    fitness = np.zeros(len(ge))
+    predator_fitness = np.zeros(world.swarm.n)
+    inputs = np.zeros((len(ge), config.genome_config.num_inputs))
+
+    if screen is not None:
+        import pygame
+
+        from .viewport import Viewport
+
+        clock = pygame.time.Clock()
+        font = pygame.font.SysFont("comicsans", 30)
+        viewport = Viewport(world.width, world.height, WIN_WIDTH, WIN_HEIGHT)
+
+    if max_frames is None:
+        max_frames = MAX_GEN_TIME
+
+    total_time = 0
+    while world.alive.any():
+        total_time += 1
+        if total_time > max_frames:
+            break
+
+        if screen is not None:
+            handle_events(viewport)
+
+        step(world, net, inputs, fitness, predator_fitness)
+        if observer is not None:
+            t = timer.mark()
+            observer(total_time, world)
+            timer.lap("observer", t)
+
+        # --- 그리기 ---
+        if screen is not None:
+            t = timer.mark()
+            remain_time = max(0, (max_frames - total_time) // FPS)
+            draw(screen, viewport, world, font,
+                 f"Gen: {GEN} | Alive: {int(world.alive.sum())} | Time Left: {remain_time}s")
+            t = timer.lap("render", t)
+            clock.tick(FPS)
+            timer.lap("fps wait", t)
+
+    for genome, f in zip(ge, fitness):
+        genome.fitness = float(f)
+    if predators is not None:
+        for (genome_id, genome), f in zip(predators[0], predator_fitness):
+            genome.fitness = float(f)
+
+
+# --------------------------------
+# ▣ genome 평가 함수
+# --------------------------------
+def eval_genomes(genomes, config):
+    global GEN
+    GEN += 1
+
+    play(genomes, config, open_window())
+
+
+def run(config_path):
+    config = load_compact_config(config_path) if COMPACT_GENOME else load_config(config_path)
+
+    p = neat.Population(config)
+    p.add_reporter(neat.StdOutReporter(True))
+    stats = BoundedStatisticsReporter(spill_path=spill_file("big_world"))
+    p.add_reporter(stats)
+
+    winner = p.run(eval_genomes, 50)
+
+
+# python -m arena.big_world
+if __name__ == "__main__":
+    local_dir = os.path.dirname(__file__)
+    config_path = os.path.join(local_dir, "config-feedforward.txt")
+    run(config_path)
@@ -0,0 +1,190 @@
+import copy
+import csv
+import json
+import math
+import os
+import tempfile
+import time
+from collections import deque
+
+import neat
+from neat.math_util import mean, median2, stdev
+
+# --- 기록 설정 ---
+HALL_OF_FAME = 10                         # 복사해 둘 최고 genome 수
+WINDOW = 100                              # 메모리에 남길 최근 세대 요약 수
+SPILL_NAME = "statistics-history"        # 오래된 세대 요약을 옮겨 쓸 파일 이름 앞부분 (spill_file)
+
+
+def spill_file(name=SPILL_NAME):
+    """
+    실행마다 다른 spill 파일 경로: 임시 폴더/<name>-<pid>-<시각 ns>.jsonl (파일은 처음 옮겨 쓸 때 생김).
+    같은 폴더에서 동시에 돌린 실행끼리 서로의 기록을 덮어쓰지 않는다.
+    """
+    return os.path.join(tempfile.gettempdir(), "{0}-{1}-{2}.jsonl".format(name, os.getpid(), time.time_ns()))
+
+
+# --------------------------------
+# ▣ 메모리가 늘지 않는 통계 reporter
+# --------------------------------
+class BoundedStatisticsReporter(neat.reporting.BaseReporter):
+    """
+    neat.StatisticsReporter 대신 쓰는 reporter.
+    - 세대마다 population 을 한 번 훑어 best / mean / stdev / median 과
+      종별 요약(크기, 평균, 최고)만 남긴다 (genome 별 fitness 목록은 남기지 않음)
+    - 최근 window 세대 요약만 메모리에, 더 오래된 것은 spill_path 에 한 줄씩 옮긴다
+      (없으면 spill_file() 로 실행마다 새 경로)
+    - genome 은 fitness 상위 hall_of_fame 개만 복사해 둔다 (key 마다 하나)
+    - estimated(genome key) 를 주면 (예: Surrogate.is_estimated) 예측만 한 genome 의 key 를 세대 요약에 남기고
+      hall of fame 에서는 뺀다 (get_estimated)
+
+    get_fitness_mean / get_fitness_stdev / get_fitness_median / best_genomes / best_genome /
+    get_species_sizes / get_species_fitness / save_* 는 StatisticsReporter 와 같은 모양으로 돌려준다.
+    most_fit_genomes 는 세대별 최고 genome 목록이 아니라 hall of fame (fitness 내림차순).
+    """
+
+    def __init__(self, hall_of_fame=HALL_OF_FAME, window=WINDOW, spill_path=None, estimated=None):
+        neat.reporting.BaseReporter.__init__(self)
+        self.hall_of_fame = hall_of_fame
+        self.estimated = estimated
+        self.spill_path = spill_path or spill_file()
+        self.recent = deque(maxlen=window)
+        self.spilled = 0
+        self.most_fit_genomes = []
+        self.best_fitness = None   # 실행 전체 최고 fitness
+
+    # --- 기록 ---
+    def post_evaluate(self, config, population, species, best_genome):
+        # 한 번 훑으면서 합, 제곱합 (분산), 종별 요약
+        n = total = squares = 0
+        fitnesses = []
+        summaries = {}
+        for sid, s in species.species.items():
+            values = [g.fitness for g in s.members.values()]
+            fitnesses.extend(values)
+            summaries[sid] = [len(values), mean(values), max(values)]
+            n += len(values)
+            total += sum(values)
+            squares += sum(v * v for v in values)
+        estimated = sorted(k for k in population if self.estimated(k)) if self.estimated else []
+
+        average = total / n if n else 0.0
+        self.keep({"best": best_genome.fitness if best_genome else None, "mean": average,
+                   "stdev": math.sqrt(max(0.0, squares / n - average * average)) if n else 0.0,
+                   "median": median2(fitnesses) if fitnesses else 0.0,
+                   "species": {str(sid): v for sid, v in summaries.items()},
+                   "estimated": estimated})
+
+        if best_genome is not None and (self.best_fitness is None or best_genome.fitness > self.best_fitness):
+            self.best_fitness = best_genome.fitness
+        skip = set(estimated)
+        self.update_hall_of_fame(g for k, g in population.items() if k not in skip)
+
+    def keep(self, row):
+        if len(self.recent) == self.recent.maxlen:
+            with open(self.spill_path, "a" if self.spilled else "w") as f:
+                f.write(json.dumps(self.recent[0]) + "\n")
+            self.spilled += 1
+        self.recent.append(row)
+
+    def update_hall_of_fame(self, genomes):
+        floor = self.most_fit_genomes[-1].fitness if len(self.most_fit_genomes) >= self.hall_of_fame else None
+        changed = False
+        for g in genomes:
+            if g.fitness is None or floor is not None and g.fitness <= floor:
+                continue
+            for i, old in enumerate(self.most_fit_genomes):
+                if old.key == g.key:
+                    if g.fitness > old.fitness:
+                        self.most_fit_genomes[i] = copy.deepcopy(g)
+                        changed = True
+                    break
+            else:
+                self.most_fit_genomes.append(copy.deepcopy(g))
+                changed = True
+        if changed:
+            self.most_fit_genomes.sort(key=lambda g: g.fitness, reverse=True)
+            del self.most_fit_genomes[self.hall_of_fame:]
+
+    # --- 세대 요약 읽기 (디스크 + 메모리) ---
+    def history(self):
+        """세대 순서대로 요약 dict (옮겨 쓴 것부터)"""
+        if self.spilled:
+            with open(self.spill_path) as f:
+                for line in f:
+                    yield json.loads(line)
+        yield from self.recent
+
+    def get_fitness_stat(self, f):
+        names = {mean: "mean", stdev: "stdev", median2: "median"}
+        if f not in names:
+            raise ValueError("Only mean, stdev and median2 are kept per generation")
+        return [row[names[f]] for row in self.history()]
+
+    def get_fitness_mean(self):
+        return [row["mean"] for row in self.history()]
+
+    def get_fitness_stdev(self):
+        return [row["stdev"] for row in self.history()]
+
+    def get_fitness_median(self):
+        return [row["median"] for row in self.history()]
+
+    def get_fitness_best(self):
+        return [row["best"] for row in self.history()]
+
+    def get_estimated(self):
+        """세대별 예측만 한 (시뮬레이션하지 않은) genome key 목록"""
+        return [row.get("estimated", []) for row in self.history()]
+
+    def best_unique_genomes(self, n):
+        return self.most_fit_genomes[:n]
+
+    def best_genomes(self, n):
+        return self.most_fit_genomes[:n]
+
+    def best_genome(self):
+        return self.most_fit_genomes[0]
+
+    def _max_species(self):
+        return max((int(sid) for row in self.history() for sid in row["species"]), default=0)
+
+    def get_species_sizes(self):
+        max_species = self._max_species()
+        return [[row["species"].get(str(sid), [0])[0] for sid in range(1, max_species + 1)]
+                for row in self.history()]
+
+    def get_species_fitness(self, null_value=''):
+        max_species = self._max_species()
+        return [[row["species"][str(sid)][1] if str(sid) in row["species"] else null_value
+                 for sid in range(1, max_species + 1)] for row in self.history()]
+
+    # --- StatisticsReporter 와 같은 파일 저장 ---
+    def save(self):
+        self.save_genome_fitness()
+        self.save_species_count()
+        self.save_species_fitness()
+
+    def save_genome_fitness(self, delimiter=' ', filename='fitness_history.csv'):
+        with open(filename, 'w') as f:
+            w = csv.writer(f, delimiter=delimiter)
+            for row in self.history():
+                w.writerow([row["best"], row["mean"]])
+
+    def save_species_count(self, delimiter=' ', filename='speciation.csv'):
+        with open(filename, 'w') as f:
+            w = csv.writer(f, delimiter=delimiter)
+            for s in self.get_species_sizes():
+                w.writerow(s)
+
+    def save_species_fitness(self, delimiter=' ', null_value='NA', filename='species_fitness.csv'):
+        with open(filename, 'w') as f:
+            w = csv.writer(f, delimiter=delimiter)
+            for s in self.get_species_fitness(null_value):
+                w.writerow(s)
+
+    def close(self):
+        """옮겨 쓴 파일을 지운다 (실행이 끝나고 기록이 더 필요 없을 때)"""
+        if self.spilled and os.path.exists(self.spill_path):
+            os.remove(self.spill_path)
+        self.spilled = 0
@@ -0,0 +1,151 @@
+import argparse
+import os
+import time
+
+import neat
+
+from . import big_world
+from .bounded_stats import BoundedStatisticsReporter, spill_file
+from .evolution import advance, load_config
+
+# --- 시간 예산 설정 ---
+RUN_BUDGET = 30 * 60       # 실행 전체 예산 (초)
+GENERATION_BUDGET = 60     # 한 세대 예산 (초)
+MIN_FRAMES = 200           # 세대 최대 프레임을 이 밑으로는 줄이지 않음
+MIN_POP = 30               # population 을 이 밑으로는 줄이지 않음
+GROW_MARGIN = 0.5          # 예상 시간이 허용 시간의 이 비율 밑이면 프레임/population 을 다시 늘림
+CHECKPOINT_PREFIX = "budget-checkpoint-"
+
+
+class _Phases:
+    """단계 이름 → 누적 시간"""
+
+    def __init__(self):
+        self.seconds = {}
+
+    def add(self, name, seconds):
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def report(self, budget):
+        total = sum(self.seconds.values())
+        print("Budget: {0:.1f}s used of {1:.1f}s".format(total, budget))
+        for name, seconds in sorted(self.seconds.items(), key=lambda item: -item[1]):
+            print("  {0:<20} {1:8.1f}s  {2:5.1%}".format(name, seconds, seconds / budget))
+
+
+# --------------------------------
+# ▣ 시간 예산 안에서 세대 돌리기
+# --------------------------------
+class BudgetScheduler:
+    """
+    p.run(eval_genomes, 50) 대신 시간 예산으로 진화시킨다.
+    세대마다 지난 세대 측정값(생명체 1마리 1프레임 평가 시간, genome 1개당 번식/종 분류 시간)으로 다음 세대 시간을 예상하고
+    min(세대 예산, 남은 실행 예산) 안에 들어오도록
+    1. 세대 최대 프레임을 줄이고 (MIN_FRAMES 까지)
+    2. 그래도 넘으면 다음 세대 population 크기를 줄인다 (MIN_POP 까지).
+    여유가 생기면 원래 값(big_world.MAX_GEN_TIME, config 의 pop_size)까지 다시 늘린다.
+    가장 작은 설정으로도 남은 예산에 한 세대가 안 들어가면 checkpoint 를 저장하고 멈춘다.
+    """
+
+    def __init__(self, run_budget=RUN_BUDGET, generation_budget=GENERATION_BUDGET,
+                 checkpoint_prefix=CHECKPOINT_PREFIX):
+        self.run_budget = run_budget
+        self.generation_budget = generation_budget
+        self.checkpoint_prefix = checkpoint_prefix
+        self.phases = _Phases()
+        self.history = []   # 세대별 (프레임, population 크기, 걸린 시간)
+
+    def plan(self, allowed, remaining, frame_cost, overhead, n):
+        """
+        지금 population(n 마리)의 이번 세대 최대 프레임과 다음 세대 population 크기.
+        가장 짧은 프레임으로도 남은 실행 예산에 안 들어가면 None.
+        """
+        def cost(frames, pop):
+            return (frame_cost * frames + overhead) * pop
+
+        if cost(MIN_FRAMES, n) > remaining:
+            return None
+        frames = int((allowed / n - overhead) / frame_cost)
+        frames = max(MIN_FRAMES, min(big_world.MAX_GEN_TIME, frames))
+
+        pop = n
+        if cost(frames, n) > allowed:
+            pop = max(MIN_POP, int(allowed / (frame_cost * frames + overhead)))
+        elif frames == big_world.MAX_GEN_TIME and cost(frames, n) < GROW_MARGIN * allowed:
+            pop = min(self.full_pop, int(n * 1.5) + 1)
+        return frames, pop
+
+    def run(self, config, p=None):
+        p = p or neat.Population(config)
+        self.full_pop = config.pop_size
+        start = time.perf_counter()
+        frames = MIN_FRAMES   # 첫 세대는 짧게 돌려서 시간을 잰다
+        frame_cost = overhead = None
+        stop = "budget"
+
+        while True:
+            elapsed = time.perf_counter() - start
+            remaining = self.run_budget - elapsed
+            if frame_cost is not None:
+                plan = self.plan(min(self.generation_budget, remaining), remaining,
+                                 frame_cost, overhead, len(p.population))
+                if plan is None:
+                    break
+                frames, config.pop_size = plan
+            elif remaining <= 0:
+                break
+
+            t0 = time.perf_counter()
+            p.reporters.start_generation(p.generation)
+            big_world.GEN += 1
+            n = len(p.population)
+            simulated = [1]
+            big_world.play(list(p.population.items()), config, max_frames=frames,
+                           observer=lambda frame, world: simulated.__setitem__(0, frame))
+            t1 = time.perf_counter()
+            done = advance(p)
+            t2 = time.perf_counter()
+
+            self.phases.add("evaluate", t1 - t0)
+            self.phases.add("reproduce+speciate", t2 - t1)
+            frame_cost = (t1 - t0) / (max(1, simulated[0]) * n)
+            overhead = (t2 - t1) / n
+            self.history.append((frames, n, t2 - t0))
+            print("Budget: generation {0} took {1:.1f}s with {2} frames | next pop {3} | {4:.0f}s left".format(
+                p.generation - 1, t2 - t0, frames, config.pop_size, self.run_budget - (t2 - start)))
+            if done:
+                stop = "solution"
+                break
+
+        if stop == "budget":
+            t0 = time.perf_counter()
+            neat.Checkpointer(filename_prefix=self.checkpoint_prefix).save_checkpoint(
+                config, p.population, p.species, p.generation)
+            self.phases.add("checkpoint", time.perf_counter() - t0)
+            print("Budget: stopped at generation {0}, checkpoint {1}{0}".format(p.generation, self.checkpoint_prefix))
+
+        self.phases.add("other", max(0.0, time.perf_counter() - start - sum(self.phases.seconds.values())))
+        self.phases.report(self.run_budget)
+        return p.best_genome
+
+
+def run(config_path, run_budget=RUN_BUDGET, generation_budget=GENERATION_BUDGET):
+    config = load_config(config_path)
+
+    p = neat.Population(config)
+    p.add_reporter(neat.StdOutReporter(True))
+    stats = BoundedStatisticsReporter(spill_path=spill_file("budget"))
+    p.add_reporter(stats)
+
+    return BudgetScheduler(run_budget, generation_budget).run(config, p)
+
+
+# python -m arena.budget --minutes 30 --generation-seconds 60
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--minutes", type=float, default=RUN_BUDGET / 60)
+    parser.add_argument("--generation-seconds", type=float, default=GENERATION_BUDGET)
+    args = parser.parse_args()
+
+    local_dir = os.path.dirname(__file__)
+    run(os.path.join(local_dir, "config-feedforward.txt"), args.minutes * 60, args.generation_seconds)
@@ -0,0 +1,126 @@
+import argparse
+import os
+import random
+
+import neat
+
+from . import big_world
+from .benchmark import ROOT
+from .bounded_stats import BoundedStatisticsReporter, spill_file
+from .evolution import load_config
+from .metrics import MetricsSink
+from .replay import ReplayLog, replay
+from .scenarios import SCENARIOS
+from .warm_start import load_champions
+
+# --- 실행 설정 ---
+MODES = ("headless", "windowed", "replay")
+GENERATIONS = 50
+
+
+# --------------------------------
+# ▣ 시나리오별 평가 함수
+# --------------------------------
+def eval_function(scenario, mode):
+    """
+    headless: pygame 없이 최대 속도로 평가
+    windowed: 창을 열고 FPS 에 맞춰 그리면서 평가
+    big_world 외의 시나리오는 arena.scenarios 의 선언 (기존 스크립트 규칙) 으로 돈다.
+    """
+    if scenario == "big_world":
+        if mode == "windowed":
+            return big_world.eval_genomes
+
+        def eval_headless(genomes, config):
+            big_world.GEN += 1
+            big_world.play(genomes, config)
+        return eval_headless
+
+    if mode == "windowed":
+        def eval_windowed(genomes, config):
+            SCENARIOS[scenario].eval_genomes(genomes, config, big_world.open_window())
+        return eval_windowed
+    return SCENARIOS[scenario].eval_genomes
+
+
+def config_path_for(scenario):
+    if scenario == "big_world":
+        return os.path.join(ROOT, "arena", "config-feedforward.txt")
+    return os.path.join(ROOT, SCENARIOS[scenario].config)
+
+
+def run(scenario="big_world", config_path=None, generations=GENERATIONS, seed=None, mode="headless",
+        champions_path=None, log_path=None, generation=None, verify=False):
+    """
+    scenario 를 mode 로 실행한다. config_path 가 없으면 시나리오 폴더의 config,
+    seed 가 있으면 random.seed(seed) (월드 / neat 난수가 모두 여기서 나옴).
+    log_path 가 있으면 세대마다 시드 + genome 스냅샷을 기록한다 (replay.ReplayLog).
+    replay 는 log_path 의 generation 세대를 다시 시뮬레이션하거나 (verify 면 fitness 확인),
+    champions_path (warm_start.save_champions 파일) 의 genome 들을 창에서 한 세대 돌려 본다.
+    pygame 은 windowed / replay 일 때만 import 된다.
+    """
+    if mode not in MODES:
+        raise ValueError("Unknown mode {0!r}, expected one of {1}".format(mode, MODES))
+    if mode == "replay" and log_path and generation is not None:
+        return replay(log_path, generation, not verify, verify, config_path)
+
+    if log_path and seed is None:
+        seed = random.getrandbits(63)
+    if seed is not None:
+        random.seed(seed)
+    config_path = os.path.abspath(config_path or config_path_for(scenario))
+    config = load_config(config_path)
+
+    if mode == "replay":
+        if not champions_path:
+            raise ValueError("replay mode needs a champions file, or a log and a generation")
+        champions, num_inputs, num_outputs = load_champions(champions_path)
+        gc = config.genome_config
+        if (num_inputs, num_outputs) != (gc.num_inputs, gc.num_outputs):
+            raise ValueError("Champions have {0} inputs / {1} outputs, config expects {2} / {3}".format(
+                num_inputs, num_outputs, gc.num_inputs, gc.num_outputs))
+        genomes = [(genome.key, genome) for genome in champions]
+        eval_function(scenario, "windowed")(genomes, config)
+        for genome_id, genome in genomes:
+            print("Replay: genome {0} fitness {1:.1f}".format(genome_id, genome.fitness))
+        return genomes
+
+    p = neat.Population(config)
+    p.add_reporter(neat.StdOutReporter(True))
+    stats = BoundedStatisticsReporter(spill_path=spill_file(scenario))
+    p.add_reporter(stats)
+    if not log_path:
+        return p.run(eval_function(scenario, mode), generations)
+
+    sink = MetricsSink(log_path)
+    log = ReplayLog(sink, seed, scenario, config_path)
+    p.add_reporter(log)
+    print("Replay log: {0} (run seed {1})".format(log_path, seed))
+    try:
+        return p.run(log.wrap(eval_function(scenario, mode)), generations)
+    finally:
+        sink.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m arena")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS) + ["big_world"], default="big_world")
+    parser.add_argument("--config", help="기본: 시나리오 폴더의 config-feedforward.txt")
+    parser.add_argument("--generations", type=int, default=GENERATIONS)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--mode", choices=MODES, default="headless")
+    parser.add_argument("--champions", help="replay 할 genome 파일 (warm_start.save_champions)")
+    parser.add_argument("--log", help="세대별 시드 + genome 스냅샷 기록 파일 (replay 모드에서는 읽음)")
+    parser.add_argument("--generation", type=int, help="replay 할 세대 (--log 와 같이)")
+    parser.add_argument("--verify", action="store_true", help="replay 를 창 없이 돌리고 fitness 가 기록과 같은지 확인")
+    args = parser.parse_args(argv)
+
+    result = run(args.scenario, args.config, args.generations, args.seed, args.mode, args.champions,
+                 args.log, args.generation, args.verify)
+    if args.verify and result is False:
+        raise SystemExit(1)
+
+
+# python -m arena.cli --scenario eat2+pre2 --mode headless --generations 20 --seed 1  (python -m arena 도 같음)
+if __name__ == "__main__":
+    main()
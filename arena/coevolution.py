@@ -0,0 +1,90 @@
+import multiprocessing
+import os
+
+import neat
+
+from . import big_world
+from .bounded_stats import BoundedStatisticsReporter, spill_file
+from .evolution import advance, load_config
+
+# --- 공진화 설정 ---
+HEADLESS = False      # True 면 창 없이 최대 속도로 평가
+
+
+# --------------------------------
+# ▣ 포식자 population 프로세스
+# --------------------------------
+def predator_process(conn, config_path):
+    """
+    포식자 population 을 들고 있는 자식 프로세스.
+    fitness 를 받으면 한 세대(번식, 종 분류)를 진행하고 새 genome 들을 돌려준다.
+    그동안 부모 프로세스는 먹이 생명체 population 의 번식을 동시에 진행한다.
+    """
+    p = neat.Population(load_config(config_path))
+    conn.send((p.population, None))
+
+    while True:
+        fitnesses = conn.recv()
+        if fitnesses is None:
+            break
+
+        for genome_id, fitness in fitnesses.items():
+            p.population[genome_id].fitness = fitness
+        best = max(fitnesses.values())
+        advance(p)
+        conn.send((p.population, (best, len(p.species.species))))
+
+    conn.close()
+
+
+# --------------------------------
+# ▣ 공진화 실행
+# --------------------------------
+def run(prey_config_path, predator_config_path, generations=50):
+    prey_config = load_config(prey_config_path)
+    predator_config = load_config(predator_config_path)
+
+    p = neat.Population(prey_config)
+    p.add_reporter(neat.StdOutReporter(True))
+    stats = BoundedStatisticsReporter(spill_path=spill_file("coevolution"))
+    p.add_reporter(stats)
+
+    conn, child_conn = multiprocessing.Pipe()
+    worker = multiprocessing.Process(target=predator_process, args=(child_conn, predator_config_path),
+                                     daemon=True)
+    worker.start()
+    predators, _ = conn.recv()
+
+    screen = None
+    if not HEADLESS:
+        screen = big_world.open_window()
+
+    try:
+        for _ in range(generations):
+            p.reporters.start_generation(p.generation)
+            big_world.GEN = p.generation + 1
+
+            # 같은 월드, 같은 배치 계산으로 두 population 을 함께 평가
+            big_world.play(list(p.population.items()), prey_config, screen,
+                           predators=(list(predators.items()), predator_config))
+
+            # 포식자 번식은 자식 프로세스에서, 먹이 생명체 번식은 여기서 동시에 진행
+            conn.send({genome_id: g.fitness for genome_id, g in predators.items()})
+            done = advance(p)
+            predators, (best, species) = conn.recv()
+            print("Predators: best fitness {0:.1f}, {1} species".format(best, species))
+
+            if done:
+                break
+    finally:
+        conn.send(None)
+        worker.join()
+
+    return p.best_genome
+
+
+# python -m arena.coevolution
+if __name__ == "__main__":
+    local_dir = os.path.dirname(__file__)
+    run(os.path.join(local_dir, "config-feedforward.txt"),
+        os.path.join(local_dir, "config-predator.txt"))
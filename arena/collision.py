@@ -0,0 +1,69 @@
+import numpy as np
+
+from .world import CREATURE_SIZE
+
+# --- 생명체끼리 충돌 설정 ---
+CREATURE_COLLISION = True   # 생명체끼리 겹치지 않게 밀어냄
+CROWDING_RADIUS = 40        # 이 거리(중심 기준) 안의 다른 생명체를 "붐빔"으로 셈, CELL_SIZE 이하
+CROWDING_COST = 0.2         # 붐비는 이웃 한 마리당 프레임마다 추가로 줄어드는 수명
+
+
+# --------------------------------
+# ▣ 브로드페이즈: 이웃 셀 안의 생명체 쌍만
+# --------------------------------
+def nearby_pairs(world, idx):
+    """
+    살아있는 생명체(idx) 중 같은/이웃 셀에 있는 쌍 (i < j) 을 찾는다.
+    O(N^2) 전체 비교 대신 셀 그리드로 후보를 줄이고, 나머지는 배열로 한 번에 계산.
+    반환값: (i, j, dx, dy)  dx, dy 는 j - i 위치 차이
+    """
+    world.update_creature_grid()
+    q, j = world.creature_grid.neighbours(world.x[idx] + world.creature_half,
+                                          world.y[idx] + world.creature_half)
+    i = idx[q]
+    keep = i < j
+    i, j = i[keep], j[keep]
+    return i, j, world.x[j] - world.x[i], world.y[j] - world.y[i]
+
+
+# --------------------------------
+# ▣ 충돌 해결 + 붐빔 계산
+# --------------------------------
+def resolve_collisions(world, idx):
+    """
+    겹친 생명체 쌍을 덜 겹친 축 방향으로 반씩 밀어낸다 (몸으로 막기).
+    반환값: idx 순서대로 CROWDING_RADIUS 안에 있는 이웃 수
+    """
+    i, j, dx, dy = nearby_pairs(world, idx)
+
+    crowd = np.zeros(len(world.x))
+    near = dx * dx + dy * dy < CROWDING_RADIUS * CROWDING_RADIUS
+    np.add.at(crowd, i[near], 1)
+    np.add.at(crowd, j[near], 1)
+
+    # 사각형(AABB) 겹침 깊이
+    pen_x = CREATURE_SIZE - np.abs(dx)
+    pen_y = CREATURE_SIZE - np.abs(dy)
+    hit = (pen_x > 0) & (pen_y > 0)
+    if hit.any():
+        i, j, dx, dy, pen_x, pen_y = i[hit], j[hit], dx[hit], dy[hit], pen_x[hit], pen_y[hit]
+
+        # 완전히 같은 위치면 j 를 +방향으로
+        sign_x = np.where(dx >= 0, 1.0, -1.0)
+        sign_y = np.where(dy >= 0, 1.0, -1.0)
+        along_x = pen_x < pen_y
+
+        push_x = np.where(along_x, pen_x * 0.5 * sign_x, 0.0)
+        push_y = np.where(along_x, 0.0, pen_y * 0.5 * sign_y)
+
+        shift_x = np.zeros(len(world.x))
+        shift_y = np.zeros(len(world.y))
+        np.add.at(shift_x, i, -push_x)
+        np.add.at(shift_x, j, push_x)
+        np.add.at(shift_y, i, -push_y)
+        np.add.at(shift_y, j, push_y)
+
+        world.x[idx] = np.clip(world.x[idx] + shift_x[idx], 0, world.width - CREATURE_SIZE)
+        world.y[idx] = np.clip(world.y[idx] + shift_y[idx], 0, world.height - CREATURE_SIZE)
+
+    return crowd[idx]
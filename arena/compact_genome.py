@@ -0,0 +1,485 @@
+import collections
+import gc
+import random
+import sys
+import time
+import weakref
+
+import neat
+import numpy as np
+from neat.genome import DefaultGenome
+from neat.reproduction import DefaultReproduction
+from neat.graphs import creates_cycle
+
+from .speciation import connection_code
+
+# 노드 / 연결 유전자를 읽기 전용으로 보여줄 때 쓰는 레코드
+# (neat.nn.FeedForwardNetwork, BatchNetwork, CachedSpeciesSet 등이 읽는 속성만)
+NodeRecord = collections.namedtuple("NodeRecord", "key bias response activation aggregation")
+ConnectionRecord = collections.namedtuple("ConnectionRecord", "key weight enabled")
+
+_SHIFT = 2 ** 31
+_OFFSET = 2 ** 30
+
+
+def connection_key(code):
+    """speciation.connection_code 의 반대: 정수 → (in, out)"""
+    code = int(code)
+    return code // _SHIFT - _OFFSET, code % _SHIFT - _OFFSET
+
+
+# --------------------------------
+# ▣ 속성 초기화 / 돌연변이 (neat.attributes 와 같은 규칙을 배열로)
+# --------------------------------
+class _FloatParams:
+    """config 에서 float 속성(weight, bias, response) 설정을 한 번만 읽어 둠"""
+
+    def __init__(self, config, name):
+        self.mean = getattr(config, name + "_init_mean")
+        self.stdev = getattr(config, name + "_init_stdev")
+        self.init_type = getattr(config, name + "_init_type").lower()
+        self.low = getattr(config, name + "_min_value")
+        self.high = getattr(config, name + "_max_value")
+        self.mutate_rate = getattr(config, name + "_mutate_rate")
+        self.replace_rate = getattr(config, name + "_replace_rate")
+        self.power = getattr(config, name + "_mutate_power")
+        if not ("gauss" in self.init_type or "normal" in self.init_type or "uniform" in self.init_type):
+            raise RuntimeError("Unknown init_type {0!r} for {1}_init_type".format(self.init_type, name))
+
+    def init(self, rng, n):
+        if "uniform" in self.init_type:
+            return rng.uniform(max(self.low, self.mean - 2 * self.stdev),
+                               min(self.high, self.mean + 2 * self.stdev), n)
+        return np.minimum(np.maximum(rng.normal(self.mean, self.stdev, n), self.low), self.high)
+
+    def init_one(self):
+        """구조 돌연변이로 새 유전자 하나를 만들 때 (neat 처럼 파이썬 random)"""
+        if "uniform" in self.init_type:
+            return random.uniform(max(self.low, self.mean - 2 * self.stdev),
+                                  min(self.high, self.mean + 2 * self.stdev))
+        return max(min(random.gauss(self.mean, self.stdev), self.high), self.low)
+
+    def mutate(self, values, rng):
+        """모든 유전자를 한 번에: mutate_rate 확률로 가우스 섭동, replace_rate 확률로 새 값"""
+        r = rng.random(len(values))
+        perturb = r < self.mutate_rate
+        values += perturb * rng.normal(0.0, self.power, len(values))
+        replace = ~perturb & (r < self.mutate_rate + self.replace_rate)
+        if replace.any():
+            values[replace] = self.init(rng, int(replace.sum()))
+        np.minimum(np.maximum(values, self.low, out=values), self.high, out=values)
+
+
+class _Params:
+    def __init__(self, config):
+        self.weight = _FloatParams(config, "weight")
+        self.bias = _FloatParams(config, "bias")
+        self.response = _FloatParams(config, "response")
+        self.enabled_rate = config.enabled_mutate_rate
+        self.to_false = config.enabled_rate_to_false_add
+        self.to_true = config.enabled_rate_to_true_add
+        self.strings = [(name, getattr(config, name + "_default"), getattr(config, name + "_options"),
+                         getattr(config, name + "_mutate_rate")) for name in ("activation", "aggregation")]
+
+
+# genome_config → _Params. config 가 사라지면 항목도 같이 사라진다
+# (id(config) 로 찾으면 load_config 가 매번 새로 만드는 config 가 지워진 config 의 id 를 다시 받아 엉뚱한 값을 씀)
+_params = weakref.WeakKeyDictionary()
+
+
+def params(config):
+    p = _params.get(config)
+    if p is None:
+        p = _params[config] = _Params(config)
+    return p
+
+
+def random_options(rng, options, n):
+    return np.array([options[i] for i in rng.integers(len(options), size=n)], dtype=object)
+
+
+def init_string(default, options):
+    if default.lower() in ("none", "random"):
+        return random.choice(options)
+    return default
+
+
+def coin_flips(n):
+    """파이썬 random 으로 n 개의 반반 확률 bool (교차에서 어느 부모 값을 받을지)"""
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    bits = random.getrandbits(8 * ((n + 7) // 8))
+    return np.unpackbits(np.frombuffer(bits.to_bytes((n + 7) // 8, "little"), dtype=np.uint8))[:n].astype(bool)
+
+
+def _insert(values, i, value):
+    return np.concatenate((values[:i], np.array([value], dtype=values.dtype), values[i:]))
+
+
+# --------------------------------
+# ▣ 배열로 유전자를 저장하는 genome
+# --------------------------------
+class CompactGenome:
+    """
+    neat.DefaultGenome 대신 config 의 genome 클래스로 쓸 수 있는 genome.
+    유전자 객체(와 각자의 __dict__) 대신 key 순으로 정렬된 numpy 배열에 저장한다.
+
+    - 노드: node_keys, bias, response, activation, aggregation (활성화/집계 함수 이름은 object 배열)
+    - 연결: conn_keys ((in, out) 을 speciation.connection_code 로 바꾼 정수), weight, enabled
+    - weight/bias/response/enabled 돌연변이와 교차는 유전자 전체를 배열 연산 한 번으로
+    - nodes / connections 는 읽기 전용 dict (NodeRecord / ConnectionRecord) 로 보여준다
+      (읽을 때마다 배열 전체로 새로 만들므로 반복문 안에서는 한 번 읽어 둔 dict 를 쓸 것)
+
+    config 파일의 [DefaultGenome] 섹션을 그대로 쓴다 (evolution.load_config(..., genome_type=CompactGenome)).
+    """
+
+    __slots__ = ("key", "fitness", "node_keys", "bias", "response", "activation", "aggregation",
+                 "conn_keys", "weight", "enabled")
+
+    def __init__(self, key):
+        self.key = key
+        self.fitness = None
+        self.node_keys = np.zeros(0, dtype=np.int64)
+        self.bias = np.zeros(0)
+        self.response = np.zeros(0)
+        self.activation = np.zeros(0, dtype=object)
+        self.aggregation = np.zeros(0, dtype=object)
+        self.conn_keys = np.zeros(0, dtype=np.int64)
+        self.weight = np.zeros(0)
+        self.enabled = np.zeros(0, dtype=bool)
+
+    @classmethod
+    def parse_config(cls, param_dict):
+        return DefaultGenome.parse_config(param_dict)
+
+    @classmethod
+    def write_config(cls, f, config):
+        config.save(f)
+
+    @classmethod
+    def from_genome(cls, genome):
+        """DefaultGenome (또는 nodes/connections 를 가진 genome) 을 배열 형태로"""
+        g = cls(genome.key)
+        g.fitness = genome.fitness
+        genome_nodes, genome_connections = genome.nodes, genome.connections
+        node_keys = sorted(genome_nodes)
+        nodes = [genome_nodes[k] for k in node_keys]
+        g.node_keys = np.array(node_keys, dtype=np.int64)
+        g.bias = np.array([n.bias for n in nodes], dtype=float)
+        g.response = np.array([n.response for n in nodes], dtype=float)
+        g.activation = np.array([n.activation for n in nodes], dtype=object)
+        g.aggregation = np.array([n.aggregation for n in nodes], dtype=object)
+
+        conn_keys = sorted(genome_connections)
+        conns = [genome_connections[k] for k in conn_keys]
+        g.conn_keys = np.array([connection_code(i, o) for i, o in conn_keys], dtype=np.int64)
+        g.weight = np.array([c.weight for c in conns], dtype=float)
+        g.enabled = np.array([c.enabled for c in conns], dtype=bool)
+        return g
+
+    # --- neat 코드가 읽는 모양 ---
+    @property
+    def nodes(self):
+        return {k: NodeRecord(k, b, r, a, g) for k, b, r, a, g in
+                zip(self.node_keys.tolist(), self.bias.tolist(), self.response.tolist(),
+                    self.activation, self.aggregation)}
+
+    @property
+    def connections(self):
+        return {key: ConnectionRecord(key, w, e) for key, w, e in
+                zip(map(connection_key, self.conn_keys.tolist()), self.weight.tolist(),
+                    self.enabled.tolist())}
+
+    def size(self):
+        return len(self.node_keys), int(self.enabled.sum())
+
+    def __str__(self):
+        s = "Key: {0}\nFitness: {1}\nNodes:".format(self.key, self.fitness)
+        for k, ng in self.nodes.items():
+            s += "\n\t{0} {1!s}".format(k, ng)
+        s += "\nConnections:"
+        for cg in self.connections.values():
+            s += "\n\t" + str(cg)
+        return s
+
+    # --- 새 genome / 교차 ---
+    def configure_new(self, config):
+        # 초기 연결 방식(full, full_nodirect, partial, fs_neat...)은 neat 구현을 그대로 쓰고 배열로 옮김
+        g = DefaultGenome(self.key)
+        g.configure_new(config)
+        self._copy_from(CompactGenome.from_genome(g))
+
+    def configure_crossover(self, genome1, genome2, config):
+        assert isinstance(genome1.fitness, (int, float))
+        assert isinstance(genome2.fitness, (int, float))
+        if genome1.fitness > genome2.fitness:
+            parent1, parent2 = genome1, genome2
+        else:
+            parent1, parent2 = genome2, genome1
+
+        # 유전자 구성은 더 나은 부모, 같은 유전자는 속성마다 반반 확률로 어느 부모 값을 받을지
+        self._copy_from(parent1)
+        self._inherit(parent2, "conn_keys", ("weight", "enabled"))
+        self._inherit(parent2, "node_keys", ("bias", "response", "activation", "aggregation"))
+
+    def _inherit(self, other, keys, names):
+        mine, theirs = getattr(self, keys), getattr(other, keys)
+        if not len(mine) or not len(theirs):
+            return
+        pos = np.minimum(np.searchsorted(theirs, mine), len(theirs) - 1)
+        homologous = theirs[pos] == mine
+        for name in names:
+            take = homologous & coin_flips(len(mine))
+            values = getattr(self, name)
+            values[take] = getattr(other, name)[pos[take]]
+
+    def _copy_from(self, other):
+        for name in self.__slots__[2:]:
+            setattr(self, name, getattr(other, name).copy())
+
+    # --- 돌연변이 ---
+    # 번식 중에 CompactReproduction 이 리스트를 넣어 두면, 속성 돌연변이는 여기 모아서 세대 단위로 한 번에
+    pending = None
+
+    def mutate(self, config):
+        if config.single_structural_mutation:
+            div = max(1, (config.node_add_prob + config.node_delete_prob +
+                          config.conn_add_prob + config.conn_delete_prob))
+            r = random.random()
+            if r < (config.node_add_prob / div):
+                self.mutate_add_node(config)
+            elif r < ((config.node_add_prob + config.node_delete_prob) / div):
+                self.mutate_delete_node(config)
+            elif r < ((config.node_add_prob + config.node_delete_prob +
+                       config.conn_add_prob) / div):
+                self.mutate_add_connection(config)
+            elif r < ((config.node_add_prob + config.node_delete_prob +
+                       config.conn_add_prob + config.conn_delete_prob) / div):
+                self.mutate_delete_connection()
+        else:
+            if random.random() < config.node_add_prob:
+                self.mutate_add_node(config)
+            if random.random() < config.node_delete_prob:
+                self.mutate_delete_node(config)
+            if random.random() < config.conn_add_prob:
+                self.mutate_add_connection(config)
+            if random.random() < config.conn_delete_prob:
+                self.mutate_delete_connection()
+
+        if CompactGenome.pending is not None:
+            CompactGenome.pending.append(self)
+        else:
+            mutate_attributes([self], config)
+
+    def add_node(self, config, node_key):
+        p = params(config)
+        i = np.searchsorted(self.node_keys, node_key)
+        self.node_keys = _insert(self.node_keys, i, node_key)
+        self.bias = _insert(self.bias, i, p.bias.init_one())
+        self.response = _insert(self.response, i, p.response.init_one())
+        (_, act_default, act_options, _), (_, agg_default, agg_options, _) = p.strings
+        self.activation = _insert(self.activation, i, init_string(act_default, act_options))
+        self.aggregation = _insert(self.aggregation, i, init_string(agg_default, agg_options))
+
+    def add_connection(self, config, input_key, output_key, weight=None, enabled=None):
+        code = connection_code(input_key, output_key)
+        i = np.searchsorted(self.conn_keys, code)
+        if weight is None:
+            weight = params(config).weight.init_one()
+        if enabled is None:
+            enabled = config.enabled_default
+        self.conn_keys = _insert(self.conn_keys, i, code)
+        self.weight = _insert(self.weight, i, weight)
+        self.enabled = _insert(self.enabled, i, enabled)
+
+    def mutate_add_node(self, config):
+        if not len(self.conn_keys):
+            if config.check_structural_mutation_surer():
+                self.mutate_add_connection(config)
+            return
+
+        # 연결 하나를 골라 가운데에 노드를 넣는다
+        split = random.randrange(len(self.conn_keys))
+        new_node_id = config.get_new_node_key(dict.fromkeys(self.node_keys.tolist()))
+        self.add_node(config, new_node_id)
+
+        self.enabled[split] = False
+        i, o = connection_key(self.conn_keys[split])
+        weight = self.weight[split]
+        self.add_connection(config, i, new_node_id, 1.0, True)
+        self.add_connection(config, new_node_id, o, weight, True)
+
+    def mutate_add_connection(self, config):
+        possible_outputs = self.node_keys.tolist()
+        out_node = random.choice(possible_outputs)
+        in_node = random.choice(possible_outputs + config.input_keys)
+
+        code = connection_code(in_node, out_node)
+        i = np.searchsorted(self.conn_keys, code)
+        if i < len(self.conn_keys) and self.conn_keys[i] == code:
+            if config.check_structural_mutation_surer():
+                self.enabled[i] = True
+            return
+
+        if in_node in config.output_keys and out_node in config.output_keys:
+            return
+
+        keys = [connection_key(c) for c in self.conn_keys.tolist()]
+        if config.feed_forward and creates_cycle(keys, (in_node, out_node)):
+            return
+
+        self.add_connection(config, in_node, out_node)
+
+    def mutate_delete_node(self, config):
+        available = [k for k in self.node_keys.tolist() if k not in config.output_keys]
+        if not available:
+            return -1
+
+        del_key = random.choice(available)
+        keep = np.array([del_key not in connection_key(c) for c in self.conn_keys.tolist()], dtype=bool)
+        self.conn_keys, self.weight, self.enabled = self.conn_keys[keep], self.weight[keep], self.enabled[keep]
+
+        keep = self.node_keys != del_key
+        for name in ("node_keys", "bias", "response", "activation", "aggregation"):
+            setattr(self, name, getattr(self, name)[keep])
+        return del_key
+
+    def mutate_delete_connection(self):
+        if len(self.conn_keys):
+            keep = np.ones(len(self.conn_keys), dtype=bool)
+            keep[random.randrange(len(self.conn_keys))] = False
+            self.conn_keys, self.weight, self.enabled = self.conn_keys[keep], self.weight[keep], self.enabled[keep]
+
+    # --- 종 분류 거리 (DefaultGenome.distance 와 같은 식) ---
+    def distance(self, other, config):
+        wc = config.compatibility_weight_coefficient
+        dc = config.compatibility_disjoint_coefficient
+
+        node_distance = 0.0
+        if len(self.node_keys) or len(other.node_keys):
+            _, i1, i2 = np.intersect1d(self.node_keys, other.node_keys, assume_unique=True,
+                                       return_indices=True)
+            d = (np.abs(self.bias[i1] - other.bias[i2]) + np.abs(self.response[i1] - other.response[i2])
+                 + (self.activation[i1] != other.activation[i2])
+                 + (self.aggregation[i1] != other.aggregation[i2])).sum() * wc
+            disjoint = len(self.node_keys) + len(other.node_keys) - 2 * len(i1)
+            node_distance = (d + dc * disjoint) / max(len(self.node_keys), len(other.node_keys))
+
+        connection_distance = 0.0
+        if len(self.conn_keys) or len(other.conn_keys):
+            _, i1, i2 = np.intersect1d(self.conn_keys, other.conn_keys, assume_unique=True,
+                                       return_indices=True)
+            d = (np.abs(self.weight[i1] - other.weight[i2])
+                 + (self.enabled[i1] != other.enabled[i2])).sum() * wc
+            disjoint = len(self.conn_keys) + len(other.conn_keys) - 2 * len(i1)
+            connection_distance = (d + dc * disjoint) / max(len(self.conn_keys), len(other.conn_keys))
+
+        return float(node_distance + connection_distance)
+
+
+# --------------------------------
+# ▣ 여러 genome 의 속성 돌연변이를 한 번에
+# --------------------------------
+def mutate_attributes(genomes, config):
+    """
+    genomes 의 weight/bias/response/enabled(/activation/aggregation) 배열을 이어 붙여
+    돌연변이를 한 번에 적용하고 다시 genome 별로 나눠 담는다.
+    """
+    if not genomes:
+        return
+    p = params(config)
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    def batched(name, mutate):
+        parts = [getattr(g, name) for g in genomes]
+        values = np.concatenate(parts)
+        mutate(values)
+        for g, part in zip(genomes, np.split(values, np.cumsum([len(v) for v in parts])[:-1])):
+            setattr(g, name, part.copy())
+
+    def mutate_enabled(values):
+        flip = rng.random(len(values)) < p.enabled_rate + np.where(values, p.to_false, p.to_true)
+        values[flip] = rng.random(int(flip.sum())) < 0.5
+
+    batched("weight", lambda values: p.weight.mutate(values, rng))
+    batched("enabled", mutate_enabled)
+    batched("bias", lambda values: p.bias.mutate(values, rng))
+    batched("response", lambda values: p.response.mutate(values, rng))
+
+    for name, default, options, mutate_rate in p.strings:
+        if mutate_rate > 0:
+            def mutate_string(values):
+                change = rng.random(len(values)) < mutate_rate
+                values[change] = random_options(rng, options, int(change.sum()))
+            batched(name, mutate_string)
+
+
+class CompactReproduction(DefaultReproduction):
+    """
+    DefaultReproduction 과 같지만, 자식들의 속성 돌연변이를 모아 세대마다 mutate_attributes 한 번으로.
+    (genome 마다 작은 배열 연산을 여러 번 하는 비용을 없앰)
+    """
+
+    def reproduce(self, config, species, pop_size, generation):
+        CompactGenome.pending = []
+        try:
+            population = super().reproduce(config, species, pop_size, generation)
+            mutate_attributes(CompactGenome.pending, config.genome_config)
+        finally:
+            CompactGenome.pending = None
+        return population
+
+
+# --------------------------------
+# ▣ genome 하나가 차지하는 메모리 측정
+# --------------------------------
+def footprint(genome):
+    """genome 에서 참조하는 객체를 모두 따라가며 sys.getsizeof 를 더한 값 (바이트, 공유 문자열/숫자 제외)"""
+    seen = set()
+    total = 0
+    stack = [genome]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (str, type)) or obj is None:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, np.ndarray):
+            if obj.dtype == object:
+                stack.extend(obj.tolist())
+            continue
+        stack.extend(o for o in gc.get_referents(obj) if not isinstance(o, type))
+    return total
+
+
+def load_compact_config(config_path):
+    """CompactGenome + CompactReproduction 으로 config 읽기 (설정 값은 기존 섹션 그대로)"""
+    from .evolution import load_config
+    return load_config(config_path, genome_type=CompactGenome, reproduction_type=CompactReproduction)
+
+
+def compare(config_path, pop_size=5000):
+    """DefaultGenome 과 CompactGenome 의 genome 당 메모리, 한 세대 번식(교차+돌연변이) 시간 비교"""
+    from .evolution import load_config
+
+    for config in (load_config(config_path), load_compact_config(config_path)):
+        config.pop_size = pop_size
+        p = neat.Population(config)
+        for g in p.population.values():
+            g.fitness = random.random()
+        for s in p.species.species.values():
+            s.fitness_history = []
+
+        start = time.perf_counter()
+        population = p.reproduction.reproduce(config, p.species, pop_size, p.generation)
+        elapsed = time.perf_counter() - start
+
+        size = sum(footprint(g) for g in population.values()) / len(population)
+        print("{0:>14}: {1:7.0f} bytes/genome, {2:6.1f} us/child (reproduce)".format(
+            config.genome_type.__name__, size, elapsed / len(population) * 1e6))
+
+
+# python -m arena.compact_genome
+if __name__ == "__main__":
+    import os
+    compare(os.path.join(os.path.dirname(__file__), "config-feedforward.txt"))
@@ -0,0 +1,108 @@
+import os
+
+import neat
+import numpy as np
+
+from . import big_world
+from .bounded_stats import BoundedStatisticsReporter, spill_file
+from .evolution import load_config
+from .world import FOOD_COUNT, NUM_PREDATORS
+
+# --- 커리큘럼 설정 ---
+START_FRAMES = 300         # 처음 세대 최대 프레임
+MAX_FRAMES = big_world.MAX_GEN_TIME   # 최대 프레임 상한 (big_world 한 세대 최대 시간)
+GROW = 1.5                 # 통과할 때마다 최대 프레임을 몇 배로
+PASS_SURVIVAL = 0.8        # 중앙값 생존 프레임이 최대 프레임의 이 비율 이상이면 통과
+EASE_SURVIVAL = 0.25       # 중앙값 생존이 이 비율 미만이면 난이도 한 단계 낮춤
+LEVELS = 5                 # 최대 프레임이 상한에 닿은 뒤 올라가는 난이도 단계 수
+FOOD_RANGE = (FOOD_COUNT, FOOD_COUNT // 4)          # 난이도 0 → LEVELS 일 때 먹이 수
+PREDATOR_RANGE = (NUM_PREDATORS // 4, NUM_PREDATORS)  # 난이도 0 → LEVELS 일 때 포식자 수
+
+
+class SurvivalRecorder:
+    """big_world.play(observer=...) 로 넘겨서 생명체마다 몇 프레임 살았는지와 실제로 돈 프레임 수를 기록"""
+
+    def __init__(self, n):
+        self.death = np.full(n, -1)
+        self.frames = 0
+
+    def __call__(self, frame, world):
+        self.frames = frame
+        died = ~world.alive & (self.death < 0)
+        self.death[died] = frame
+
+    def survival(self):
+        return np.where(self.death < 0, self.frames, self.death)
+
+
+# --------------------------------
+# ▣ 세대별 난이도 조절
+# --------------------------------
+class Curriculum:
+    """
+    eval_genomes 자리에 넣는 커리큘럼.
+    세대마다 (최대 프레임, 먹이 수, 포식자 수) 를 정해 big_world.play 를 돌리고,
+    population 의 중앙값 생존 프레임을 보고 다음 세대 설정을 바꾼다.
+
+    - 중앙값 생존 ≥ PASS_SURVIVAL × 최대 프레임: 최대 프레임을 GROW 배 (상한이면 난이도 +1: 먹이 ↓ 포식자 ↑)
+    - 중앙값 생존 < EASE_SURVIVAL × 최대 프레임: 난이도 -1
+    처음부터 긴 세대를 돌리지 않아 전체 시뮬레이션 프레임이 크게 줄어든다.
+    """
+
+    def __init__(self, start_frames=START_FRAMES, max_frames=MAX_FRAMES):
+        self.frames = start_frames
+        self.max_frames = max_frames
+        self.level = 0
+        self.simulated = 0
+        self.generations = 0
+
+    def settings(self):
+        t = self.level / LEVELS
+        food = int(round(FOOD_RANGE[0] + (FOOD_RANGE[1] - FOOD_RANGE[0]) * t))
+        predators = int(round(PREDATOR_RANGE[0] + (PREDATOR_RANGE[1] - PREDATOR_RANGE[0]) * t))
+        return food, predators
+
+    def update(self, median):
+        if median >= PASS_SURVIVAL * self.frames:
+            if self.frames < self.max_frames:
+                self.frames = min(self.max_frames, int(self.frames * GROW))
+            else:
+                self.level = min(LEVELS, self.level + 1)
+        elif median < EASE_SURVIVAL * self.frames:
+            self.level = max(0, self.level - 1)
+
+    def eval_genomes(self, genomes, config):
+        big_world.GEN += 1
+        food, predators = self.settings()
+        frames = self.frames
+
+        recorder = SurvivalRecorder(len(genomes))
+        big_world.play(genomes, config, observer=recorder, max_frames=frames,
+                       food_count=food, num_predators=predators)
+        median = float(np.median(recorder.survival()))
+        self.simulated += recorder.frames
+        self.generations += 1
+        self.update(median)
+
+        print("Curriculum: {0} frames, {1} food, {2} predators | median survival {3:.0f} | "
+              "simulated {4} frames ({5:.0%} of fixed {6})".format(
+                  frames, food, predators, median, self.simulated,
+                  self.simulated / (self.generations * self.max_frames), self.max_frames))
+
+
+def run(config_path, generations=50):
+    config = load_config(config_path)
+
+    p = neat.Population(config)
+    p.add_reporter(neat.StdOutReporter(True))
+    stats = BoundedStatisticsReporter(spill_path=spill_file("curriculum"))
+    p.add_reporter(stats)
+
+    curriculum = Curriculum()
+    return p.run(curriculum.eval_genomes, generations)
+
+
+# python -m arena.curriculum
+if __name__ == "__main__":
+    local_dir = os.path.dirname(__file__)
+    run(os.path.join(local_dir, "config-feedforward.txt"))
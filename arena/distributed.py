@@ -0,0 +1,408 @@
+import argparse
+import collections
+import hashlib
+import hmac
+import itertools
+import os
+import pickle
+import queue
+import random
+import secrets
+import socket
+import struct
+import tempfile
+import threading
+import time
+
+import neat
+
+from . import big_world
+from .bounded_stats import BoundedStatisticsReporter, spill_file
+from .evolution import load_config
+
+# --- 분산 평가 설정 ---
+PORT = 5555               # 코디네이터 기본 포트
+BATCH_SIZE = 50           # 한 작업(같은 월드에서 함께 평가)에 들어가는 genome 수
+EPISODES = 1              # 작업마다 시드를 바꿔 몇 번 평가해서 평균낼지
+HEARTBEAT_INTERVAL = 1.0  # 워커가 살아있다고 알리는 주기 (초)
+HEARTBEAT_TIMEOUT = 10.0  # 이 시간 동안 소식이 없으면 워커를 잃은 것으로 보고 작업을 다시 배분
+AUTHKEY_ENV = "ARENA_AUTHKEY"   # 코디네이터 / 워커가 같이 쓰는 비밀 키 (인자로 안 주면 이 환경 변수)
+WAIT_LOG_INTERVAL = 10.0  # 워커가 하나도 없을 때 기다린다고 알리는 주기 (초)
+NONCE_SIZE = 16           # 연결마다 코디네이터가 보내는 난수 (이전 연결의 메시지를 다시 보내는 것 방지)
+
+
+# --------------------------------
+# ▣ 시나리오: 창 없이 시드로 재현 가능한 평가 함수
+# --------------------------------
+def play_big_world(genomes, config, seed):
+    random.seed(seed)
+    big_world.play(genomes, config)
+    return {genome_id: genome.fitness for genome_id, genome in genomes}
+
+
+SCENARIOS = {
+    "big_world": play_big_world,
+}
+
+
+# --------------------------------
+# ▣ 메시지: 4바이트 길이 + HMAC-SHA256 + pickle
+# --------------------------------
+class AuthenticationError(ConnectionError):
+    """HMAC 이 맞지 않는 메시지 (키가 다르거나 변조 / 재전송됨)"""
+
+
+def authkey_bytes(authkey):
+    """인자 → 환경 변수 순으로 키를 찾는다. 없으면 None"""
+    if authkey is None:
+        authkey = os.environ.get(AUTHKEY_ENV)
+    if isinstance(authkey, str):
+        authkey = authkey.encode("utf-8")
+    return authkey or None
+
+
+class Channel:
+    """
+    소켓 하나 위의 인증된 메시지 통로.
+    메시지마다 HMAC(키, 연결 nonce + 보내는 쪽 + 순번 + 내용) 을 붙이고,
+    받는 쪽은 HMAC 이 맞을 때만 pickle.loads 한다 (키 없는 상대의 바이트는 절대 unpickle 하지 않음).
+    순번 때문에 같은 연결 안에서 메시지를 다시 보내거나 순서를 바꿔도 거부된다.
+    """
+
+    def __init__(self, sock, authkey, nonce, side):
+        self.sock = sock
+        self.authkey = authkey
+        self.nonce = nonce
+        self.side = side
+        self.peer = b"W" if side == b"C" else b"C"
+        self.sent = 0
+        self.received = 0
+        self.send_lock = threading.Lock()
+
+    def _mac(self, side, seq, data):
+        return hmac.new(self.authkey, self.nonce + side + struct.pack("!Q", seq) + data, hashlib.sha256).digest()
+
+    def send(self, message):
+        data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.send_lock:
+            mac = self._mac(self.side, self.sent, data)
+            self.sent += 1
+            self.sock.sendall(struct.pack("!I", len(data)) + mac + data)
+
+    def recv(self):
+        size, = struct.unpack("!I", _recv_exact(self.sock, 4))
+        mac = _recv_exact(self.sock, hashlib.sha256().digest_size)
+        data = _recv_exact(self.sock, size)
+        if not hmac.compare_digest(mac, self._mac(self.peer, self.received, data)):
+            raise AuthenticationError("message failed authentication")
+        self.received += 1
+        return pickle.loads(data)
+
+
+def _recv_exact(sock, n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+# --------------------------------
+# ▣ 코디네이터
+# --------------------------------
+class _Worker:
+    def __init__(self, sock, address, channel):
+        self.sock = sock
+        self.address = address
+        self.channel = channel
+        self.name = None
+        self.last_seen = time.monotonic()
+        self.task = None
+        self.outbox = queue.Queue()   # 보낼 메시지 (lock 을 잡은 채 소켓에 쓰지 않도록 전용 스레드가 보냄)
+
+
+class Coordinator:
+    """
+    eval_genomes(genomes, config) 를 그대로 대신하는 분산 평가기.
+    genome 들을 BATCH_SIZE 개씩 작업으로 묶어 TCP 로 연결된 워커에 하나씩 보내고 fitness 를 받는다.
+    워커의 연결이 끊기거나 HEARTBEAT_TIMEOUT 동안 소식이 없으면 그 작업을 다른 워커에 다시 보낸다.
+    timeout 이 있으면 한 세대 평가가 그 시간 (초) 안에 안 끝날 때 TimeoutError (이미 보낸 작업의 결과는 늦게 와도 버림).
+
+    coordinator = Coordinator(config_path)
+    p.run(coordinator.eval_genomes, 50)
+
+    메시지는 pickle 이라 믿을 수 있는 네트워크 안에서만 쓴다고 가정한다.
+    기본으로 127.0.0.1 에만 열리고, 다른 컴퓨터의 워커를 받으려면 host="0.0.0.0" 처럼 직접 열어야 한다.
+    워커는 같은 authkey (인자 또는 ARENA_AUTHKEY) 를 가져야 하고, 키가 없으면 새로 만들어 self.authkey 에 둔다.
+    HMAC 으로 키 없는 상대의 메시지를 거르지만 내용을 암호화하지는 않는다.
+    """
+
+    def __init__(self, config_path, scenario="big_world", host="127.0.0.1", port=PORT,
+                 batch_size=BATCH_SIZE, episodes=EPISODES, seed=None, authkey=None, timeout=None):
+        if scenario not in SCENARIOS:
+            raise KeyError("Unknown scenario: {0}".format(scenario))
+        self.authkey = authkey_bytes(authkey) or secrets.token_hex(16).encode("ascii")
+        with open(config_path) as f:
+            self.config_text = f.read()
+        self.scenario = scenario
+        self.batch_size = batch_size
+        self.episodes = episodes
+        self.seeds = random.Random(seed)
+        self.timeout = timeout
+
+        self.lock = threading.Condition()
+        self.workers = []
+        self.pending = collections.deque()
+        self.results = {}
+        self.abandoned = set()   # 시간 초과로 포기한 세대의, 워커가 아직 들고 있는 작업 id (늦게 온 결과는 버림)
+        self.task_ids = itertools.count()
+        self.closed = False
+
+        self.server = socket.create_server((host, port))
+        self.address = self.server.getsockname()
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        threading.Thread(target=self._monitor_loop, daemon=True).start()
+
+    # --- 연결 관리 ---
+    def _accept_loop(self):
+        while True:
+            try:
+                sock, address = self.server.accept()
+            except OSError:
+                return
+            nonce = secrets.token_bytes(NONCE_SIZE)
+            worker = _Worker(sock, address, Channel(sock, self.authkey, nonce, b"C"))
+            threading.Thread(target=self._worker_loop, args=(worker, nonce), daemon=True).start()
+
+    def _worker_loop(self, worker, nonce):
+        try:
+            worker.sock.sendall(nonce)
+            while True:
+                message = worker.channel.recv()
+                with self.lock:
+                    worker.last_seen = time.monotonic()
+                    kind = message[0]
+                    if kind == "hello":
+                        worker.name = message[1]
+                        self.workers.append(worker)
+                        threading.Thread(target=self._send_loop, args=(worker,), daemon=True).start()
+                    elif kind == "result":
+                        task_id, fitnesses = message[1], message[2]
+                        if worker.task is not None and worker.task[0] == task_id:
+                            worker.task = None
+                            if task_id in self.abandoned:
+                                self.abandoned.discard(task_id)
+                            else:
+                                self.results[task_id] = fitnesses
+                                self.lock.notify_all()
+                    self._dispatch()
+        except AuthenticationError:
+            print("Rejected unauthenticated peer {0}".format(worker.address))
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+        self._drop(worker)
+
+    def _send_loop(self, worker):
+        """worker.outbox 의 메시지를 순서대로 보낸다. 멈춘 워커에 막혀도 이 스레드만 기다린다"""
+        while True:
+            message = worker.outbox.get()
+            if message is None:
+                return
+            try:
+                worker.channel.send(message)
+            except OSError:
+                self._drop(worker)
+                return
+
+    def _drop(self, worker):
+        """잃은 워커가 들고 있던 작업은 대기열 맨 앞으로 되돌린다"""
+        with self.lock:
+            if worker in self.workers:
+                self.workers.remove(worker)
+                if worker.task is not None and worker.task[0] in self.abandoned:
+                    self.abandoned.discard(worker.task[0])
+                    worker.task = None
+                elif worker.task is not None:
+                    print("Lost worker {0}, re-dispatching task {1}".format(worker.name, worker.task[0]))
+                    self.pending.appendleft(worker.task)
+                    worker.task = None
+                self._dispatch()
+        worker.outbox.put(None)
+        try:
+            worker.sock.close()
+        except OSError:
+            pass
+
+    def _monitor_loop(self):
+        while not self.closed:
+            time.sleep(HEARTBEAT_INTERVAL)
+            now = time.monotonic()
+            with self.lock:
+                stale = [w for w in self.workers if now - w.last_seen > HEARTBEAT_TIMEOUT]
+            for worker in stale:
+                # 소켓을 닫으면 _worker_loop 가 끝나면서 _drop 이 불린다 (막혀 있던 send 도 풀림)
+                try:
+                    worker.sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def _dispatch(self):
+        """
+        쉬고 있는 워커에 작업을 하나씩 배정한다 (lock 을 잡은 상태에서 호출).
+        실제 전송은 워커별 _send_loop 가 하므로 여기서는 소켓을 건드리지 않는다.
+        """
+        for worker in self.workers:
+            if not self.pending:
+                return
+            if worker.task is not None:
+                continue
+            worker.task = self.pending.popleft()
+            worker.outbox.put(("task",) + worker.task)
+
+    # --- 평가 ---
+    def eval_genomes(self, genomes, config):
+        seeds = [self.seeds.getrandbits(32) for _ in range(self.episodes)]
+        with self.lock:
+            ids = []
+            for start in range(0, len(genomes), self.batch_size):
+                task_id = next(self.task_ids)
+                ids.append(task_id)
+                self.pending.append((task_id, self.scenario, self.config_text, seeds,
+                                     genomes[start:start + self.batch_size]))
+            self._dispatch()
+
+            deadline = None if self.timeout is None else time.monotonic() + self.timeout
+            logged = None
+            while not all(task_id in self.results for task_id in ids):
+                self.lock.wait(HEARTBEAT_INTERVAL)
+                now = time.monotonic()
+                if not self.workers and (logged is None or now - logged >= WAIT_LOG_INTERVAL):
+                    print("No workers connected, waiting ({0} tasks pending)".format(len(self.pending)))
+                    logged = now
+                if deadline is not None and now > deadline:
+                    # 대기 중인 작업은 지우고, 워커가 들고 있는 작업은 결과가 와도 버리게 표시
+                    self.pending = collections.deque(t for t in self.pending if t[0] not in ids)
+                    for task_id in ids:
+                        self.results.pop(task_id, None)
+                    self.abandoned.update(w.task[0] for w in self.workers
+                                          if w.task is not None and w.task[0] in ids)
+                    raise TimeoutError("Generation not evaluated within {0} s ({1} workers)".format(
+                        self.timeout, len(self.workers)))
+            fitnesses = {}
+            for task_id in ids:
+                fitnesses.update(self.results.pop(task_id))
+
+        for genome_id, genome in genomes:
+            genome.fitness = fitnesses[genome_id]
+
+    def close(self):
+        self.closed = True
+        self.server.close()
+        with self.lock:
+            for worker in self.workers:
+                worker.outbox.put(("stop",))
+
+
+# --------------------------------
+# ▣ 워커
+# --------------------------------
+def worker(host="127.0.0.1", port=PORT, name=None, retry=30.0, authkey=None):
+    """
+    코디네이터에 접속해서 작업을 받아 평가하고 fitness 를 돌려준다.
+    평가하는 동안에도 별도 스레드가 HEARTBEAT_INTERVAL 마다 살아있음을 알린다.
+    authkey 는 코디네이터와 같은 키 (없으면 ARENA_AUTHKEY).
+    """
+    authkey = authkey_bytes(authkey)
+    if authkey is None:
+        raise ValueError("Worker needs the coordinator's authkey (authkey= or ${0})".format(AUTHKEY_ENV))
+    deadline = time.monotonic() + retry
+    while True:
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.5)
+
+    channel = Channel(sock, authkey, _recv_exact(sock, NONCE_SIZE), b"W")
+    stop = threading.Event()
+    send = channel.send
+
+    def heartbeat():
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                send(("heartbeat",))
+            except OSError:
+                return
+
+    send(("hello", name or "{0}:{1}".format(socket.gethostname(), os.getpid())))
+    threading.Thread(target=heartbeat, daemon=True).start()
+
+    configs = {}
+    try:
+        while True:
+            try:
+                message = channel.recv()
+            except (OSError, EOFError):
+                break
+            if message[0] == "stop":
+                break
+
+            _, task_id, scenario, config_text, seeds, genomes = message
+            if config_text not in configs:
+                with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+                    f.write(config_text)
+                configs[config_text] = load_config(f.name)
+                os.remove(f.name)
+
+            total = dict.fromkeys((genome_id for genome_id, genome in genomes), 0.0)
+            for seed in seeds:
+                for genome_id, fitness in SCENARIOS[scenario](genomes, configs[config_text], seed).items():
+                    total[genome_id] += fitness / len(seeds)
+            send(("result", task_id, total))
+    finally:
+        stop.set()
+        sock.close()
+
+
+# --------------------------------
+# ▣ 실행
+# --------------------------------
+def run(config_path, generations=50, host="127.0.0.1", port=PORT, authkey=None):
+    config = load_config(config_path)
+
+    p = neat.Population(config)
+    p.add_reporter(neat.StdOutReporter(True))
+    stats = BoundedStatisticsReporter(spill_path=spill_file("distributed"))
+    p.add_reporter(stats)
+
+    coordinator = Coordinator(config_path, host=host, port=port, authkey=authkey)
+    print("Coordinator listening on {0}:{1}".format(*coordinator.address))
+    if authkey_bytes(authkey) is None:
+        print("Worker authkey: {0} (--authkey or ${1})".format(coordinator.authkey.decode("ascii"), AUTHKEY_ENV))
+    try:
+        winner = p.run(coordinator.eval_genomes, generations)
+    finally:
+        coordinator.close()
+    return winner
+
+
+# python -m arena.distributed coordinator [--host 0.0.0.0]   (다른 컴퓨터의 워커도 받을 때만)
+# python -m arena.distributed worker --host 127.0.0.1 --authkey <코디네이터가 출력한 키>
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("role", choices=["coordinator", "worker"])
+    parser.add_argument("--host", default="127.0.0.1", help="coordinator: 열 주소, worker: 접속할 주소")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--authkey", help="공유 비밀 키 (기본: ${0})".format(AUTHKEY_ENV))
+    args = parser.parse_args()
+
+    if args.role == "coordinator":
+        run(os.path.join(os.path.dirname(__file__), "config-feedforward.txt"), args.generations,
+            args.host, args.port, args.authkey)
+    else:
+        worker(args.host, args.port, authkey=args.authkey)
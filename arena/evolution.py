@@ -0,0 +1,124 @@
+import configparser
+import copy
+import os
+import re
+import tempfile
+
+import neat
+from neat.population import CompleteExtinctionException
+
+from .speciation import CachedSpeciesSet
+
+
+# 읽은 Config 캐시: (파일 내용, 클래스들) → Config. 같은 파일을 여러 번 읽는 작업 프로세스 / sweep 용
+_config_cache = {}
+
+
+def load_config(config_path, species_set_type=CachedSpeciesSet, genome_type=neat.DefaultGenome,
+                reproduction_type=neat.DefaultReproduction):
+    """
+    neat Config 를 읽는다. 종 분류는 기본으로 CachedSpeciesSet.
+    neat 는 클래스 이름으로 섹션을 찾기 때문에, 그 섹션이 없으면
+    [DefaultGenome] / [DefaultSpeciesSet] / [DefaultReproduction] 값을 그대로 쓴다.
+
+    같은 내용의 파일을 다시 읽으면 캐시해 둔 Config 의 복사본을 돌려준다
+    (pop_size 를 바꾸거나 node_indexer 가 늘어나도 다른 호출에 새지 않게 매번 복사).
+    """
+    with open(config_path) as f:
+        key = (f.read(), species_set_type, genome_type, reproduction_type)
+    if key not in _config_cache:
+        _config_cache[key] = _parse_config(config_path, species_set_type, genome_type, reproduction_type)
+    return copy.deepcopy(_config_cache[key])
+
+
+def _parse_config(config_path, species_set_type, genome_type, reproduction_type):
+    parser = configparser.ConfigParser()
+    parser.read(config_path)
+    aliases = {genome_type.__name__: "DefaultGenome", species_set_type.__name__: "DefaultSpeciesSet",
+               reproduction_type.__name__: "DefaultReproduction"}
+    missing = [(name, base) for name, base in aliases.items()
+               if not parser.has_section(name) and parser.has_section(base)]
+    if not missing:
+        return neat.config.Config(genome_type, reproduction_type,
+                                  species_set_type, neat.DefaultStagnation, config_path)
+
+    for name, base in missing:
+        parser[name] = parser[base]
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        parser.write(f)
+    try:
+        return neat.config.Config(genome_type, reproduction_type,
+                                  species_set_type, neat.DefaultStagnation, f.name)
+    finally:
+        os.remove(f.name)
+
+
+# --------------------------------
+# ▣ config 변형 파일 만들기
+# --------------------------------
+def derive_config(base_path, overrides, out_path):
+    """
+    base config 파일에서 overrides 에 있는 키의 값만 바꿔 out_path 에 쓴다.
+    예: derive_config("config-feedforward.txt", {"initial_connection": "full_nodirect"}, out)
+    """
+    with open(base_path) as f:
+        lines = f.read().splitlines()
+
+    missing = set(overrides)
+    for i, line in enumerate(lines):
+        m = re.match(r"(\s*)(\w+)(\s*=\s*)", line)
+        if m and m.group(2) in overrides:
+            lines[i] = m.group(1) + m.group(2) + m.group(3) + str(overrides[m.group(2)])
+            missing.discard(m.group(2))
+    if missing:
+        raise KeyError("Unknown config keys: {0}".format(sorted(missing)))
+
+    with open(out_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return out_path
+
+
+# --------------------------------
+# ▣ neat.Population.run() 의 한 세대를 나눠서 호출하기
+# --------------------------------
+def advance(p, measured=None):
+    """
+    fitness 가 이미 채워진 population 을 한 세대 진행한다.
+    neat.Population.run() 루프에서 평가 이후 부분(통계, 번식, 종 분류)과 같다.
+    목표 fitness 에 도달했으면 번식하지 않고 True 를 반환한다.
+    measured(genome key) 가 있으면 False 인 genome (예측만 한 fitness) 은 최고 genome 과 종료 조건에서 뺀다
+    (번식 / 종 분류에는 그대로 들어감).
+    """
+    candidates = [g for k, g in p.population.items() if measured is None or measured(k)]
+    best = None
+    for g in candidates or p.population.values():
+        if best is None or g.fitness > best.fitness:
+            best = g
+    p.reporters.post_evaluate(p.config, p.population, p.species, best)
+
+    if p.best_genome is None or best.fitness > p.best_genome.fitness:
+        p.best_genome = best
+
+    if not p.config.no_fitness_termination:
+        fv = p.fitness_criterion(g.fitness for g in candidates) if candidates else None
+        if fv is not None and fv >= p.config.fitness_threshold:
+            p.reporters.found_solution(p.config, p.generation, best)
+            return True
+
+    # 다음 세대 생성
+    p.population = p.reproduction.reproduce(p.config, p.species, p.config.pop_size, p.generation)
+
+    # 멸종 처리
+    if not p.species.species:
+        p.reporters.complete_extinction()
+        if p.config.reset_on_extinction:
+            p.population = p.reproduction.create_new(p.config.genome_type, p.config.genome_config,
+                                                     p.config.pop_size)
+        else:
+            raise CompleteExtinctionException()
+
+    # 종 분류
+    p.species.speciate(p.config, p.population, p.generation)
+    p.reporters.end_generation(p.config, p.population, p.species)
+    p.generation += 1
+    return False
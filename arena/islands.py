@@ -0,0 +1,183 @@
+import itertools
+import multiprocessing
+import os
+import queue
+import random
+import tempfile
+
+import neat
+
+from . import big_world
+from .evolution import advance, derive_config, load_config
+
+# --- 섬(island) 모델 설정 ---
+# 섬마다 base config 에서 바꿀 값 (섬 수가 더 많으면 돌아가며 사용)
+VARIANTS = [
+    {},                                          # second/ 와 같은 full
+    {"initial_connection": "full_nodirect"},     # 11_24/ 와 같은 full_nodirect
+]
+MIGRATION_INTERVAL = 5    # 몇 세대마다 이주할지 (K)
+MIGRANTS = 3              # 한 번에 이웃 섬으로 보내는 상위 genome 수
+
+
+class IslandReporter(neat.reporting.BaseReporter):
+    """여러 섬의 출력이 섞이지 않도록 세대마다 한 줄만 출력"""
+
+    def __init__(self, index):
+        self.index = index
+        self.generation = None
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        print("[island {0}] gen {1} | best {2:.1f} | {3} species".format(
+            self.index, self.generation, best_genome.fitness, len(species.species)))
+
+
+# --------------------------------
+# ▣ 이주
+# --------------------------------
+def emigrants(p, n):
+    """fitness 상위 n 개 genome"""
+    return sorted(p.population.values(), key=lambda g: g.fitness, reverse=True)[:n]
+
+
+def renumber(genome, gc, renamed):
+    """
+    genome 의 hidden 노드 번호를 이 섬의 새 번호로 바꾼다 (입력 / 출력 노드는 모든 섬에서 같으므로 그대로).
+    renamed 는 원래 번호 → 새 번호: 같이 이주해 온 genome 들끼리는 같은 노드가 같은 새 번호를 받는다.
+    노드 / 연결의 dict 순서는 유지한다.
+    """
+    def new_key(k):
+        if k < 0 or k in gc.output_keys:
+            return k
+        if k not in renamed:
+            renamed[k] = next(gc.node_indexer)
+        return renamed[k]
+
+    nodes = {}
+    for k, node in genome.nodes.items():
+        node.key = new_key(k)
+        nodes[node.key] = node
+    connections = {}
+    for (i, o), connection in genome.connections.items():
+        connection.key = (new_key(i), new_key(o))
+        connections[connection.key] = connection
+    genome.nodes, genome.connections = nodes, connections
+
+
+def immigrate(p, migrants):
+    """
+    이웃 섬에서 온 genome 으로 가장 못한 genome 들을 바꾸고 종을 다시 나눈다.
+    genome key 는 이 섬의 번호로 새로 붙이고, hidden 노드는 이 섬의 새 노드 번호로 바꾼다
+    (다른 섬에서 같은 번호를 받은 노드는 다른 유전자라서, 그대로 두면 교차 때 같은 유전자로 섞인다).
+    """
+    gc = p.config.genome_config
+    if gc.node_indexer is None:
+        gc.node_indexer = itertools.count(max(k for g in p.population.values() for k in g.nodes) + 1)
+    renamed = {}
+    for g in migrants:
+        renumber(g, gc, renamed)
+
+    worst = sorted(p.population.values(), key=lambda g: g.fitness)[:len(migrants)]
+    for old, g in zip(worst, migrants):
+        del p.population[old.key]
+        g.key = next(p.reproduction.genome_indexer)
+        p.reproduction.ancestors[g.key] = tuple()
+        p.population[g.key] = g
+
+    p.species.speciate(p.config, p.population, p.generation)
+
+
+# --------------------------------
+# ▣ 섬 하나 (자식 프로세스)
+# --------------------------------
+def island_process(index, config_path, generations, inbox, outbox, results, seed):
+    """
+    자기 population 을 창 없이 진화시키고, MIGRATION_INTERVAL 세대마다
+    상위 genome 을 outbox(다음 섬) 로 보내고 inbox 에 도착한 genome 을 받아들인다.
+    이주는 기다리지 않는다 (먼저 끝난 섬이 있어도 멈추지 않음).
+    """
+    random.seed(None if seed is None else seed + index)
+
+    config = load_config(config_path)
+    p = neat.Population(config)
+    p.add_reporter(IslandReporter(index))
+
+    for _ in range(generations):
+        p.reporters.start_generation(p.generation)
+        big_world.play(list(p.population.items()), config)
+
+        if (p.generation + 1) % MIGRATION_INTERVAL == 0:
+            outbox.put(emigrants(p, MIGRANTS))
+            migrants = []
+            while True:
+                try:
+                    migrants.extend(inbox.get_nowait())
+                except queue.Empty:
+                    break
+            if migrants:
+                immigrate(p, migrants)
+
+        if advance(p):
+            break
+
+    results.put((index, p.best_genome))
+
+
+def _drain(q):
+    while True:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            return
+
+
+# --------------------------------
+# ▣ 섬 모델 실행
+# --------------------------------
+def run(config_path, generations=50, islands=None, variants=VARIANTS, seed=None):
+    """
+    islands 개(기본: CPU 코어 수)의 population 을 각각 다른 프로세스에서 진화시킨다.
+    섬 i 는 variants[i % len(variants)] 로 바꾼 config 를 쓰고, 이주는 고리(i → i+1) 방향.
+    반환값: 모든 섬 중 가장 좋은 genome
+    """
+    if islands is None:
+        islands = max(len(variants), os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [derive_config(config_path, variants[i % len(variants)],
+                               os.path.join(tmp, "island-{0}.txt".format(i)))
+                 for i in range(islands)]
+
+        inboxes = [multiprocessing.Queue() for _ in range(islands)]
+        results = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=island_process, daemon=True,
+                                           args=(i, paths[i], generations, inboxes[i],
+                                                 inboxes[(i + 1) % islands], results, seed))
+                   for i in range(islands)]
+        for w in workers:
+            w.start()
+
+        best = {}
+        for _ in range(islands):
+            index, genome = results.get()
+            best[index] = genome
+        # 모든 섬이 끝났으니 남은 이주 genome 은 버린다.
+        # 받는 섬이 먼저 끝나면 보낸 섬의 queue 가 다 비워질 때까지 그 프로세스가 종료되지 못하므로 join 전에 비운다.
+        while any(w.is_alive() for w in workers):
+            for inbox in inboxes:
+                _drain(inbox)
+            for w in workers:
+                w.join(0.1)
+
+    for index in sorted(best):
+        print("[island {0}] best fitness {1:.1f}".format(index, best[index].fitness))
+    return max(best.values(), key=lambda g: g.fitness)
+
+
+# python -m arena.islands
+if __name__ == "__main__":
+    local_dir = os.path.dirname(__file__)
+    run(os.path.join(local_dir, "config-feedforward.txt"))
@@ -0,0 +1,169 @@
+import argparse
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import neat
+
+from . import big_world
+from .evolution import load_config
+from .profiling import ProfilingReporter
+
+# --- 엔드포인트 설정 ---
+HOST = "127.0.0.1"
+PORT = 8000
+FRAME_EVERY = 30      # 이 프레임마다 살아있는 수 / 초당 프레임 갱신
+
+
+# --------------------------------
+# ▣ 현재 상태 스냅샷
+# --------------------------------
+class LiveMetrics(neat.reporting.BaseReporter):
+    """
+    p.add_reporter(LiveMetrics()) + big_world.play(observer=live.observer) 로 쓴다.
+    세대/프레임이 끝날 때마다 새 dict 를 만들어 self.generation_snapshot / self.frame_snapshot 에
+    통째로 바꿔 끼운다 (참조 교체는 원자적이라 읽는 쪽은 잠금 없이 항상 완성된 dict 를 봄).
+    HTTP 스레드는 이 참조만 읽고 문자열 만들기는 자기 스레드에서 한다.
+    """
+
+    def __init__(self, profiling=None, frame_every=FRAME_EVERY):
+        self.profiling = profiling
+        self.frame_every = frame_every
+        self.generation = 0
+        self.start = time.perf_counter()
+        self.generation_snapshot = {"generation": 0}
+        self.frame_snapshot = {}
+
+    def observer(self, frame, world):
+        if frame % self.frame_every == 0:
+            seconds = time.perf_counter() - self.start
+            self.frame_snapshot = {"frame": frame, "alive": int(world.alive.sum()),
+                                   "steps_per_sec": frame / seconds if seconds else 0.0}
+
+    def start_generation(self, generation):
+        self.generation = generation
+        self.start = time.perf_counter()
+        self.frame_snapshot = {}
+
+    def post_evaluate(self, config, population, species, best_genome):
+        fitnesses = [g.fitness for g in population.values()]
+        mean = sum(fitnesses) / len(fitnesses)
+        self.generation_snapshot = {
+            "generation": self.generation,
+            "evaluate_seconds": time.perf_counter() - self.start,
+            "population": len(fitnesses),
+            "species": len(species.species),
+            "fitness_best": max(fitnesses),
+            "fitness_mean": mean,
+            "fitness_stdev": (sum((f - mean) ** 2 for f in fitnesses) / len(fitnesses)) ** 0.5,
+            "species_sizes": {str(sid): len(s.members) for sid, s in species.species.items()},
+        }
+
+    def snapshot(self):
+        """HTTP 스레드에서 부름: 지금 걸려 있는 dict 들을 읽기만 한다"""
+        data = dict(self.generation_snapshot)
+        data["current"] = self.frame_snapshot
+        data["phases"] = self.profiling.phases if self.profiling is not None else {}
+        return data
+
+
+def prometheus(data):
+    """스냅샷 → Prometheus text 형식"""
+    lines = []
+
+    def gauge(name, value, help_text, labels=""):
+        if not any(line.startswith("# TYPE " + name + " ") for line in lines):
+            lines.append("# HELP {0} {1}".format(name, help_text))
+            lines.append("# TYPE {0} gauge".format(name))
+        lines.append("{0}{1} {2}".format(name, labels, float(value)))
+
+    gauge("neat_generation", data.get("generation", 0), "Last evaluated generation")
+    for key, help_text in (("population", "Population size"), ("species", "Number of species"),
+                           ("fitness_best", "Best fitness"), ("fitness_mean", "Mean fitness"),
+                           ("fitness_stdev", "Fitness standard deviation"),
+                           ("evaluate_seconds", "Evaluation wall time of the last generation")):
+        if key in data:
+            gauge("neat_" + key, data[key], help_text)
+    for sid, size in data.get("species_sizes", {}).items():
+        gauge("neat_species_size", size, "Members per species", '{species="%s"}' % sid)
+    current = data.get("current", {})
+    for key, help_text in (("frame", "Current frame of the running generation"),
+                           ("alive", "Creatures alive in the running generation"),
+                           ("steps_per_sec", "Simulation frames per second in the running generation")):
+        if key in current:
+            gauge("neat_current_" + key, current[key], help_text)
+    for phase, seconds in data.get("phases", {}).items():
+        gauge("neat_phase_seconds", seconds, "Seconds per phase in the last generation", '{phase="%s"}' % phase)
+    return "\n".join(lines) + "\n"
+
+
+# --------------------------------
+# ▣ HTTP 엔드포인트 (백그라운드 스레드)
+# --------------------------------
+def serve(live, host=HOST, port=PORT):
+    """
+    GET /metrics → Prometheus text, GET /metrics.json (또는 /) → JSON.
+    데몬 스레드에서 돌리고 server 를 반환 (server.shutdown() 으로 멈춤).
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            data = live.snapshot()
+            if self.path == "/metrics":
+                body, kind = prometheus(data), "text/plain; version=0.0.4"
+            elif self.path in ("/", "/metrics.json"):
+                body, kind = json.dumps(data), "application/json"
+            else:
+                self.send_error(404)
+                return
+            body = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", kind)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass   # 요청마다 stderr 에 찍지 않음
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(config_path, generations=50, host=HOST, port=PORT, profile=True):
+    config = load_config(config_path)
+
+    p = neat.Population(config)
+    p.add_reporter(neat.StdOutReporter(True))
+    profiling = None
+    if profile:
+        profiling = ProfilingReporter(p)
+        p.add_reporter(profiling)
+    live = LiveMetrics(profiling)
+    p.add_reporter(live)
+    server = serve(live, host, port)
+    print("Live metrics on http://{0}:{1}/metrics".format(host, server.server_address[1]))
+
+    def eval_genomes(genomes, config):
+        big_world.GEN += 1
+        big_world.play(genomes, config, observer=live.observer)
+
+    try:
+        return p.run(eval_genomes, generations)
+    finally:
+        server.shutdown()
+
+
+# python -m arena.live --port 8000   (창 없이 돌리고 curl localhost:8000/metrics)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--generations", type=int, default=50)
+    args = parser.parse_args()
+
+    local_dir = os.path.dirname(__file__)
+    run(os.path.join(local_dir, "config-feedforward.txt"), args.generations, args.host, args.port)
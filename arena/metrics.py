@@ -0,0 +1,134 @@
+import collections
+import json
+import os
+import statistics
+import time
+
+import neat
+
+from . import big_world
+from .evolution import load_config
+
+# --- 기록 설정 ---
+WINDOW = 200          # 메모리에 남길 최근 세대 수 (실시간 그래프용)
+FRAME_EVERY = 0       # 0 이면 프레임 기록 안 함, N 이면 N 프레임마다 한 줄
+FLUSH_EVERY = 256     # 이 줄 수만큼 모이면 파일에 씀 (세대가 끝날 때도 씀)
+
+
+# --------------------------------
+# ▣ 추가만 하는 JSONL 기록
+# --------------------------------
+class MetricsSink:
+    """
+    한 줄에 JSON 하나씩 파일 끝에 붙여 쓴다 (버퍼에 모았다가 FLUSH_EVERY 줄마다 / flush() 때).
+    세대 기록은 최근 window 개만 recent 에 남긴다. 전체 기록은 read(path) 로 다시 읽는다.
+    프로세스가 죽어도 마지막 flush 까지는 파일에 남는다.
+    """
+
+    def __init__(self, path, window=WINDOW, flush_every=FLUSH_EVERY):
+        self.path = path
+        self.flush_every = flush_every
+        self.recent = collections.deque(maxlen=window)
+        self.buffer = []
+        self.file = open(path, "a")
+
+    def write(self, record):
+        self.buffer.append(json.dumps(record, separators=(",", ":")))
+        if record.get("kind") == "generation":
+            self.recent.append(record)
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.file.write("\n".join(self.buffer) + "\n")
+            self.buffer = []
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+def read(path, kind="generation"):
+    """MetricsSink 가 쓴 파일에서 kind 기록만 순서대로"""
+    with open(path) as f:
+        for line in f:
+            record = json.loads(line)
+            if record.get("kind") == kind:
+                yield record
+
+
+# --------------------------------
+# ▣ big_world 세대/프레임 기록
+# --------------------------------
+class MetricsReporter(neat.reporting.BaseReporter):
+    """
+    p.add_reporter(MetricsReporter(sink)) + big_world.play(observer=reporter.observer) 로 쓴다.
+    세대마다 best/avg/median fitness, 종 수, 살아남은 수, 먹은 먹이 수, 초당 프레임을 sink 에 쓰고,
+    frame_every > 0 이면 그 간격마다 프레임 기록(살아있는 수, 누적 먹이)도 쓴다.
+    StatisticsReporter 와 달리 genome 이나 종별 목록을 메모리에 쌓지 않는다.
+    """
+
+    def __init__(self, sink, frame_every=FRAME_EVERY):
+        self.sink = sink
+        self.frame_every = frame_every
+        self.generation = 0
+        self.frames = 0
+        self.alive = 0
+        self.eaten = 0
+        self.start = time.perf_counter()
+
+    def observer(self, frame, world):
+        self.frames = frame
+        self.alive = int(world.alive.sum())
+        self.eaten = int(world.eaten.sum())
+        if self.frame_every and frame % self.frame_every == 0:
+            self.sink.write({"kind": "frame", "generation": self.generation, "frame": frame,
+                             "alive": self.alive, "eaten": self.eaten})
+
+    def start_generation(self, generation):
+        self.generation = generation
+        self.frames = self.alive = self.eaten = 0
+        self.start = time.perf_counter()
+
+    def post_evaluate(self, config, population, species, best_genome):
+        fitnesses = [g.fitness for g in population.values()]
+        seconds = time.perf_counter() - self.start
+        self.sink.write({
+            "kind": "generation", "generation": self.generation, "time": time.time(),
+            "best": max(fitnesses), "avg": sum(fitnesses) / len(fitnesses), "median": statistics.median(fitnesses),
+            "species": len(species.species), "alive": self.alive, "eaten": self.eaten,
+            "frames": self.frames, "steps_per_sec": self.frames / seconds if seconds else 0.0,
+        })
+
+    def end_generation(self, config, population, species_set):
+        self.sink.flush()
+
+    def found_solution(self, config, generation, best):
+        self.sink.flush()
+
+
+def run(config_path, path="metrics.jsonl", generations=50, frame_every=FRAME_EVERY):
+    config = load_config(config_path)
+
+    p = neat.Population(config)
+    p.add_reporter(neat.StdOutReporter(True))
+    sink = MetricsSink(path)
+    metrics = MetricsReporter(sink, frame_every)
+    p.add_reporter(metrics)
+
+    def eval_genomes(genomes, config):
+        big_world.GEN += 1
+        big_world.play(genomes, config, observer=metrics.observer)
+
+    try:
+        return p.run(eval_genomes, generations)
+    finally:
+        sink.close()
+
+
+# python -m arena.metrics
+if __name__ == "__main__":
+    local_dir = os.path.dirname(__file__)
+    run(os.path.join(local_dir, "config-feedforward.txt"))
@@ -0,0 +1,256 @@
+import copy
+import math
+import os
+import random
+
+import neat
+import numpy as np
+
+from . import big_world
+from .bounded_stats import BoundedStatisticsReporter, spill_file
+from .evolution import load_config
+
+# --- novelty search 설정 ---
+NOVELTY_WEIGHT = 1.0   # 1 이면 순수 novelty, 0 이면 원래 fitness (그 사이는 순위를 섞음)
+K_NEAREST = 15         # novelty = 가장 가까운 K 개 행동까지 평균 거리
+ARCHIVE_ADD_RATE = 0.05  # 매 세대 각 genome 의 행동을 아카이브에 넣을 확률
+SAMPLES = 10           # 한 세대 동안 위치/먹은 수를 기록하는 횟수
+FOOD_SCALE = 50.0      # 먹은 먹이 수를 이 값으로 나눠서 위치(0~1)와 비슷한 크기로
+
+N_PROBE = 8            # 근사 검색에서 살펴볼 가장 가까운 목록(클러스터) 수
+BRUTE_FORCE = 4096     # 아카이브가 이보다 작으면 전부 비교 (정확)
+KMEANS_ITERATIONS = 10
+
+
+# --------------------------------
+# ▣ 행동 기록
+# --------------------------------
+class BehaviourRecorder:
+    """
+    big_world.play(observer=...) 로 넘겨서 생명체마다 SAMPLES 번
+    (x/월드 너비, y/월드 높이, 먹은 먹이 수/FOOD_SCALE) 를 기록한다.
+    일찍 죽거나 세대가 일찍 끝나면 남은 칸은 마지막 상태로 채움.
+    """
+
+    def __init__(self, n, samples=SAMPLES, max_frames=None):
+        self.every = max(1, (max_frames or big_world.MAX_GEN_TIME) // samples)
+        self.samples = samples
+        self.data = np.zeros((n, samples, 3))
+        self.count = 0
+        self.world = None
+
+    def snapshot(self, world):
+        return np.stack([world.x / world.width, world.y / world.height, world.eaten / FOOD_SCALE], axis=1)
+
+    def __call__(self, frame, world):
+        self.world = world
+        if frame % self.every == 0 and self.count < self.samples:
+            self.data[:, self.count] = self.snapshot(world)
+            self.count += 1
+
+    def descriptors(self):
+        if self.world is not None and self.count < self.samples:
+            self.data[:, self.count:] = self.snapshot(self.world)[:, None, :]
+        return self.data.reshape(len(self.data), -1)
+
+
+# --------------------------------
+# ▣ 근사 최근접 이웃 아카이브 (IVF: k-means 목록 + 가까운 목록만 탐색)
+# --------------------------------
+def _squared_distances(a, b):
+    d = (a * a).sum(axis=1)[:, None] + (b * b).sum(axis=1)[None, :] - 2.0 * a @ b.T
+    return np.maximum(d, 0.0)
+
+
+def _merge(best, d, k):
+    """best (q, k) 와 새 거리 d (q, m) 를 합쳐 작은 k 개만"""
+    merged = np.concatenate([best, d], axis=1)
+    if merged.shape[1] > k:
+        merged = np.partition(merged, k - 1, axis=1)[:, :k]
+    return merged
+
+
+class BehaviourArchive:
+    """
+    행동 벡터 아카이브. 전체를 다 비교하지 않도록 벡터를 약 sqrt(N) 개의 k-means 목록으로 나누고,
+    질의마다 중심이 가까운 N_PROBE 개 목록 안에서만 k-NN 을 찾는다 (근사).
+    아카이브가 학습 당시보다 4배 커지면 목록을 다시 만든다.
+    """
+
+    def __init__(self, dim, n_probe=N_PROBE):
+        self.dim = dim
+        self.n_probe = n_probe
+        self.data = np.zeros((1024, dim))
+        self.size = 0
+        self.centroids = None
+        self.assign = np.zeros(0, dtype=np.int64)
+        self.trained_size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, vectors):
+        vectors = np.asarray(vectors, dtype=float).reshape(-1, self.dim)
+        if self.size + len(vectors) > len(self.data):
+            grown = np.zeros((max(2 * len(self.data), self.size + len(vectors)), self.dim))
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:self.size + len(vectors)] = vectors
+        self.size += len(vectors)
+
+        if self.size <= BRUTE_FORCE:
+            return
+        if self.centroids is None or self.size >= 4 * self.trained_size:
+            self.train()
+        else:
+            self.assign = np.concatenate([self.assign, self.nearest_lists(vectors, 1)[:, 0]])
+            self.index()
+
+    def train(self):
+        """k-means 로 목록 중심을 다시 구하고 전체를 배정"""
+        vectors = self.data[:self.size]
+        n_lists = max(1, int(math.sqrt(self.size)))
+        rng = np.random.default_rng(random.getrandbits(64))
+        sample = vectors[rng.choice(self.size, min(self.size, 30 * n_lists), replace=False)]
+
+        self.centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            nearest = np.argmin(_squared_distances(sample, self.centroids), axis=1)
+            counts = np.bincount(nearest, minlength=n_lists)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, nearest, sample)
+            used = counts > 0
+            self.centroids[used] = sums[used] / counts[used, None]
+
+        self.assign = np.concatenate([self.nearest_lists(vectors[i:i + 8192], 1)[:, 0]
+                                      for i in range(0, self.size, 8192)])
+        self.trained_size = self.size
+        self.index()
+
+    def index(self):
+        """목록별로 연속되게 정렬한 인덱스 (order[starts[l]:starts[l+1]] = 목록 l 의 벡터)"""
+        self.order = np.argsort(self.assign, kind="stable")
+        self.starts = np.concatenate([[0], np.cumsum(np.bincount(self.assign, minlength=len(self.centroids)))])
+
+    def nearest_lists(self, queries, n):
+        d = _squared_distances(queries, self.centroids)
+        n = min(n, len(self.centroids))
+        probes = np.argpartition(d, n - 1, axis=1)[:, :n]
+        return probes
+
+    def knn(self, queries, k):
+        """각 질의의 가장 가까운 k 개까지 거리 (q, k). 아카이브가 k 보다 작으면 inf 로 채움."""
+        queries = np.asarray(queries, dtype=float).reshape(-1, self.dim)
+        best = np.full((len(queries), k), np.inf)
+        if self.size == 0:
+            return best
+
+        if self.size <= BRUTE_FORCE or self.centroids is None:
+            data = self.data[:self.size]
+            for i in range(0, len(queries), 1024):
+                best[i:i + 1024] = _merge(best[i:i + 1024], _squared_distances(queries[i:i + 1024], data), k)
+            return np.sqrt(best)
+
+        # 목록마다: 이 목록을 살펴볼 질의들만 모아 한 번에 거리 계산
+        probes = self.nearest_lists(queries, self.n_probe)
+        owner = np.repeat(np.arange(len(queries)), probes.shape[1])
+        lists = probes.ravel()
+        by_list = np.argsort(lists, kind="stable")
+        bounds = np.searchsorted(lists[by_list], np.arange(len(self.centroids) + 1))
+        for l in range(len(self.centroids)):
+            q = owner[by_list[bounds[l]:bounds[l + 1]]]
+            members = self.order[self.starts[l]:self.starts[l + 1]]
+            if len(q) and len(members):
+                best[q] = _merge(best[q], _squared_distances(queries[q], self.data[members]), k)
+        return np.sqrt(best)
+
+
+# --------------------------------
+# ▣ novelty search 평가
+# --------------------------------
+def population_knn(vectors, k):
+    """population 안에서 자기 자신을 뺀 가장 가까운 k 개까지 거리 (정확, 나눠서 계산)"""
+    best = np.full((len(vectors), k), np.inf)
+    for i in range(0, len(vectors), 1024):
+        d = _squared_distances(vectors[i:i + 1024], vectors)
+        rows = np.arange(len(d))
+        d[rows, i + rows] = np.inf
+        best[i:i + 1024] = _merge(best[i:i + 1024], d, k)
+    return np.sqrt(best)
+
+
+def ranks(values):
+    """0 ~ 1 사이 순위 (작은 값이 0)"""
+    order = np.argsort(values, kind="stable")
+    r = np.empty(len(values))
+    r[order] = np.arange(len(values)) / max(1, len(values) - 1)
+    return r
+
+
+class NoveltySearch:
+    """
+    eval_genomes 자리에 넣는 novelty search.
+    big_world 에서 원래 규칙으로 한 세대를 돌리며 행동을 기록하고,
+    아카이브 + 현재 population 에서 가장 가까운 K_NEAREST 개 행동까지 평균 거리를 novelty 로 쓴다.
+    genome.fitness 는 NOVELTY_WEIGHT 에 따라 novelty 와 원래 fitness 의 순위를 섞은 값.
+    원래 fitness 가 가장 좋았던 genome 은 champion 에 남긴다.
+    """
+
+    def __init__(self, weight=NOVELTY_WEIGHT, k=K_NEAREST, add_rate=ARCHIVE_ADD_RATE):
+        self.weight = weight
+        self.k = k
+        self.add_rate = add_rate
+        self.archive = BehaviourArchive(SAMPLES * 3)
+        self.champion = None
+
+    def novelty(self, descriptors):
+        nearest = np.concatenate([self.archive.knn(descriptors, self.k),
+                                  population_knn(descriptors, self.k)], axis=1)
+        nearest = np.partition(nearest, self.k - 1, axis=1)[:, :self.k]
+        nearest[~np.isfinite(nearest)] = np.nan
+        return np.nan_to_num(np.nanmean(nearest, axis=1))
+
+    def eval_genomes(self, genomes, config):
+        recorder = BehaviourRecorder(len(genomes))
+        big_world.play(genomes, config, observer=recorder)
+        descriptors = recorder.descriptors()
+
+        objective = np.array([genome.fitness for genome_id, genome in genomes])
+        best = int(np.argmax(objective))
+        if self.champion is None or objective[best] > self.champion.fitness:
+            self.champion = copy.deepcopy(genomes[best][1])
+
+        novelty = self.novelty(descriptors)
+        add = np.random.default_rng(random.getrandbits(64)).random(len(genomes)) < self.add_rate
+        self.archive.add(descriptors[add])
+
+        if self.weight >= 1.0:
+            fitness = novelty
+        else:
+            fitness = self.weight * ranks(novelty) + (1.0 - self.weight) * ranks(objective)
+        for (genome_id, genome), f in zip(genomes, fitness):
+            genome.fitness = float(f)
+
+        print("Novelty: archive {0}, mean novelty {1:.3f} | objective best {2:.1f}, mean {3:.1f}".format(
+            len(self.archive), novelty.mean(), objective.max(), objective.mean()))
+
+
+def run(config_path, generations=50):
+    config = load_config(config_path)
+    # novelty 는 목표 fitness 와 단위가 달라서 fitness_threshold 로 멈추지 않게
+    config.no_fitness_termination = True
+
+    p = neat.Population(config)
+    p.add_reporter(neat.StdOutReporter(True))
+    stats = BoundedStatisticsReporter(spill_path=spill_file("novelty"))
+    p.add_reporter(stats)
+
+    search = NoveltySearch()
+    p.run(search.eval_genomes, generations)
+    return search.champion
+
+
+# python -m arena.novelty
+if __name__ == "__main__":
+    local_dir = os.path.dirname(__file__)
+    run(os.path.join(local_dir, "config-feedforward.txt"))
@@ -0,0 +1,138 @@
+import cProfile
+import os
+import pstats
+import signal
+import time
+
+import neat
+
+
+# --------------------------------
+# ▣ 단계별 시간 (켜져 있을 때만 잼)
+# --------------------------------
+class PhaseTimer:
+    """
+    시뮬레이션 코드에서
+        t = timer.mark()
+        ... 감지 ...
+        t = timer.lap("sense", t)
+    처럼 쓴다. 꺼져 있으면 mark() 가 None 을 돌려주고 lap() 은 바로 반환하므로
+    프레임마다 함수 호출 몇 번 외에는 비용이 없다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.seconds = {}
+
+    def mark(self):
+        return time.perf_counter() if self.enabled else None
+
+    def lap(self, name, since):
+        if since is None:
+            return None
+        now = time.perf_counter()
+        self.seconds[name] = self.seconds.get(name, 0.0) + now - since
+        return now
+
+    def reset(self):
+        seconds, self.seconds = self.seconds, {}
+        return seconds
+
+
+# big_world.step / play 가 쓰는 공용 timer (ProfilingReporter 가 켜고 끔)
+timer = PhaseTimer()
+
+
+# --------------------------------
+# ▣ 세대별 단계 시간 reporter
+# --------------------------------
+class ProfilingReporter(neat.reporting.BaseReporter):
+    """
+    p.add_reporter(ProfilingReporter(p)) 로 붙이면 세대마다
+    - 평가 안: predators(포식자 이동) / sense(감지) / think(신경망) / act(이동, 수명) / interact(포식자, 먹이) /
+      render / fps wait ...
+    - 평가 밖: reproduce(번식 + 정체 판정) / speciate(종 분류) / reporters
+    로 나눈 시간을 출력한다.
+
+    profile_generations 에 든 세대나 request_profile() (SIGUSR1 로도) 을 부른 다음 세대는
+    cProfile 로 통째로 재서 out_dir/profile-gen<N>.pstats 에 저장하고 상위 함수를 출력한다.
+    reporter 를 붙이지 않으면 timer 는 꺼진 채로 있다.
+    """
+
+    def __init__(self, p, profile_generations=(), out_dir=".", top=15, signal_trigger=True):
+        self.profile_generations = set(profile_generations)
+        self.out_dir = out_dir
+        self.top = top
+        self.profiler = None
+        self.requested = False
+        self.outside = {}
+        self.phases = {}   # 마지막으로 끝난 세대의 단계별 시간 (live.py 가 읽음)
+        timer.enabled = True
+
+        # Population.run 의 번식 / 종 분류를 이 인스턴스에서만 감싸서 잰다
+        reproduce, speciate = p.reproduction.reproduce, p.species.speciate
+
+        def timed_reproduce(*args, **kwargs):
+            t = time.perf_counter()
+            try:
+                return reproduce(*args, **kwargs)
+            finally:
+                self.outside["reproduce"] = time.perf_counter() - t
+
+        def timed_speciate(*args, **kwargs):
+            t = time.perf_counter()
+            try:
+                return speciate(*args, **kwargs)
+            finally:
+                self.outside["speciate"] = time.perf_counter() - t
+
+        p.reproduction.reproduce = timed_reproduce
+        p.species.speciate = timed_speciate
+
+        if signal_trigger and hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.request_profile())
+
+    def request_profile(self):
+        """다음 세대를 cProfile 로 잰다"""
+        self.requested = True
+
+    def start_generation(self, generation):
+        self.generation = generation
+        self.outside = {}
+        timer.reset()
+        if self.requested or generation in self.profile_generations:
+            self.requested = False
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        self.start = time.perf_counter()
+
+    def post_evaluate(self, config, population, species, best_genome):
+        self.evaluated = time.perf_counter()
+
+    def end_generation(self, config, population, species_set):
+        end = time.perf_counter()
+        evaluate = self.evaluated - self.start
+        phases = timer.reset()
+        phases["evaluate (other)"] = max(0.0, evaluate - sum(phases.values()))
+        phases.update(self.outside)
+        phases["reporters"] = max(0.0, end - self.evaluated - sum(self.outside.values()))
+        self.phases = phases
+
+        total = end - self.start
+        print("Profile: generation {0} took {1:.3f}s".format(self.generation, total))
+        for name, seconds in sorted(phases.items(), key=lambda item: -item[1]):
+            print("  {0:<18} {1:8.3f}s  {2:5.1%}".format(name, seconds, seconds / total if total else 0.0))
+        self.finish_profile()
+
+    def found_solution(self, config, generation, best):
+        self.finish_profile()
+
+    def finish_profile(self):
+        if self.profiler is None:
+            return
+        self.profiler.disable()
+        path = os.path.join(self.out_dir, "profile-gen{0}.pstats".format(self.generation))
+        self.profiler.dump_stats(path)
+        print("Profile: cProfile stats written to {0}".format(path))
+        pstats.Stats(path).sort_stats("cumulative").print_stats(self.top)
+        self.profiler = None
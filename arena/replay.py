@@ -0,0 +1,196 @@
+import argparse
+import base64
+import io
+import json
+import random
+
+import neat
+import numpy as np
+
+from .compact_genome import CompactGenome, connection_key
+from .metrics import read
+from .speciation import connection_code
+
+KIND = "replay"   # MetricsSink 기록 종류
+
+
+# --------------------------------
+# ▣ 세대별 평가 시드
+# --------------------------------
+def generation_seed(run_seed, generation):
+    """실행 시드 + 세대 번호 → 그 세대 평가 직전에 random.seed 할 값 (플랫폼 / 실행과 무관하게 같음)"""
+    return random.Random("{0}:{1}".format(run_seed, generation)).getrandbits(63)
+
+
+# --------------------------------
+# ▣ population 스냅샷 (genome 배열을 이어 붙여 압축)
+# --------------------------------
+def snapshot(genomes):
+    """
+    (id, genome) 목록 → base64 문자열 + 활성화 / 집계 함수 이름 목록.
+    노드 / 연결은 genome 안의 dict 순서 그대로 저장한다 (신경망 합산 순서가 같아야 fitness 가 비트 단위로 같음).
+    """
+    names = {"activation": [], "aggregation": []}
+
+    def code(kind, name):
+        if name not in names[kind]:
+            names[kind].append(name)
+        return names[kind].index(name)
+
+    keys, node_counts, conn_counts = [], [], []
+    node_keys, bias, response, activation, aggregation = [], [], [], [], []
+    conn_keys, weight, enabled = [], [], []
+    for genome_id, genome in genomes:
+        keys.append(genome_id)
+        nodes = genome.nodes
+        node_counts.append(len(nodes))
+        for k, n in nodes.items():
+            node_keys.append(k)
+            bias.append(n.bias)
+            response.append(n.response)
+            activation.append(code("activation", n.activation))
+            aggregation.append(code("aggregation", n.aggregation))
+        connections = genome.connections
+        conn_counts.append(len(connections))
+        for (i, o), c in connections.items():
+            conn_keys.append(connection_code(i, o))
+            weight.append(c.weight)
+            enabled.append(c.enabled)
+
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, keys=np.array(keys, dtype=np.int64),
+                        node_counts=np.array(node_counts, dtype=np.int64),
+                        conn_counts=np.array(conn_counts, dtype=np.int64),
+                        node_keys=np.array(node_keys, dtype=np.int64), bias=np.array(bias, dtype=float),
+                        response=np.array(response, dtype=float), activation=np.array(activation, dtype=np.int64),
+                        aggregation=np.array(aggregation, dtype=np.int64),
+                        conn_keys=np.array(conn_keys, dtype=np.int64), weight=np.array(weight, dtype=float),
+                        enabled=np.array(enabled, dtype=bool))
+    return base64.b64encode(buffer.getvalue()).decode("ascii"), names
+
+
+def restore(data, names, config):
+    """snapshot() 의 반대: config 의 genome 클래스로 (id, genome) 목록을 같은 순서로 만든다"""
+    arrays = np.load(io.BytesIO(base64.b64decode(data)), allow_pickle=False)
+    gc = config.genome_config
+    node_ends = np.cumsum(arrays["node_counts"])
+    conn_ends = np.cumsum(arrays["conn_counts"])
+    activation = np.array(names["activation"], dtype=object)[arrays["activation"]]
+    aggregation = np.array(names["aggregation"], dtype=object)[arrays["aggregation"]]
+
+    genomes = []
+    for row, key in enumerate(arrays["keys"].tolist()):
+        nodes = slice(node_ends[row] - arrays["node_counts"][row], node_ends[row])
+        conns = slice(conn_ends[row] - arrays["conn_counts"][row], conn_ends[row])
+        genome = config.genome_type(key)
+
+        if config.genome_type is CompactGenome:
+            genome.node_keys = arrays["node_keys"][nodes].copy()
+            genome.bias = arrays["bias"][nodes].copy()
+            genome.response = arrays["response"][nodes].copy()
+            genome.activation = activation[nodes].copy()
+            genome.aggregation = aggregation[nodes].copy()
+            genome.conn_keys = arrays["conn_keys"][conns].copy()
+            genome.weight = arrays["weight"][conns].copy()
+            genome.enabled = arrays["enabled"][conns].copy()
+        else:
+            for k, b, r, a, g in zip(arrays["node_keys"][nodes].tolist(), arrays["bias"][nodes].tolist(),
+                                     arrays["response"][nodes].tolist(), activation[nodes], aggregation[nodes]):
+                node = gc.node_gene_type(k)
+                node.bias, node.response, node.activation, node.aggregation = b, r, a, g
+                genome.nodes[k] = node
+            for code, w, e in zip(arrays["conn_keys"][conns].tolist(), arrays["weight"][conns].tolist(),
+                                  arrays["enabled"][conns].tolist()):
+                key_pair = connection_key(code)
+                connection = gc.connection_gene_type(key_pair)
+                connection.weight, connection.enabled = w, e
+                genome.connections[key_pair] = connection
+        genomes.append((key, genome))
+    return genomes
+
+
+# --------------------------------
+# ▣ 실행 중 기록
+# --------------------------------
+class ReplayLog(neat.reporting.BaseReporter):
+    """
+    p.add_reporter(log) + p.run(log.wrap(eval_genomes), n) 로 쓴다.
+    세대마다 평가 직전에 random.seed(generation_seed(run_seed, 세대)) 를 하고
+    평가가 끝나면 {실행 시드, 세대, 시나리오, config, 스냅샷, fitness} 한 줄을 sink 에 쓴다.
+    궤적은 저장하지 않는다 (replay() 가 같은 코드로 다시 시뮬레이션).
+    """
+
+    def __init__(self, sink, run_seed, scenario, config_path):
+        self.sink = sink
+        self.run_seed = run_seed
+        self.scenario = scenario
+        self.config_path = config_path
+        self.generation = 0
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def wrap(self, eval_genomes):
+        def recorded(genomes, config):
+            random.seed(generation_seed(self.run_seed, self.generation))
+            eval_genomes(genomes, config)
+            data, names = snapshot(genomes)
+            self.sink.write({"kind": KIND, "seed": self.run_seed, "generation": self.generation,
+                             "scenario": self.scenario, "config": self.config_path, "names": names,
+                             "genomes": data, "fitness": [genome.fitness for genome_id, genome in genomes]})
+            self.sink.flush()
+        return recorded
+
+
+# --------------------------------
+# ▣ 다시 시뮬레이션 / 검증
+# --------------------------------
+def find(log_path, generation):
+    for record in read(log_path, KIND):
+        if record["generation"] == generation:
+            return record
+    raise KeyError("Generation {0} is not in {1}".format(generation, log_path))
+
+
+def replay(log_path, generation, window=True, verify=False, config_path=None):
+    """
+    log_path 의 generation 세대를 같은 시드, 같은 시나리오 평가 함수로 다시 돌린다 (window 면 창에서).
+    verify 면 다시 계산한 fitness 가 기록과 비트 단위로 같은지 보고 (같으면 True) 를 돌려준다.
+    """
+    from .cli import eval_function
+    from .evolution import load_config
+
+    record = find(log_path, generation)
+    config = load_config(config_path or record["config"])
+    genomes = restore(record["genomes"], record["names"], config)
+
+    random.seed(generation_seed(record["seed"], generation))
+    eval_function(record["scenario"], "windowed" if window else "headless")(genomes, config)
+    fitness = [genome.fitness for genome_id, genome in genomes]
+
+    if not verify:
+        return fitness
+    mismatched = [(genome_id, logged, genome.fitness)
+                  for (genome_id, genome), logged in zip(genomes, record["fitness"]) if genome.fitness != logged]
+    print("Replay: generation {0}, {1} genomes, {2} fitness mismatches".format(
+        generation, len(genomes), len(mismatched)))
+    for genome_id, logged, now in mismatched[:10]:
+        print("  genome {0}: logged {1!r}, replayed {2!r}".format(genome_id, logged, now))
+    return not mismatched
+
+
+# python -m arena.replay --log run.jsonl --generation 7 [--offscreen] [--verify]
+# (기록: python -m arena --scenario eat2+pre2 --log run.jsonl)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--log", required=True)
+    parser.add_argument("--generation", type=int, required=True)
+    parser.add_argument("--offscreen", action="store_true", help="창 없이 다시 시뮬레이션")
+    parser.add_argument("--verify", action="store_true", help="다시 계산한 fitness 가 기록과 같은지 확인")
+    parser.add_argument("--config", help="기본: 기록에 있는 config 경로")
+    args = parser.parse_args()
+
+    result = replay(args.log, args.generation, not args.offscreen, args.verify, args.config)
+    if args.verify:
+        raise SystemExit(0 if result else 1)
+    print(json.dumps(result))
@@ -0,0 +1,13 @@
+"""
+기존 스크립트(204(input,hidden,output)/, second/, 11_24/)의 규칙을 하나의 배열 기반 core 위에 선언으로 다시 만든 것.
+- core: 월드 여러 개 x 생명체 여러 마리를 한 번에 진행하는 Arena, 시나리오 선언 Scenario
+- parts: 감지(NearestDelta, NearestDistanceAngle) / 이동(FourWay, RotateThrust) / 보상(Rewards) 부품
+- catalog: 기존 스크립트별 선언 (SCENARIOS)
+- env: 같은 규칙을 다른 최적화기 / 외부 에이전트가 쓰는 gym 스타일 벡터 환경 (VecEnv)
+새 시나리오는 부품을 골라 Scenario(...) 하나만 적으면 된다.
+실행: python -m arena --scenario eat2+pre2
+"""
+from .catalog import SCENARIOS
+from .core import Arena, CounterRandom, Scenario, draw
+from .env import VecEnv
+from .parts import FourWay, NearestDelta, NearestDistanceAngle, Rewards, RotateThrust
@@ -0,0 +1,43 @@
+from .core import Scenario
+from .parts import FourWay, NearestDelta, NearestDistanceAngle, Rewards, RotateThrust
+
+# 기존 스크립트별 config (저장소 루트 기준)
+CONFIG_204 = "204(input,hidden,output)/config-feedforward.txt"
+CONFIG_SECOND = "second/config-feedforward.txt"
+CONFIG_11_24 = "11_24/config-feedforward.txt"
+
+
+# --------------------------------
+# ▣ 기존 스크립트 → 시나리오 선언
+# --------------------------------
+# 204(input,hidden,output)/6_visualization_network.py 는 빈 파일이라 항목이 없다.
+SCENARIOS = {s.name: s for s in [
+    # 먹이 하나, 수명 없음, 600 프레임 동안 아무도 못 먹으면 끝 (원본처럼 전체 프레임 제한은 없음)
+    Scenario("1_test", CONFIG_204, [NearestDelta("food")], FourWay(),
+             Rewards(survive=0.1, eat=10, caught=0, eat_life=0),
+             start_life=None, max_frames=None, idle_limit=600),
+    # 먹이 하나 + 수명
+    Scenario("2_eat", CONFIG_204, [NearestDelta("food")], FourWay(),
+             Rewards(survive=0.1, eat=20, eat_life=300)),
+    Scenario("3_eat_add_number", CONFIG_204, [NearestDelta("food")], FourWay(),
+             Rewards(survive=0.1, eat=20, eat_life=300)),
+    # 먹이 여러 개, 가장 가까운 먹이의 (dx, dy)
+    Scenario("4_multiEating", CONFIG_204, [NearestDelta("food")], FourWay(),
+             Rewards(survive=0.1, eat=20, eat_life=300), food_count=5),
+    Scenario("5_Visualization", CONFIG_204, [NearestDelta("food")], FourWay(),
+             Rewards(survive=0.1, eat=20, eat_life=300), food_count=3, max_frames=600),
+    # 먹이 2개 + 포식자, 가까운 먹이 2개 / 포식자 2마리의 (dx, dy)
+    Scenario("eat+predetor1", CONFIG_SECOND, [NearestDelta("food", 2), NearestDelta("predator", 2)], FourWay(),
+             Rewards(survive=0.05, eat=100, caught=-30, eat_life=600),
+             food_count=2, num_predators=2, predator_vel=6),
+    Scenario("eat2+pre2", CONFIG_SECOND, [NearestDelta("food", 2), NearestDelta("predator", 2)], FourWay(),
+             Rewards(survive=0.1, eat=100, caught=-20, eat_life=600),
+             food_count=2, num_predators=1, max_frames=1200),
+    # 포식자 1마리, 가장 가까운 먹이 / 포식자 하나씩
+    Scenario("onepr+straigtmoving", CONFIG_11_24, [NearestDelta("food"), NearestDelta("predator")], FourWay(),
+             Rewards(survive=0.01, eat=100, caught=-20, eat_life=600),
+             food_count=2, num_predators=1, max_frames=1200),
+    Scenario("angle", CONFIG_11_24, [NearestDistanceAngle("food"), NearestDistanceAngle("predator")],
+             RotateThrust(), Rewards(survive=0.01, eat=100, caught=-20, eat_life=600),
+             food_count=2, num_predators=1, max_frames=1200),
+]}
@@ -0,0 +1,317 @@
+import math
+import random
+
+import numpy as np
+
+from ..batchnet import BatchNetwork
+
+# --- 공통 월드 설정 (기존 스크립트 값) ---
+WIN_WIDTH = 800
+WIN_HEIGHT = 600
+FPS = 60
+CREATURE_SIZE = 20    # 생명체 사각형 한 변 (위치는 왼쪽 위 좌표)
+FOOD_RAD = 10
+PREDATOR_RAD = 15
+MARGIN = 50           # 먹이 / 포식자는 벽에서 이만큼 떨어진 곳에 생김
+EAT_DISTANCE = 20     # 생명체 좌표와 먹이 중심 거리가 이보다 작으면 먹음
+DIRECTIONS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=float)   # 포식자 이동 방향
+
+
+# --------------------------------
+# ▣ 월드별 난수 (월드마다 독립, 시드만으로 재현)
+# --------------------------------
+_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix(z):
+    """splitmix64 마무리 단계 (uint64 배열)"""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+class CounterRandom:
+    """
+    월드마다 (시드, 카운터) 로 splitmix64 값을 만든다.
+    한 번에 (월드 수, m) 개를 배열 연산으로 뽑으므로 월드별 Generator 루프가 없고,
+    어떤 월드를 다시 시작해도 다른 월드의 난수열은 바뀌지 않는다.
+    """
+
+    def __init__(self, seeds):
+        self.keys = np.zeros(len(seeds), dtype=np.uint64)
+        self.counter = np.zeros(len(seeds), dtype=np.uint64)
+        self.reset(seeds, np.ones(len(seeds), dtype=bool))
+
+    def reset(self, seeds, mask):
+        with np.errstate(over="ignore"):
+            self.keys[mask] = _mix(np.asarray(seeds, dtype=np.uint64)[mask] * _GAMMA + _GAMMA)
+        self.counter[mask] = 0
+
+    def uniform(self, m, mask=None):
+        """[0, 1) 균등분포 (월드 수, m). mask 가 있으면 그 월드만 카운터가 넘어감 (나머지 값은 쓰지 말 것)"""
+        steps = self.counter[:, None] + np.arange(1, m + 1, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            z = _mix(self.keys[:, None] + steps * _GAMMA)
+        if mask is None:
+            self.counter += np.uint64(m)
+        else:
+            self.counter[mask] += np.uint64(m)
+        return (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+    def integers(self, low, high, m, mask=None):
+        """low 이상 high 이하 정수 (random.randint 처럼 양 끝 포함), float 배열"""
+        return low + np.floor(self.uniform(m, mask) * (high - low + 1))
+
+
+# --------------------------------
+# ▣ 시나리오 (선언: 월드 / 감지 / 이동 / 보상)
+# --------------------------------
+class Scenario:
+    """
+    기존 스크립트 하나의 규칙을 부품 조합으로 적는다.
+    sensors: parts.NearestDelta / NearestDistanceAngle 같은 감지기 목록 (입력 순서대로 이어 붙임)
+    movement: parts.FourWay / RotateThrust, rewards: parts.Rewards
+    start_life 가 None 이면 수명이 줄지 않음, idle_limit 이 있으면 그 프레임 동안 아무도 못 먹으면 끝 (1_test).
+    max_frames 가 None 이면 프레임 수 제한 없음 (다른 종료 조건으로만 끝남).
+    """
+
+    def __init__(self, name, config, sensors, movement, rewards, food_count=1, num_predators=0,
+                 predator_vel=5, max_frames=1800, start_life=600, idle_limit=None):
+        self.name = name
+        self.config = config          # 저장소 루트 기준 config 경로
+        self.sensors = sensors
+        self.movement = movement
+        self.rewards = rewards
+        self.food_count = food_count
+        self.num_predators = num_predators
+        self.predator_vel = predator_vel
+        self.max_frames = max_frames
+        self.start_life = start_life
+        self.idle_limit = idle_limit
+        self.num_inputs = sum(sensor.size for sensor in sensors)
+        self.num_outputs = 4
+
+    def make(self, num_worlds, num_creatures, seeds=None):
+        """seeds 가 없으면 파이썬 random 에서 뽑는다 (random.seed 하나로 재현)"""
+        if seeds is None:
+            seeds = [random.getrandbits(63) for _ in range(num_worlds)]
+        return Arena(self, num_worlds, num_creatures, seeds)
+
+    def check(self, config):
+        gc = config.genome_config
+        if (gc.num_inputs, gc.num_outputs) != (self.num_inputs, self.num_outputs):
+            raise ValueError("Scenario {0} needs {1} inputs / {2} outputs, config has {3} / {4}".format(
+                self.name, self.num_inputs, self.num_outputs, gc.num_inputs, gc.num_outputs))
+
+    def eval_genomes(self, genomes, config, screen=None, observer=None, max_frames=None):
+        """
+        genome 들을 한 월드에 풀어놓고 fitness 를 계산한다 (신경망은 BatchNetwork 로 한 번에).
+        screen 이 있으면 그리면서 FPS 로, observer(프레임, arena) 는 매 프레임 부른다.
+        """
+        self.check(config)
+        arena = self.make(1, len(genomes))
+        net = BatchNetwork([(genomes, config)])
+        fitness = np.zeros(len(genomes))
+        limit = self.max_frames if max_frames is None else max_frames
+
+        if screen is not None:
+            import pygame
+            clock = pygame.time.Clock()
+            font = pygame.font.SysFont("comicsans", 30)
+
+        while not arena.done[0] and (limit is None or arena.frame[0] < limit):
+            outputs, = net.activate([arena.observe()[0]])
+            fitness += arena.step(outputs[None])[0]
+            if observer is not None:
+                observer(int(arena.frame[0]), arena)
+            if screen is not None:
+                text = f"{self.name} | Alive: {int(arena.alive[0].sum())}"
+                if limit is not None:
+                    text += f" | Time Left: {max(0, (limit - int(arena.frame[0])) // FPS)}s"
+                draw(screen, arena, font, text)
+                clock.tick(FPS)
+
+        for (genome_id, genome), f in zip(genomes, fitness):
+            genome.fitness = float(f)
+
+
+# --------------------------------
+# ▣ 월드 상태 (월드 수 x 생명체 수 배열)
+# --------------------------------
+class Arena:
+    """
+    같은 규칙의 월드 여러 개를 한꺼번에 진행한다. 월드마다 먹이 / 포식자는 따로, 생명체는 num_creatures 마리.
+    observe() → 신경망 입력 (월드, 생명체, 입력 수), step(출력) → 이번 프레임 보상 (월드, 생명체).
+    한 프레임 안의 규칙 순서: 이동 → 수명 -1 → 포식자 이동 → 잡힘 → 사망 → 생존 보상 → 먹기 → 먹이 다시 생성.
+    기존 스크립트와 달리 모든 생명체가 동시에 움직이고, 같은 먹이에 여럿이 닿으면 번호가 큰 생명체가 먹는다
+    (스크립트의 역순 루프에서 먼저 처리되는 쪽).
+    """
+
+    def __init__(self, scenario, num_worlds, num_creatures, seeds):
+        self.scenario = scenario
+        self.width = WIN_WIDTH
+        self.height = WIN_HEIGHT
+        shape = (num_worlds, num_creatures)
+        self.x = np.zeros(shape)
+        self.y = np.zeros(shape)
+        self.angle = np.zeros(shape)
+        self.life = np.zeros(shape)
+        self.alive = np.zeros(shape, dtype=bool)
+        self.eaten = np.zeros(shape, dtype=np.int64)
+        self.food_x = np.zeros((num_worlds, scenario.food_count))
+        self.food_y = np.zeros((num_worlds, scenario.food_count))
+        self.predator_x = np.zeros((num_worlds, scenario.num_predators))
+        self.predator_y = np.zeros((num_worlds, scenario.num_predators))
+        self.predator_dir = np.zeros((num_worlds, scenario.num_predators, 2))
+        self.predator_timer = np.zeros((num_worlds, scenario.num_predators))
+        self.frame = np.zeros(num_worlds, dtype=np.int64)
+        self.idle = np.zeros(num_worlds, dtype=np.int64)
+        self.rng = CounterRandom(seeds)
+        self.reset(seeds)
+
+    @property
+    def num_worlds(self):
+        return self.x.shape[0]
+
+    def reset(self, seeds, mask=None):
+        """mask 인 월드만 seeds 로 처음 상태로 (mask 가 없으면 전부)"""
+        s = self.scenario
+        mask = np.ones(self.num_worlds, dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        self.rng.reset(seeds, mask)
+        rows = mask[:, None]
+
+        self.x[mask] = WIN_WIDTH / 2
+        self.y[mask] = WIN_HEIGHT / 2
+        self.angle = np.where(rows, self.rng.uniform(self.x.shape[1], mask) * 2 * math.pi, self.angle)
+        self.life[mask] = math.inf if s.start_life is None else s.start_life
+        self.alive[mask] = True
+        self.eaten[mask] = 0
+        self.frame[mask] = 0
+        self.idle[mask] = 0
+
+        n, k = s.food_count, s.num_predators
+        self.food_x = np.where(rows, self.rng.integers(MARGIN, WIN_WIDTH - MARGIN, n, mask), self.food_x)
+        self.food_y = np.where(rows, self.rng.integers(MARGIN, WIN_HEIGHT - MARGIN, n, mask), self.food_y)
+        self.predator_x = np.where(rows, self.rng.integers(MARGIN, WIN_WIDTH - MARGIN, k, mask), self.predator_x)
+        self.predator_y = np.where(rows, self.rng.integers(MARGIN, WIN_HEIGHT - MARGIN, k, mask), self.predator_y)
+        directions = DIRECTIONS[self.rng.integers(0, 3, k, mask).astype(np.int64)]
+        self.predator_dir = np.where(rows[:, :, None], directions, self.predator_dir)
+        self.predator_timer = np.where(rows, self.rng.integers(30, 90, k, mask), self.predator_timer)
+
+    @property
+    def done(self):
+        s = self.scenario
+        done = ~self.alive.any(axis=1)
+        if s.max_frames is not None:
+            done |= self.frame >= s.max_frames
+        if s.idle_limit is not None:
+            done |= self.idle >= s.idle_limit
+        return done
+
+    def observe(self):
+        return np.concatenate([sensor(self) for sensor in self.scenario.sensors], axis=2)
+
+    # ——————————————
+    # 한 프레임
+    # ——————————————
+    def move_predators(self):
+        """정해진 방향으로 가다가 벽에 닿거나 타이머가 끝나면 방향을 새로 고른다 (second/ 의 Predator)"""
+        k = self.scenario.num_predators
+        if k == 0:
+            return
+        self.predator_timer -= 1
+        hit = ((self.predator_x <= PREDATOR_RAD) | (self.predator_x >= WIN_WIDTH - PREDATOR_RAD) |
+               (self.predator_y <= PREDATOR_RAD) | (self.predator_y >= WIN_HEIGHT - PREDATOR_RAD))
+        turn = hit | (self.predator_timer <= 0)
+        new_dir = DIRECTIONS[self.rng.integers(0, 3, k).astype(np.int64)]
+        new_timer = self.rng.integers(30, 90, k)
+        self.predator_dir = np.where(turn[:, :, None], new_dir, self.predator_dir)
+        self.predator_timer = np.where(turn, new_timer, self.predator_timer)
+
+        vel = self.scenario.predator_vel
+        self.predator_x = np.clip(self.predator_x + self.predator_dir[:, :, 0] * vel,
+                                  PREDATOR_RAD, WIN_WIDTH - PREDATOR_RAD)
+        self.predator_y = np.clip(self.predator_y + self.predator_dir[:, :, 1] * vel,
+                                  PREDATOR_RAD, WIN_HEIGHT - PREDATOR_RAD)
+
+    def step(self, outputs):
+        """outputs: (월드, 생명체, 4). 반환: 이번 프레임 보상 (월드, 생명체), 죽어 있던 생명체는 0"""
+        s = self.scenario
+        r = s.rewards
+        alive = self.alive
+        reward = np.zeros(self.x.shape)
+        self.frame += 1
+        self.idle += 1
+
+        # 1. 이동 (살아있는 생명체만)
+        x, y, angle = self.x.copy(), self.y.copy(), self.angle.copy()
+        s.movement(self, np.asarray(outputs) > 0.5)
+        self.x = np.where(alive, np.clip(self.x, 0, WIN_WIDTH - CREATURE_SIZE), x)
+        self.y = np.where(alive, np.clip(self.y, 0, WIN_HEIGHT - CREATURE_SIZE), y)
+        self.angle = np.where(alive, self.angle, angle)
+        self.life[alive] -= 1
+
+        # 2. 포식자 이동 + 잡힘
+        self.move_predators()
+        if s.num_predators:
+            dx = self.predator_x[:, None, :] - self.x[:, :, None]
+            dy = self.predator_y[:, None, :] - self.y[:, :, None]
+            reach = CREATURE_SIZE / 2 + PREDATOR_RAD
+            caught = alive & ((dx * dx + dy * dy) < reach * reach).any(axis=2)
+            self.life[caught] = 0
+            reward[caught] += r.caught
+
+        # 3. 사망, 생존 보상
+        dead = alive & (self.life <= 0)
+        self.alive = alive & ~dead
+        reward[self.alive] += r.survive
+
+        # 4. 먹기: 가장 가까운 먹이가 EAT_DISTANCE 안이면, 먹이 하나는 한 마리만
+        fx = self.food_x[:, None, :] - self.x[:, :, None]
+        fy = self.food_y[:, None, :] - self.y[:, :, None]
+        d2 = fx * fx + fy * fy
+        target = d2.argmin(axis=2)
+        near = self.alive & (np.take_along_axis(d2, target[:, :, None], axis=2)[:, :, 0] < EAT_DISTANCE ** 2)
+        worlds, creatures = np.nonzero(near)
+        claim = np.full(self.food_x.shape, -1)
+        np.maximum.at(claim, (worlds, target[worlds, creatures]), creatures)
+        eats = np.zeros(self.x.shape, dtype=bool)
+        eats[worlds, creatures] = claim[worlds, target[worlds, creatures]] == creatures
+        reward[eats] += r.eat
+        self.life[eats] += r.eat_life
+        self.eaten[eats] += 1
+
+        # 5. 먹힌 먹이는 새 위치로, 먹은 월드는 idle 타이머 리셋
+        eaten_food = np.zeros(self.food_x.shape, dtype=bool)
+        worlds, creatures = np.nonzero(eats)
+        eaten_food[worlds, target[worlds, creatures]] = True
+        self.food_x = np.where(eaten_food, self.rng.integers(MARGIN, WIN_WIDTH - MARGIN, s.food_count), self.food_x)
+        self.food_y = np.where(eaten_food, self.rng.integers(MARGIN, WIN_HEIGHT - MARGIN, s.food_count), self.food_y)
+        self.idle[eats.any(axis=1)] = 0
+        return reward
+
+
+# --------------------------------
+# ▣ 그리기 (pygame 은 여기서만 import)
+# --------------------------------
+def draw(screen, arena, font, text, world=0):
+    import pygame
+
+    screen.fill((0, 0, 0))
+    for fx, fy in zip(arena.food_x[world], arena.food_y[world]):
+        pygame.draw.circle(screen, (255, 0, 0), (int(fx), int(fy)), FOOD_RAD)
+    for px, py in zip(arena.predator_x[world], arena.predator_y[world]):
+        pygame.draw.circle(screen, (0, 0, 255), (int(px), int(py)), PREDATOR_RAD)
+
+    heading = arena.scenario.movement.heading
+    for i in np.flatnonzero(arena.alive[world]):
+        x, y = arena.x[world, i], arena.y[world, i]
+        green = int(255 * min(1.0, arena.life[world, i] / 600))
+        pygame.draw.rect(screen, (0, green, 0), (x, y, CREATURE_SIZE, CREATURE_SIZE))
+        if heading:
+            cx, cy = x + CREATURE_SIZE / 2, y + CREATURE_SIZE / 2
+            a = arena.angle[world, i]
+            pygame.draw.line(screen, (255, 255, 255), (cx, cy), (cx + math.cos(a) * 15, cy + math.sin(a) * 15), 2)
+
+    screen.blit(font.render(text, 1, (255, 255, 255)), (10, 10))
+    pygame.display.update()
@@ -0,0 +1,88 @@
+import random
+import time
+
+import numpy as np
+
+from .catalog import SCENARIOS
+
+# --- 벡터 환경 설정 ---
+NUM_ENVS = 1024
+
+
+# --------------------------------
+# ▣ gym 스타일 벡터 환경 (월드 N 개, 월드마다 에이전트 1마리)
+# --------------------------------
+class VecEnv:
+    """
+    Scenario 규칙의 월드 num_envs 개를 Arena 하나로 한꺼번에 진행한다 (월드별 파이썬 루프 없음).
+        env = VecEnv("eat2+pre2", 4096)
+        obs = env.reset(seeds)                       # (N, 입력 수)
+        obs, reward, done, info = env.step(actions)  # actions: (N, 4), 0.5 초과면 누름
+    auto_reset 이면 끝난 월드는 step 안에서 바로 다시 시작하고 (다음 시드 = 처음 시드 + N x 에피소드 번호),
+    그 월드의 마지막 관측은 info["final_observation"], 시간 초과로 끝난 것은 info["truncated"] 에 둔다.
+    같은 seeds 와 같은 actions 면 결과가 항상 같다.
+    """
+
+    def __init__(self, scenario, num_envs=NUM_ENVS, auto_reset=True):
+        self.scenario = SCENARIOS[scenario] if isinstance(scenario, str) else scenario
+        self.num_envs = num_envs
+        self.auto_reset = auto_reset
+        self.observation_size = self.scenario.num_inputs
+        self.action_size = self.scenario.num_outputs
+        self.seeds = np.zeros(num_envs, dtype=np.uint64)
+        self.episodes = np.zeros(num_envs, dtype=np.uint64)
+        self.arena = None
+
+    def reset(self, seeds=None):
+        """seeds: 길이 N (없으면 파이썬 random 에서). 반환: 관측 (N, 입력 수)"""
+        if seeds is None:
+            seeds = [random.getrandbits(63) for _ in range(self.num_envs)]
+        self.seeds = np.asarray(seeds, dtype=np.uint64)
+        if len(self.seeds) != self.num_envs:
+            raise ValueError("Expected {0} seeds, got {1}".format(self.num_envs, len(self.seeds)))
+        self.episodes[:] = 0
+        if self.arena is None:
+            self.arena = self.scenario.make(self.num_envs, 1, self.seeds)
+        else:
+            self.arena.reset(self.seeds)
+        return self.observe()
+
+    def observe(self):
+        return self.arena.observe()[:, 0]
+
+    def step(self, actions):
+        """
+        actions: (N, 4). 반환: 관측 (N, 입력 수), 보상 (N,), done (N,), info
+        done 은 에이전트가 죽었거나 시간이 다 된 월드.
+        """
+        arena = self.arena
+        reward = arena.step(np.asarray(actions).reshape(self.num_envs, 1, self.action_size))[:, 0]
+        done = arena.done
+        info = {"truncated": done & arena.alive[:, 0], "frame": arena.frame.copy()}
+
+        obs = self.observe()
+        if self.auto_reset and done.any():
+            info["final_observation"] = obs.copy()
+            self.episodes[done] += np.uint64(1)
+            with np.errstate(over="ignore"):
+                arena.reset(self.seeds + np.uint64(self.num_envs) * self.episodes, done)
+            obs = self.observe()
+        return obs, reward, done, info
+
+
+def throughput(scenario="eat2+pre2", num_envs=NUM_ENVS, steps=200, seed=0):
+    """무작위 행동으로 steps 번 진행 → 초당 (월드 x 프레임) 수"""
+    env = VecEnv(scenario, num_envs)
+    env.reset(np.arange(num_envs) + seed)
+    actions = np.random.default_rng(seed).random((steps, num_envs, env.action_size))
+    start = time.perf_counter()
+    for t in range(steps):
+        env.step(actions[t])
+    return num_envs * steps / (time.perf_counter() - start)
+
+
+# python -m arena.scenarios.env   (벡터 환경 처리량)
+if __name__ == "__main__":
+    for name in ("4_multiEating", "eat2+pre2"):
+        for n in (256, 4096, 16384):
+            print("{0:<14} envs {1:6d}  {2:12,.0f} env-steps/s".format(name, n, throughput(name, n)))
@@ -0,0 +1,109 @@
+import math
+
+import numpy as np
+
+# 모든 부품은 (월드 수, 생명체 수, ...) 배열을 한 번에 다룬다 (월드 / 생명체별 파이썬 루프 없음)
+
+
+# --------------------------------
+# ▣ 감지 (신경망 입력)
+# --------------------------------
+def _nearest(arena, kind, k):
+    """
+    kind("food" / "predator") 중 가까운 k 개의 (dx, dy, 거리).
+    대상이 k 개보다 적으면 모자란 칸은 has=False.
+    반환: dx, dy, dist, has  각각 (월드, 생명체, k)
+    """
+    tx, ty = (arena.food_x, arena.food_y) if kind == "food" else (arena.predator_x, arena.predator_y)
+    dx = tx[:, None, :] - arena.x[:, :, None]
+    dy = ty[:, None, :] - arena.y[:, :, None]
+    d2 = dx * dx + dy * dy
+    n = min(k, tx.shape[1])
+    order = np.argsort(d2, axis=2, kind="stable")[:, :, :n]
+
+    shape = arena.x.shape + (k,)
+    out_dx, out_dy, out_dist = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+    has = np.zeros(shape, dtype=bool)
+    out_dx[:, :, :n] = np.take_along_axis(dx, order, axis=2)
+    out_dy[:, :, :n] = np.take_along_axis(dy, order, axis=2)
+    out_dist[:, :, :n] = np.sqrt(np.take_along_axis(d2, order, axis=2))
+    has[:, :, :n] = True
+    return out_dx, out_dy, out_dist, has
+
+
+class NearestDelta:
+    """가까운 k 개 대상까지의 (dx, dy) 를 k 쌍. 없으면 0 (1_test ~ eat2+pre2 의 입력)"""
+
+    def __init__(self, kind, k=1):
+        self.kind = kind
+        self.k = k
+        self.size = 2 * k
+
+    def __call__(self, arena):
+        dx, dy, dist, has = _nearest(arena, self.kind, self.k)
+        return np.stack([dx, dy], axis=3).reshape(arena.x.shape + (self.size,))
+
+
+class NearestDistanceAngle:
+    """가까운 k 개 대상까지의 (거리, 바라보는 방향 기준 상대 각도 -pi~pi) (angle.py 의 입력)"""
+
+    def __init__(self, kind, k=1):
+        self.kind = kind
+        self.k = k
+        self.size = 2 * k
+
+    def __call__(self, arena):
+        dx, dy, dist, has = _nearest(arena, self.kind, self.k)
+        angle = np.arctan2(dy, dx) - arena.angle[:, :, None]
+        angle = (angle + math.pi) % (2 * math.pi) - math.pi
+        angle[~has] = 0.0
+        return np.stack([dist, angle], axis=3).reshape(arena.x.shape + (self.size,))
+
+
+# --------------------------------
+# ▣ 이동 (신경망 출력 4개, 0.5 초과면 누름)
+# --------------------------------
+class FourWay:
+    """output = [상, 하, 좌, 우]"""
+    heading = False   # 그릴 때 방향선 없음
+
+    def __init__(self, vel=5):
+        self.vel = vel
+
+    def __call__(self, arena, press):
+        arena.x += self.vel * (press[:, :, 3].astype(float) - press[:, :, 2])
+        arena.y += self.vel * (press[:, :, 1].astype(float) - press[:, :, 0])
+
+
+class RotateThrust:
+    """output = [왼쪽 회전, 오른쪽 회전, 전진, 후진] (11_24/angle.py, 둘 다 누르면 후진)"""
+    heading = True
+
+    def __init__(self, vel=5, rotation_rate=0.15, thrust=1.0):
+        self.vel = vel
+        self.rotation_rate = rotation_rate
+        self.thrust = thrust
+
+    def __call__(self, arena, press):
+        arena.angle = (arena.angle - self.rotation_rate * press[:, :, 0]) % (2 * math.pi)
+        arena.angle = (arena.angle + self.rotation_rate * press[:, :, 1]) % (2 * math.pi)
+        direction = np.where(press[:, :, 3], -1.0, np.where(press[:, :, 2], 1.0, 0.0))
+        speed = self.vel * self.thrust * direction
+        arena.x += np.cos(arena.angle) * speed
+        arena.y += np.sin(arena.angle) * speed
+
+
+# --------------------------------
+# ▣ 보상
+# --------------------------------
+class Rewards:
+    """
+    survive: 살아있는 프레임마다, eat: 먹이 하나, caught: 포식자에게 잡힘 (보통 음수),
+    eat_life: 먹이를 먹으면 늘어나는 수명 (프레임)
+    """
+
+    def __init__(self, survive=0.1, eat=20, caught=-20, eat_life=300):
+        self.survive = survive
+        self.eat = eat
+        self.caught = caught
+        self.eat_life = eat_life
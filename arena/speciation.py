@@ -0,0 +1,233 @@
+import itertools
+
+import numpy as np
+from neat.species import DefaultSpeciesSet, Species
+
+# 연결 key (in, out) 를 정수 하나로: 노드 번호는 |id| < 2**30 이라고 가정
+_KEY_OFFSET = 2 ** 30
+
+
+def connection_code(in_key, out_key):
+    return (in_key + _KEY_OFFSET) * (2 * _KEY_OFFSET) + (out_key + _KEY_OFFSET)
+
+
+# --------------------------------
+# ▣ genome → 정렬된 innovation(key) 배열
+# --------------------------------
+def _genes(genome, codes):
+    """
+    genome 하나의 노드/연결 유전자를 key 순으로 정렬한 값 목록.
+    genome 은 만들어진 뒤 바뀌지 않으므로 (엘리트는 같은 key 로 다음 세대에 그대로 감)
+    key 별로 한 번만 만든다.
+    """
+    genome_nodes, genome_connections = genome.nodes, genome.connections   # CompactGenome 은 읽을 때마다 새 dict
+    node_keys = sorted(genome_nodes)
+    nodes = [genome_nodes[k] for k in node_keys]
+    conn_keys = sorted(genome_connections)
+    conns = [genome_connections[k] for k in conn_keys]
+    return (node_keys,
+            [n.bias for n in nodes],
+            [n.response for n in nodes],
+            [codes.setdefault(n.activation, len(codes)) for n in nodes],
+            [codes.setdefault(n.aggregation, len(codes)) for n in nodes],
+            [connection_code(i, o) for i, o in conn_keys],
+            [c.weight for c in conns],
+            [c.enabled for c in conns])
+
+
+class _Flat:
+    """여러 genome 의 유전자를 이어 붙인 배열 (owner = genome 위치)"""
+
+    NODE_FIELDS = ("node_keys", "bias", "response", "activation", "aggregation")
+    CONN_FIELDS = ("conn_keys", "weight", "enabled")
+    DTYPES = (np.int64, float, float, np.int64, np.int64, np.int64, float, bool)
+
+    def __init__(self, encoded):
+        self.n = len(encoded)
+        self.node_count = np.array([len(e[0]) for e in encoded], dtype=np.int64)
+        self.conn_count = np.array([len(e[5]) for e in encoded], dtype=np.int64)
+        self.node_owner = np.repeat(np.arange(self.n), self.node_count)
+        self.conn_owner = np.repeat(np.arange(self.n), self.conn_count)
+
+        for column, (name, dtype) in enumerate(zip(self.NODE_FIELDS + self.CONN_FIELDS, self.DTYPES)):
+            values = itertools.chain.from_iterable(e[column] for e in encoded)
+            setattr(self, name, np.fromiter(values, dtype=dtype))
+
+    def subset(self, keep):
+        """keep(bool, genome 위치별) 인 genome 만 남긴 _Flat"""
+        sub = _Flat.__new__(_Flat)
+        remap = np.cumsum(keep) - 1
+        node_sel = keep[self.node_owner]
+        conn_sel = keep[self.conn_owner]
+
+        sub.n = int(keep.sum())
+        sub.node_count = self.node_count[keep]
+        sub.conn_count = self.conn_count[keep]
+        sub.node_owner = remap[self.node_owner[node_sel]]
+        sub.conn_owner = remap[self.conn_owner[conn_sel]]
+        for name in self.NODE_FIELDS:
+            setattr(sub, name, getattr(self, name)[node_sel])
+        for name in self.CONN_FIELDS:
+            setattr(sub, name, getattr(self, name)[conn_sel])
+        return sub
+
+
+def _match(rep_keys, keys):
+    """rep_keys 에도 있는 keys 의 위치와, 그 유전자가 rep_keys 의 몇 번째인지"""
+    if len(rep_keys) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    pos = np.minimum(np.searchsorted(rep_keys, keys), len(rep_keys) - 1)
+    hit = np.flatnonzero(rep_keys[pos] == keys)
+    return hit, pos[hit]
+
+
+def batch_distance(rep, flat, config):
+    """
+    대표 genome 하나(rep: genome 1개짜리 _Flat)와 flat 에 든 모든 genome 사이의 거리.
+    DefaultGenome.distance 와 같은 식을 유전자 단위 배열 연산으로 계산한다.
+    """
+    wc = config.compatibility_weight_coefficient
+    dc = config.compatibility_disjoint_coefficient
+    distance = np.zeros(flat.n)
+
+    # 노드
+    hit, pos = _match(rep.node_keys, flat.node_keys)
+    d = (np.abs(flat.bias[hit] - rep.bias[pos]) + np.abs(flat.response[hit] - rep.response[pos])
+         + (flat.activation[hit] != rep.activation[pos])
+         + (flat.aggregation[hit] != rep.aggregation[pos])) * wc
+    homologous = np.bincount(flat.node_owner[hit], weights=d, minlength=flat.n)
+    matched = np.bincount(flat.node_owner[hit], minlength=flat.n)
+    disjoint = flat.node_count + len(rep.node_keys) - 2 * matched
+    size = np.maximum(flat.node_count, len(rep.node_keys))
+    has = size > 0
+    distance[has] += (homologous[has] + dc * disjoint[has]) / size[has]
+
+    # 연결
+    hit, pos = _match(rep.conn_keys, flat.conn_keys)
+    d = (np.abs(flat.weight[hit] - rep.weight[pos]) + (flat.enabled[hit] != rep.enabled[pos])) * wc
+    homologous = np.bincount(flat.conn_owner[hit], weights=d, minlength=flat.n)
+    matched = np.bincount(flat.conn_owner[hit], minlength=flat.n)
+    disjoint = flat.conn_count + len(rep.conn_keys) - 2 * matched
+    size = np.maximum(flat.conn_count, len(rep.conn_keys))
+    has = size > 0
+    distance[has] += (homologous[has] + dc * disjoint[has]) / size[has]
+
+    return distance
+
+
+# --------------------------------
+# ▣ 배열 계산 + 거리 기억을 쓰는 종 분류
+# --------------------------------
+class CachedSpeciesSet(DefaultSpeciesSet):
+    """
+    DefaultSpeciesSet 과 같은 종 분류 규칙이지만
+    - 대표 하나 대 population 전체 거리를 batch_distance 로 한 번에 계산하고
+    - 한 번 계산한 (대표, genome) 거리는 둘 다 살아있는 동안 다음 세대에도 다시 쓴다.
+    config 의 [DefaultSpeciesSet] 섹션 값을 그대로 쓴다 (evolution.load_config 참고).
+    """
+
+    def __init__(self, config, reporters):
+        super().__init__(config, reporters)
+        self.codes = {}
+        self.encoded = {}
+        self.memo = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _encode(self, genome):
+        e = self.encoded.get(genome.key)
+        if e is None:
+            e = self.encoded[genome.key] = _genes(genome, self.codes)
+        return e
+
+    def speciate(self, config, population, generation):
+        assert isinstance(population, dict)
+
+        compatibility_threshold = self.species_set_config.compatibility_threshold
+        gc = config.genome_config
+
+        # 이번 세대 population 을 한 번만 이어 붙임
+        gids = list(population)
+        flat = _Flat([self._encode(population[gid]) for gid in gids])
+        computed = {}
+
+        def distances(rep):
+            """rep 에서 population 전체까지 거리. 지난번에 계산한 genome 과의 거리는 다시 씀."""
+            memo = self.memo.get(rep.key)
+            if memo is None:
+                row = batch_distance(_Flat([self._encode(rep)]), flat, gc)
+                self.misses += len(gids)
+            else:
+                old = dict(zip(memo[0], memo[1].tolist()))
+                known = np.array([gid in old for gid in gids], dtype=bool)
+                row = np.empty(len(gids))
+                row[known] = [old[gid] for gid in gids if gid in old]
+                if not known.all():
+                    row[~known] = batch_distance(_Flat([self._encode(rep)]), flat.subset(~known), gc)
+                self.hits += int(known.sum())
+                self.misses += int((~known).sum())
+            self.memo[rep.key] = (gids, row)
+            computed[rep.key] = row
+            return row
+
+        # 기존 종마다 현재 대표와 가장 가까운 genome 을 새 대표로
+        unspeciated = np.ones(len(gids), dtype=bool)
+        new_representatives = {}
+        new_members = {}
+        for sid, s in self.species.items():
+            row = distances(s.representative)
+            i = int(np.argmin(np.where(unspeciated, row, np.inf)))
+            new_representatives[sid] = gids[i]
+            new_members[sid] = [gids[i]]
+            unspeciated[i] = False
+
+        # 나머지는 가장 가까운 대표의 종으로 (거리가 threshold 이상이면 새 종).
+        # DefaultSpeciesSet 처럼 순서대로 하나씩 넣는 것과 같은 결과가 되도록,
+        # 새 종은 기존 대표 누구와도 가깝지 않은 genome 들만 차례로 보면서 먼저 만들고
+        # 새 대표는 자기보다 뒤 순서의 genome 에게만 후보가 된다.
+        order = np.flatnonzero(unspeciated)
+        rep_ids = list(new_representatives)
+        rows = [distances(population[new_representatives[sid]])[order] for sid in rep_ids]
+        created = [-1] * len(rows)
+        close = np.zeros(len(order), dtype=bool)
+        for row in rows:
+            close |= row < compatibility_threshold
+        for k in np.flatnonzero(~close):
+            if any(rows[r][k] < compatibility_threshold for r in range(len(rows)) if created[r] >= 0):
+                continue
+            sid = next(self.indexer)
+            new_representatives[sid] = gids[order[k]]
+            new_members[sid] = [gids[order[k]]]
+            rep_ids.append(sid)
+            rows.append(distances(population[gids[order[k]]])[order])
+            created.append(k)
+
+        if rows:
+            matrix = np.array(rows)
+            after = np.arange(len(order))[None, :] > np.array(created)[:, None]
+            matrix[~after | (matrix >= compatibility_threshold)] = np.inf
+            best = np.argmin(matrix, axis=0)
+            for k in np.flatnonzero(np.isfinite(matrix[best, np.arange(len(order))])):
+                new_members[rep_ids[best[k]]].append(gids[order[k]])
+
+        # 종 갱신
+        self.genome_to_species = {}
+        for sid, rid in new_representatives.items():
+            s = self.species.get(sid)
+            if s is None:
+                s = Species(sid, generation)
+                self.species[sid] = s
+
+            members = new_members[sid]
+            for gid in members:
+                self.genome_to_species[gid] = sid
+            s.update(population[rid], dict((gid, population[gid]) for gid in members))
+
+        # 죽은 genome 의 인코딩과 기억은 버림 (대표는 다음 세대에도 필요)
+        keep = set(gids)
+        self.encoded = {gid: e for gid, e in self.encoded.items() if gid in keep}
+        self.memo = {rid: m for rid, m in self.memo.items() if rid in keep}
+
+        values = np.concatenate(list(computed.values())) if computed else np.zeros(1)
+        self.reporters.info(
+            'Mean genetic distance {0:.3f}, standard deviation {1:.3f}'.format(values.mean(), values.std()))
@@ -0,0 +1,233 @@
+import math
+import os
+import random
+
+import neat
+import numpy as np
+from neat.species import Species
+
+from . import big_world
+from .batchnet import BatchNetwork
+from .bounded_stats import BoundedStatisticsReporter, spill_file
+from .evolution import load_config
+from .world import World
+
+# --- 정상 상태(rtNEAT) 설정 ---
+MIN_AGE = 300         # 이 프레임 수 이상 산 개체만 살아있는 채로 부모 후보가 됨
+RETIRED_POOL = 50     # 죽은 genome 중 부모 후보로 남겨 둘 최대 수
+HEADLESS = False      # True 면 창 없이 최대 속도로 진행
+
+
+# --------------------------------
+# ▣ 월드를 멈추지 않는 진화 (rtNEAT)
+# --------------------------------
+class SteadyState:
+    """
+    세대마다 월드를 새로 만드는 대신, 생명체가 죽을 때마다 그 자리에서 바로
+    자식 하나를 만들어 다시 태어나게 한다 (Stanley 의 rtNEAT 방식).
+
+    - 초기 population, 번식 설정, 종 분류 기준은 neat.Population 의 것을 그대로 씀
+    - 부모는 종의 평균 fitness 에 비례해 종을 고르고, 그 종의 상위 survival_threshold 안에서 고름
+    - 자식은 기존 종 대표들과의 거리로 하나씩 종에 넣는다 (전체 재분류 없음)
+    - 죽은 genome 은 RETIRED_POOL 개까지 부모 후보로 남기고, 넘치면 조정 fitness 가 가장 낮은 것부터 뺀다
+    - pop_size 번 태어날 때마다 "가상 세대" 로 보고 reporter 들에 통계를 넘긴다
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.p = neat.Population(config)
+
+        self.slots = list(self.p.population.values())
+        self.retired = []
+        self.births = 0
+
+        self.world = World(len(self.slots))
+        self.net = BatchNetwork([(list(self.p.population.items()), config)])
+        self.fitness = np.zeros(len(self.slots))
+        self.predator_fitness = np.zeros(self.world.swarm.n)
+        self.inputs = np.zeros((len(self.slots), config.genome_config.num_inputs))
+        self.age = np.zeros(len(self.slots), dtype=np.int64)
+
+    # --- 한 프레임 ---
+    def frame(self):
+        world = self.world
+        big_world.step(world, self.net, self.inputs, self.fitness, self.predator_fitness)
+        self.age[world.alive] += 1
+
+        for slot in np.flatnonzero(~world.alive):
+            self.retire(slot)
+            child = self.breed()
+            self.slots[slot] = child
+            self.fitness[slot] = 0
+            self.age[slot] = 0
+            world.spawn(slot)
+            self.net.replace(0, slot, child)
+            self.births += 1
+
+    # --- 죽은 genome 정리 ---
+    def retire(self, slot):
+        genome = self.slots[slot]
+        genome.fitness = float(self.fitness[slot])
+        self.retired.append(genome)
+
+        if len(self.retired) > RETIRED_POOL:
+            species = self.p.species
+            worst = min(self.retired,
+                        key=lambda g: g.fitness / len(species.get_species(g.key).members))
+            self.retired.remove(worst)
+            self.remove(worst)
+
+    def remove(self, genome):
+        """population 과 종에서 genome 을 뺀다. 빈 종은 없애고, 대표가 빠지면 다른 멤버로 바꾼다."""
+        species_set = self.p.species
+        sid = species_set.genome_to_species.pop(genome.key)
+        s = species_set.species[sid]
+        del s.members[genome.key]
+        del self.p.population[genome.key]
+
+        if not s.members:
+            del species_set.species[sid]
+        elif s.representative is genome:
+            s.representative = next(iter(s.members.values()))
+
+    # --- 자식 만들기 ---
+    def candidates(self):
+        """부모 후보: 은퇴한 genome + MIN_AGE 이상 산 genome (처음에는 후보가 없으면 살아있는 전부)"""
+        living = np.flatnonzero(self.world.alive & (self.age >= MIN_AGE))
+        if not len(living) and not self.retired:
+            living = np.flatnonzero(self.world.alive)
+        for slot in living:
+            self.slots[slot].fitness = float(self.fitness[slot])
+        return self.retired + [self.slots[slot] for slot in living]
+
+    def breed(self):
+        config = self.config
+        species_set = self.p.species
+        reproduction = self.p.reproduction
+
+        by_species = {}
+        for g in self.candidates():
+            by_species.setdefault(species_set.genome_to_species[g.key], []).append(g)
+
+        # 평균 fitness 에 비례해 종 선택 (음수가 있으면 최솟값만큼 올림)
+        sids = list(by_species)
+        means = np.array([np.mean([g.fitness for g in by_species[sid]]) for sid in sids])
+        weights = means - means.min() + 1.0
+        members = by_species[random.choices(sids, weights=weights)[0]]
+
+        # 종 안에서 상위 survival_threshold 만 부모가 될 수 있음
+        members.sort(reverse=True, key=lambda g: g.fitness)
+        cutoff = max(1, int(math.ceil(reproduction.reproduction_config.survival_threshold * len(members))))
+        parent1 = random.choice(members[:cutoff])
+        parent2 = random.choice(members[:cutoff])
+
+        gid = next(reproduction.genome_indexer)
+        child = config.genome_type(gid)
+        child.configure_crossover(parent1, parent2, config.genome_config)
+        child.mutate(config.genome_config)
+        reproduction.ancestors[gid] = (parent1.key, parent2.key)
+
+        self.p.population[gid] = child
+        self.speciate(child)
+        return child
+
+    def speciate(self, genome):
+        """기존 종 대표들과 거리만 비교해서 자식 하나를 종에 넣는다"""
+        species_set = self.p.species
+        threshold = species_set.species_set_config.compatibility_threshold
+
+        best_sid, best_d = None, None
+        for sid, s in species_set.species.items():
+            d = genome.distance(s.representative, self.config.genome_config)
+            if d < threshold and (best_d is None or d < best_d):
+                best_sid, best_d = sid, d
+
+        if best_sid is None:
+            best_sid = next(species_set.indexer)
+            s = Species(best_sid, self.p.generation)
+            s.update(genome, {genome.key: genome})
+            species_set.species[best_sid] = s
+        else:
+            species_set.species[best_sid].members[genome.key] = genome
+        species_set.genome_to_species[genome.key] = best_sid
+
+    # --- 가상 세대 보고 ---
+    def report(self):
+        """pop_size 번 태어날 때마다 한 세대처럼 통계를 낸다. 목표 fitness 도달 시 True."""
+        p = self.p
+        for slot, genome in enumerate(self.slots):
+            genome.fitness = float(self.fitness[slot])
+
+        best = max(p.population.values(), key=lambda g: g.fitness)
+        p.reporters.post_evaluate(self.config, p.population, p.species, best)
+        if p.best_genome is None or best.fitness > p.best_genome.fitness:
+            p.best_genome = best
+
+        for s in p.species.species.values():
+            s.fitness = float(np.mean(s.get_fitnesses()))
+            if not s.fitness_history or s.fitness > max(s.fitness_history):
+                s.last_improved = p.generation
+            s.fitness_history.append(s.fitness)
+            s.adjusted_fitness = None
+
+        if not self.config.no_fitness_termination:
+            fv = p.fitness_criterion(g.fitness for g in p.population.values())
+            if fv >= self.config.fitness_threshold:
+                p.reporters.found_solution(self.config, p.generation, best)
+                return True
+
+        p.reporters.end_generation(self.config, p.population, p.species)
+        p.generation += 1
+        return False
+
+    # --- 실행 ---
+    def run(self, generations, screen=None):
+        p = self.p
+        if screen is not None:
+            import pygame
+
+            from .viewport import Viewport
+
+            clock = pygame.time.Clock()
+            font = pygame.font.SysFont("comicsans", 30)
+            viewport = Viewport(self.world.width, self.world.height,
+                                big_world.WIN_WIDTH, big_world.WIN_HEIGHT)
+
+        for _ in range(generations):
+            p.reporters.start_generation(p.generation)
+            while self.births < self.config.pop_size:
+                if screen is not None:
+                    big_world.handle_events(viewport)
+                self.frame()
+                if screen is not None:
+                    big_world.draw(screen, viewport, self.world, font,
+                                   f"Gen: {p.generation} | Births: {self.births} | "
+                                   f"Species: {len(p.species.species)}")
+                    clock.tick(big_world.FPS)
+
+            self.births -= self.config.pop_size
+            if self.report():
+                break
+
+        return p.best_genome
+
+
+def run(config_path, generations=50):
+    config = load_config(config_path)
+
+    steady = SteadyState(config)
+    steady.p.add_reporter(neat.StdOutReporter(True))
+    stats = BoundedStatisticsReporter(spill_path=spill_file("steady_state"))
+    steady.p.add_reporter(stats)
+
+    screen = None
+    if not HEADLESS:
+        screen = big_world.open_window()
+
+    return steady.run(generations, screen)
+
+
+# python -m arena.steady_state
+if __name__ == "__main__":
+    local_dir = os.path.dirname(__file__)
+    run(os.path.join(local_dir, "config-feedforward.txt"))
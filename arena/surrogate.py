@@ -0,0 +1,173 @@
+import os
+import random
+
+import neat
+import numpy as np
+
+from . import big_world
+from .bounded_stats import BoundedStatisticsReporter, spill_file
+from .evolution import advance, load_config
+
+# --- surrogate 설정 ---
+SIMULATE_FRACTION = 0.3   # 예측 fitness 상위 이 비율만 실제로 시뮬레이션
+EXPLORE_FRACTION = 0.1    # 나머지 중 무작위로 이 비율도 시뮬레이션 (탐색 + 예측 정확도 측정)
+WARMUP = 3                # 처음 몇 세대는 전부 시뮬레이션 (학습 데이터 모으기)
+HISTORY = 5000            # 학습에 쓰는 최근 (특징, fitness) 개수
+RIDGE = 1.0               # 릿지 회귀 정규화 세기
+
+
+# --------------------------------
+# ▣ genome 특징
+# --------------------------------
+def features(genome, config):
+    """
+    genome → 고정 길이 특징 벡터.
+    크기(숨은 노드 수, 켜진 연결 수), weight/bias 통계, 입력→출력 직접 연결 weight 행렬, 출력 bias.
+    """
+    gc = config.genome_config
+    nodes = genome.nodes
+    connections = genome.connections
+
+    direct = np.zeros((gc.num_inputs, gc.num_outputs))
+    weights = []
+    for (i, o), c in connections.items():
+        if not c.enabled:
+            continue
+        weights.append(c.weight)
+        if i < 0 and 0 <= o < gc.num_outputs:
+            direct[-i - 1, o] = c.weight
+    weights = np.array(weights) if weights else np.zeros(1)
+    biases = np.array([n.bias for n in nodes.values()])
+    output_bias = [nodes[k].bias if k in nodes else 0.0 for k in gc.output_keys]
+
+    return np.concatenate([[len(nodes) - gc.num_outputs, len(weights), np.abs(weights).mean(), weights.mean(),
+                            weights.std(), biases.mean()], direct.ravel(), output_bias])
+
+
+# --------------------------------
+# ▣ 회귀 모델 (릿지, 표준화한 특징)
+# --------------------------------
+class RidgeModel:
+    def __init__(self, ridge=RIDGE):
+        self.ridge = ridge
+        self.coef = None
+
+    def fit(self, x, y):
+        self.mean = x.mean(axis=0)
+        self.scale = x.std(axis=0) + 1e-9
+        z = np.hstack([(x - self.mean) / self.scale, np.ones((len(x), 1))])
+        a = z.T @ z + self.ridge * np.eye(z.shape[1])
+        self.coef = np.linalg.solve(a, z.T @ y)
+
+    def predict(self, x):
+        z = np.hstack([(x - self.mean) / self.scale, np.ones((len(x), 1))])
+        return z @ self.coef
+
+
+def rank_correlation(a, b):
+    """스피어만 순위 상관 (동점은 무시)"""
+    if len(a) < 2:
+        return float("nan")
+    ra = np.argsort(np.argsort(a))
+    rb = np.argsort(np.argsort(b))
+    return float(np.corrcoef(ra, rb)[0, 1])
+
+
+# --------------------------------
+# ▣ 예측으로 걸러서 평가
+# --------------------------------
+class Surrogate(neat.reporting.BaseReporter):
+    """
+    eval_genomes 자리에 넣는 사전 선별 단계 (p.add_reporter 로도 붙이면 세대마다 요약 출력).
+    이번 실행에서 실제로 시뮬레이션한 (특징, fitness) 로 릿지 회귀를 학습하고,
+    새 genome 의 fitness 를 예측해서 상위 SIMULATE_FRACTION + 무작위 EXPLORE_FRACTION 만
+    big_world 에서 돌린다. 나머지는 예측값을 fitness 로 쓰고 estimated 에 표시한다.
+
+    예측값은 이번 세대 시뮬레이션한 genome 의 중앙값을 넘지 않게 자른다.
+    돌려보지 않은 genome 이 최고 genome / 종료 조건이 되지 않도록 p.run 대신
+    evolution.advance(p, measured=surrogate.is_measured) 로 세대를 진행하고 (run() 참고),
+    통계에는 BoundedStatisticsReporter(estimated=surrogate.is_estimated) 로 표시한다.
+    """
+
+    def __init__(self, simulate=SIMULATE_FRACTION, explore=EXPLORE_FRACTION, warmup=WARMUP):
+        self.simulate = simulate
+        self.explore = explore
+        self.warmup = warmup
+        self.model = RidgeModel()
+        self.x = []
+        self.y = []
+        self.generation = 0
+        self.estimated = {}   # 이번 세대 예측만 한 genome key → 예측 fitness
+        self.history = []     # 세대별 (시뮬레이션 수, 예측 수, 탐색 genome 의 순위 상관)
+
+    def is_estimated(self, genome_key):
+        return genome_key in self.estimated
+
+    def is_measured(self, genome_key):
+        return genome_key not in self.estimated
+
+    def learn(self, x, y):
+        self.x.extend(x)
+        self.y.extend(y)
+        del self.x[:-HISTORY], self.y[:-HISTORY]
+        self.model.fit(np.array(self.x), np.array(self.y))
+
+    def eval_genomes(self, genomes, config):
+        x = np.array([features(genome, config) for genome_id, genome in genomes])
+        self.generation += 1
+        self.estimated = {}
+
+        if self.generation <= self.warmup or self.model.coef is None:
+            big_world.play(genomes, config)
+            self.learn(list(x), [genome.fitness for genome_id, genome in genomes])
+            self.history.append((len(genomes), 0, float("nan")))
+            return
+
+        predicted = self.model.predict(x)
+        order = np.argsort(-predicted)
+        top = max(1, int(round(len(genomes) * self.simulate)))
+        rest = order[top:]
+        explore = np.array([i for i in rest if random.random() < self.explore], dtype=np.int64)
+        chosen = np.concatenate([order[:top], explore])
+
+        big_world.play([genomes[i] for i in chosen], config)
+        actual = np.array([genomes[i][1].fitness for i in chosen])
+        cap = float(np.median(actual))
+        for i in np.setdiff1d(rest, explore):
+            genome_id, genome = genomes[i]
+            genome.fitness = min(float(predicted[i]), cap)
+            self.estimated[genome_id] = genome.fitness
+
+        correlation = rank_correlation(predicted[explore], actual[top:])
+        self.learn(list(x[chosen]), list(actual))
+        self.history.append((len(chosen), len(self.estimated), correlation))
+
+    def post_evaluate(self, config, population, species, best_genome):
+        simulated, estimated, correlation = self.history[-1]
+        print("Surrogate: {0} simulated, {1} estimated | exploration rank correlation {2:.2f}".format(
+            simulated, estimated, correlation))
+
+
+def run(config_path, generations=50):
+    config = load_config(config_path)
+
+    surrogate = Surrogate()
+    p = neat.Population(config)
+    p.add_reporter(neat.StdOutReporter(True))
+    stats = BoundedStatisticsReporter(spill_path=spill_file("surrogate"), estimated=surrogate.is_estimated)
+    p.add_reporter(stats)
+    p.add_reporter(surrogate)
+
+    # p.run 과 같지만 최고 genome / 종료 조건은 실제로 시뮬레이션한 genome 에서만
+    for _ in range(generations):
+        p.reporters.start_generation(p.generation)
+        surrogate.eval_genomes(list(p.population.items()), config)
+        if advance(p, measured=surrogate.is_measured):
+            break
+    return p.best_genome
+
+
+# python -m arena.surrogate
+if __name__ == "__main__":
+    local_dir = os.path.dirname(__file__)
+    run(os.path.join(local_dir, "config-feedforward.txt"))
@@ -0,0 +1,118 @@
+import random
+
+import numpy as np
+
+# --- 포식자 무리 설정 ---
+PREDATOR_RAD = 15            # 포식자 반지름
+MARGIN = 50                  # 생성될 때 벽에서 떨어진 거리
+PREDATOR_POLICY = "random"   # "random"(무작위 이동) / "chase"(가까운 생명체 추격) / "patrol"(순찰)
+                             # "evolved" 는 신경망 출력으로 steer() 해서 움직임 (arena/coevolution.py)
+CHASE_REACH = 3              # 추격할 생명체를 찾는 범위 (셀 단위, 밖이면 무작위 이동)
+PATROL_SIZE = 300            # 순찰 사각형 한 변 길이
+
+DIRECTIONS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=float)
+POLICIES = ("random", "chase", "patrol", "evolved")
+
+
+# --------------------------------
+# ▣ 포식자 무리 (배열로 한꺼번에 이동)
+# --------------------------------
+class PredatorSwarm:
+    """
+    second/ 의 Predator 를 배열로 바꾼 것.
+    위치, 방향 벡터, 방향 전환 타이머가 모두 (n,) 배열이고
+    경계 충돌 검사와 난수 뽑기도 한 번에 처리한다.
+    """
+
+    def __init__(self, n, width, height, policy=PREDATOR_POLICY, vel=5, rad=PREDATOR_RAD):
+        if policy not in POLICIES:
+            raise ValueError("Unknown predator policy {!r}, expected one of {}".format(policy, POLICIES))
+
+        self.n = n
+        self.width = width
+        self.height = height
+        self.policy = policy
+        self.vel = vel
+        self.rad = rad
+
+        # numpy 난수는 파이썬 random 에서 시드를 받아 random.seed() 하나로 재현 가능
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
+        self.x = self.rng.integers(MARGIN, width - MARGIN, n, endpoint=True).astype(float)
+        self.y = self.rng.integers(MARGIN, height - MARGIN, n, endpoint=True).astype(float)
+        self.direction = DIRECTIONS[self.rng.integers(0, 4, n)]
+        self.change_timer = self.rng.integers(30, 90, n, endpoint=True)
+
+        # 순찰: 생성 위치를 중심으로 한 사각형의 네 꼭짓점을 돈다
+        half = PATROL_SIZE / 2
+        cx = np.clip(self.x, half + rad, width - half - rad)
+        cy = np.clip(self.y, half + rad, height - half - rad)
+        corners = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=float) * half
+        self.waypoints = np.stack([cx[:, None] + corners[:, 0], cy[:, None] + corners[:, 1]], axis=2)
+        self.waypoint = self.rng.integers(0, 4, n)
+
+    # ——————————————
+    # 이동 정책
+    # ——————————————
+    def random_walk(self, which):
+        """which 에 해당하는 포식자만 타이머 감소 + 경계/타이머 만료 시 방향 다시 뽑기"""
+        self.change_timer[which] -= 1
+
+        x, y = self.x[which], self.y[which]
+        hit_boundary = ((x <= self.rad) | (x >= self.width - self.rad) |
+                        (y <= self.rad) | (y >= self.height - self.rad))
+        change = which[hit_boundary | (self.change_timer[which] <= 0)]
+
+        self.direction[change] = DIRECTIONS[self.rng.integers(0, 4, len(change))]
+        self.change_timer[change] = self.rng.integers(30, 90, len(change), endpoint=True)
+
+    def chase(self, world):
+        """가장 가까운 생명체 쪽으로 이동, 범위 안에 없으면 무작위 이동"""
+        target, _ = world.creature_grid.nearest(self.x, self.y, world.x + world.creature_half,
+                                                world.y + world.creature_half, k=1, max_reach=CHASE_REACH)
+        target = target[:, 0]
+        has = np.flatnonzero(target >= 0)
+
+        dx = world.x[target[has]] + world.creature_half - self.x[has]
+        dy = world.y[target[has]] + world.creature_half - self.y[has]
+        length = np.maximum(np.hypot(dx, dy), 1e-9)
+        self.direction[has, 0] = dx / length
+        self.direction[has, 1] = dy / length
+
+        self.random_walk(np.flatnonzero(target < 0))
+
+    def patrol(self):
+        """순찰 꼭짓점 쪽으로 이동, 도착하면 다음 꼭짓점"""
+        rows = np.arange(self.n)
+        dx = self.waypoints[rows, self.waypoint, 0] - self.x
+        dy = self.waypoints[rows, self.waypoint, 1] - self.y
+
+        arrived = np.hypot(dx, dy) <= self.vel
+        self.waypoint[arrived] = (self.waypoint[arrived] + 1) % 4
+        dx = self.waypoints[rows, self.waypoint, 0] - self.x
+        dy = self.waypoints[rows, self.waypoint, 1] - self.y
+
+        length = np.maximum(np.hypot(dx, dy), 1e-9)
+        self.direction[:, 0] = dx / length
+        self.direction[:, 1] = dy / length
+
+    def steer(self, outputs):
+        """신경망 출력 [상, 하, 좌, 우] 로 방향 설정 (생명체와 같은 4방향 이동)"""
+        press = np.asarray(outputs) > 0.5
+        self.direction[:, 0] = press[:, 3].astype(float) - press[:, 2]
+        self.direction[:, 1] = press[:, 1].astype(float) - press[:, 0]
+
+    def move(self, world):
+        if self.policy == "random":
+            self.random_walk(np.arange(self.n))
+        elif self.policy == "chase":
+            self.chase(world)
+        elif self.policy == "patrol":
+            self.patrol()
+        # "evolved" 는 steer() 로 정한 방향 그대로
+
+        # 이동 적용 + 위치 보정
+        self.x += self.direction[:, 0] * self.vel
+        self.y += self.direction[:, 1] * self.vel
+        np.clip(self.x, self.rad, self.width - self.rad, out=self.x)
+        np.clip(self.y, self.rad, self.height - self.rad, out=self.y)
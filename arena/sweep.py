@@ -0,0 +1,215 @@
+import argparse
+import concurrent.futures
+import csv
+import hashlib
+import itertools
+import json
+import os
+import random
+import sqlite3
+import time
+
+import neat
+
+from . import big_world
+from .evolution import derive_config, load_config
+
+# --- 기본 스윕 예시 (config 키: 값 목록) ---
+SPEC = {
+    "conn_add_prob": [0.2, 0.5],
+    "node_add_prob": [0.1, 0.2],
+    "compatibility_threshold": [2.5, 3.0, 3.5],
+    "pop_size": [100, 200],
+    "num_hidden": [0, 2],
+}
+WORKERS = max(1, (os.cpu_count() or 2) - 1)   # 동시에 돌릴 trial 수
+GENERATIONS = 20
+
+
+# --------------------------------
+# ▣ 스윕 정의
+# --------------------------------
+def grid(spec):
+    """모든 조합 (값 목록의 곱)"""
+    keys = sorted(spec)
+    for values in itertools.product(*(spec[k] for k in keys)):
+        yield dict(zip(keys, values))
+
+
+def random_search(spec, n, seed=0):
+    """
+    n 개 무작위 조합. 값이 리스트면 그중 하나, (low, high) 튜플이면 균등분포
+    (둘 다 int 면 정수) 에서 뽑는다.
+    """
+    rng = random.Random(seed)
+    for _ in range(n):
+        params = {}
+        for key in sorted(spec):
+            values = spec[key]
+            if isinstance(values, tuple):
+                low, high = values
+                params[key] = rng.randint(low, high) if isinstance(low, int) and isinstance(high, int) \
+                    else round(rng.uniform(low, high), 6)
+            else:
+                params[key] = rng.choice(values)
+        yield params
+
+
+def config_hash(config_path):
+    with open(config_path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+
+def trial_id(params, seed, generations, base_hash):
+    """
+    trial 을 정하는 모든 값의 해시: 파라미터, 시드, 세대 수, base config 내용 (config_hash).
+    세대 수나 base config 를 바꿔 다시 돌리면 다른 trial 이 되어 예전 결과를 재사용하지 않는다.
+    """
+    text = json.dumps({"params": params, "seed": seed, "generations": generations, "base": base_hash},
+                      sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()[:12]
+
+
+# --------------------------------
+# ▣ trial 하나 (작업 프로세스)
+# --------------------------------
+class _GenerationLog(neat.reporting.BaseReporter):
+    def __init__(self):
+        self.rows = []
+
+    def post_evaluate(self, config, population, species, best_genome):
+        fitnesses = [g.fitness for g in population.values()]
+        self.rows.append((best_genome.fitness, sum(fitnesses) / len(fitnesses), len(species.species)))
+
+
+def run_trial(config_path, generations, seed):
+    """창 없이 big_world 로 한 trial 을 돌리고 (세대별 기록, 걸린 시간) 을 반환"""
+    random.seed(seed)
+    start = time.perf_counter()
+
+    config = load_config(config_path)
+    p = neat.Population(config)
+    log = _GenerationLog()
+    p.add_reporter(log)
+    p.run(lambda genomes, config: big_world.play(genomes, config), generations)
+    return log.rows, time.perf_counter() - start
+
+
+# --------------------------------
+# ▣ 결과 저장소 (SQLite)
+# --------------------------------
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trials (
+    trial_id TEXT PRIMARY KEY,
+    params TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    best_fitness REAL,
+    wall_time REAL,
+    error TEXT,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS generations (
+    trial_id TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    best_fitness REAL,
+    mean_fitness REAL,
+    species INTEGER,
+    PRIMARY KEY (trial_id, generation)
+);
+"""
+
+
+def open_store(db_path):
+    db = sqlite3.connect(db_path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def completed(db):
+    return {row[0] for row in db.execute("SELECT trial_id FROM trials WHERE status = 'done'")}
+
+
+def save(db, tid, params, seed, rows=None, wall_time=None, error=None):
+    with db:
+        db.execute("DELETE FROM generations WHERE trial_id = ?", (tid,))
+        db.execute("INSERT OR REPLACE INTO trials VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                   (tid, json.dumps(params, sort_keys=True), seed, "failed" if error else "done",
+                    max(r[0] for r in rows) if rows else None, wall_time, error, time.time()))
+        if rows:
+            db.executemany("INSERT INTO generations VALUES (?, ?, ?, ?, ?)",
+                           [(tid, gen, best, mean, species) for gen, (best, mean, species) in enumerate(rows)])
+
+
+def export_csv(db_path, csv_path):
+    """trial 당 한 줄 (파라미터는 열로 펼침)"""
+    db = open_store(db_path)
+    rows = db.execute("SELECT trial_id, params, seed, status, best_fitness, wall_time FROM trials "
+                      "ORDER BY best_fitness DESC").fetchall()
+    keys = sorted({k for row in rows for k in json.loads(row[1])})
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["trial_id"] + keys + ["seed", "status", "best_fitness", "wall_time"])
+        for tid, params, seed, status, best, wall in rows:
+            params = json.loads(params)
+            writer.writerow([tid] + [params.get(k) for k in keys] + [seed, status, best, wall])
+    db.close()
+
+
+# --------------------------------
+# ▣ 스윕 실행
+# --------------------------------
+def sweep(base_config, trials, out_dir, generations=GENERATIONS, workers=WORKERS, seeds=(0,)):
+    """
+    trials: 파라미터 dict 목록 (grid / random_search 결과)
+    out_dir 에 configs/ 와 results.sqlite 를 만들고, 이미 끝난 trial 은 건너뛴다 (이어서 실행).
+    같은 trial 은 파라미터, 시드, 세대 수, base config 내용이 모두 같은 것 (trial_id).
+    동시에 최대 workers 개의 trial 을 프로세스 풀에서 돌린다.
+    """
+    os.makedirs(os.path.join(out_dir, "configs"), exist_ok=True)
+    db = open_store(os.path.join(out_dir, "results.sqlite"))
+    done = completed(db)
+    base_hash = config_hash(base_config)
+
+    todo = []
+    skipped = 0
+    for params in trials:
+        for seed in seeds:
+            tid = trial_id(params, seed, generations, base_hash)
+            if tid in done:
+                skipped += 1
+                continue
+            path = derive_config(base_config, params, os.path.join(out_dir, "configs", tid + ".txt"))
+            todo.append((tid, params, seed, path))
+    print("Sweep: {0} trials to run, {1} already done".format(len(todo), skipped))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_trial, path, generations, seed): (tid, params, seed)
+                   for tid, params, seed, path in todo}
+        for future in concurrent.futures.as_completed(futures):
+            tid, params, seed = futures[future]
+            try:
+                rows, wall_time = future.result()
+            except Exception as e:
+                save(db, tid, params, seed, error=repr(e))
+                print("[{0}] failed: {1!r}".format(tid, e))
+                continue
+            save(db, tid, params, seed, rows, wall_time)
+            print("[{0}] best {1:.1f} in {2:.1f}s  {3}".format(tid, max(r[0] for r in rows), wall_time, params))
+
+    db.close()
+
+
+# python -m arena.sweep --out sweep-results [--random 20] [--workers 4]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default="sweep-results")
+    parser.add_argument("--random", type=int, default=0, help="0 이면 grid, 아니면 무작위 조합 수")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--generations", type=int, default=GENERATIONS)
+    args = parser.parse_args()
+
+    base = os.path.join(os.path.dirname(__file__), "config-feedforward.txt")
+    trials = random_search(SPEC, args.random) if args.random else grid(SPEC)
+    sweep(base, trials, args.out, args.generations, args.workers)
+    export_csv(os.path.join(args.out, "results.sqlite"), os.path.join(args.out, "results.csv"))
@@ -0,0 +1,94 @@
+import numpy as np
+import pygame
+
+from .world import CREATURE_SIZE, FOOD_RAD, PREDATOR_RAD, START_LIFE
+
+SCROLL_SPEED = 20     # 키보드 스크롤 속도 (프레임당 픽셀)
+MINIMAP_WIDTH = 200   # 오른쪽 아래 미니맵 너비
+
+
+# --------------------------------
+# ▣ 스크롤 가능한 뷰포트
+# --------------------------------
+class Viewport:
+    """
+    큰 월드 중 화면 크기만큼의 부분 영역만 보여준다.
+    방향키/WASD 또는 마우스 드래그로 스크롤, 화면 밖 엔티티는 그리지 않는다.
+    """
+
+    def __init__(self, world_width, world_height, view_width, view_height):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.width = view_width
+        self.height = view_height
+
+        # 처음에는 월드 중앙을 보여줌
+        self.x = (world_width - view_width) / 2
+        self.y = (world_height - view_height) / 2
+        self.dragging = False
+        self.clamp()
+
+    def clamp(self):
+        self.x = max(0, min(self.x, self.world_width - self.width))
+        self.y = max(0, min(self.y, self.world_height - self.height))
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.dragging = True
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.dragging = False
+        elif event.type == pygame.MOUSEMOTION and self.dragging:
+            self.x -= event.rel[0]
+            self.y -= event.rel[1]
+            self.clamp()
+
+    def handle_keys(self, keys):
+        if keys[pygame.K_LEFT] or keys[pygame.K_a]: self.x -= SCROLL_SPEED
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]: self.x += SCROLL_SPEED
+        if keys[pygame.K_UP] or keys[pygame.K_w]: self.y -= SCROLL_SPEED
+        if keys[pygame.K_DOWN] or keys[pygame.K_s]: self.y += SCROLL_SPEED
+        self.clamp()
+
+    def visible(self, xs, ys, margin):
+        """화면 안(여유 margin 포함)에 있는 엔티티 인덱스"""
+        return np.flatnonzero((xs >= self.x - margin) & (xs <= self.x + self.width + margin) &
+                              (ys >= self.y - margin) & (ys <= self.y + self.height + margin))
+
+    # ——————————————
+    # 그리기
+    # ——————————————
+    def draw(self, screen, world):
+        for j in self.visible(world.food_x, world.food_y, FOOD_RAD):
+            pos = (int(world.food_x[j] - self.x), int(world.food_y[j] - self.y))
+            pygame.draw.circle(screen, (255, 0, 0), pos, FOOD_RAD)
+
+        for j in self.visible(world.predator_x, world.predator_y, PREDATOR_RAD):
+            pos = (int(world.predator_x[j] - self.x), int(world.predator_y[j] - self.y))
+            pygame.draw.circle(screen, (0, 0, 255), pos, PREDATOR_RAD)
+
+        for i in self.visible(world.x, world.y, CREATURE_SIZE):
+            if not world.alive[i]:
+                continue
+            life_ratio = min(1.0, world.life[i] / START_LIFE)
+            rect = (int(world.x[i] - self.x), int(world.y[i] - self.y), CREATURE_SIZE, CREATURE_SIZE)
+            pygame.draw.rect(screen, (0, int(255 * life_ratio), 0), rect)
+
+        self.draw_minimap(screen, world)
+
+    def draw_minimap(self, screen, world):
+        scale = MINIMAP_WIDTH / self.world_width
+        map_w = MINIMAP_WIDTH
+        map_h = int(self.world_height * scale)
+        map_x = self.width - map_w - 10
+        map_y = self.height - map_h - 10
+
+        pygame.draw.rect(screen, (30, 30, 30), (map_x, map_y, map_w, map_h))
+
+        # 살아있는 생명체만 점으로 표시 (먹이는 너무 많아서 생략)
+        alive = np.flatnonzero(world.alive)
+        for i in alive:
+            screen.set_at((map_x + int(world.x[i] * scale), map_y + int(world.y[i] * scale)), (0, 255, 0))
+
+        view_rect = (map_x + int(self.x * scale), map_y + int(self.y * scale),
+                     int(self.width * scale), int(self.height * scale))
+        pygame.draw.rect(screen, (255, 255, 255), view_rect, 1)
@@ -0,0 +1,181 @@
+import argparse
+import copy
+import itertools
+import os
+import pickle
+import random
+
+import neat
+
+from . import big_world
+from .bounded_stats import BoundedStatisticsReporter, spill_file
+from .evolution import load_config
+
+# --- warm start 설정 ---
+CHAMPIONS = 10          # 저장할 상위 genome 수
+RANDOM_FRACTION = 0.2   # 새 population 에서 무작위 genome 으로 남겨 둘 비율 (다양성)
+
+
+# --------------------------------
+# ▣ champion 저장 / 읽기
+# --------------------------------
+def save_champions(path, genomes, config, count=CHAMPIONS):
+    """fitness 상위 count 개 genome 을 입력/출력 수와 함께 pickle 로 저장"""
+    ranked = sorted((g for g in genomes if g.fitness is not None), key=lambda g: g.fitness, reverse=True)
+    gc = config.genome_config
+    with open(path, "wb") as f:
+        pickle.dump({"num_inputs": gc.num_inputs, "num_outputs": gc.num_outputs,
+                     "genomes": [copy.deepcopy(g) for g in ranked[:count]]}, f)
+
+
+def load_champions(path):
+    """save_champions 로 저장한 파일 → (genome 목록, num_inputs, num_outputs)"""
+    with open(path, "rb") as f:
+        data = pickle.load(f)
+    return data["genomes"], data["num_inputs"], data["num_outputs"]
+
+
+class ChampionSaver(neat.reporting.BaseReporter):
+    """
+    p.add_reporter(ChampionSaver(path, config)) 로 붙이면 매 세대 평가가 끝날 때
+    상위 genome 을 path 에 덮어쓴다 (실행이 중간에 끊겨도 마지막 세대 것이 남음).
+    """
+
+    def __init__(self, path, config, count=CHAMPIONS):
+        self.path = path
+        self.config = config
+        self.count = count
+
+    def post_evaluate(self, config, population, species, best_genome):
+        save_champions(self.path, population.values(), self.config, self.count)
+
+
+# --------------------------------
+# ▣ 입력/출력 수 맞추기
+# --------------------------------
+def _connect_fresh(g, config, pairs):
+    """새로 생긴 입력/출력 사이 연결을 config 의 initial_connection 에 맞춰 새로 초기화"""
+    if "full" in config.initial_connection:
+        fraction = 1.0
+    elif "partial" in config.initial_connection:
+        fraction = config.connection_fraction
+    else:
+        return   # fs_neat / unconnected: 새 입력은 연결 없이 시작 (돌연변이로 연결)
+    for key in pairs:
+        if key not in g.connections and random.random() < fraction:
+            g.connections[key] = g.create_connection(config, *key)
+
+
+def adapt(genome, config, num_inputs, num_outputs, key=None):
+    """
+    다른 입력/출력 수(num_inputs, num_outputs)로 진화한 genome 을 config 에 맞는 새 genome 으로.
+    - 입력 -1..-n, 출력 0..m-1 은 번호가 같으면 같은 입력/출력으로 본다
+    - 늘어난 입력/출력은 새로 초기화 (initial_connection 에 따라 새 연결을 무작위 weight 로)
+    - 줄어든 입력/출력과 그에 붙은 연결은 버린다
+    - 숨은 노드 번호는 늘어난 출력 번호와 겹치지 않게 모든 genome 에서 같은 만큼 민다
+      (같은 혁신 번호가 여전히 같은 유전자라서 교차/종 분류가 그대로 맞음)
+    """
+    gc = config.genome_config
+    shift = max(0, gc.num_outputs - num_outputs)
+
+    def remap(k):
+        return k + shift if k >= num_outputs else k
+
+    g = neat.DefaultGenome(genome.key if key is None else key)
+    for k, node in genome.nodes.items():
+        if num_outputs > k >= gc.num_outputs:
+            continue   # 없어진 출력
+        new = gc.node_gene_type(remap(k))
+        for name in ("bias", "response", "activation", "aggregation"):
+            setattr(new, name, getattr(node, name))
+        g.nodes[new.key] = new
+
+    for (i, o), conn in genome.connections.items():
+        i = i if i < 0 else remap(i)
+        o = remap(o)
+        if i < -gc.num_inputs or (i >= 0 and i not in g.nodes) or o not in g.nodes:
+            continue   # 없어진 입력/출력에 붙은 연결
+        new = gc.connection_gene_type((i, o))
+        new.weight = conn.weight
+        new.enabled = conn.enabled
+        g.connections[(i, o)] = new
+
+    for k in range(num_outputs, gc.num_outputs):
+        g.nodes[k] = g.create_node(gc, k)
+    _connect_fresh(g, gc, [(i, o) for i in gc.input_keys for o in gc.output_keys
+                           if i < -num_inputs or o >= num_outputs])
+
+    if hasattr(config.genome_type, "from_genome"):
+        return config.genome_type.from_genome(g)   # CompactGenome
+    return g
+
+
+# --------------------------------
+# ▣ 저장된 genome 으로 population 시작
+# --------------------------------
+def seed_population(config, champions, num_inputs, num_outputs, random_fraction=RANDOM_FRACTION):
+    """
+    neat.Population 을 만들고 (무작위 genome 중 random_fraction 만 남김) 나머지 자리를
+    champion 들을 config 에 맞춘 것과 그 돌연변이 복사본으로 채운 뒤 종을 다시 나눈다.
+    """
+    p = neat.Population(config)
+    gc = config.genome_config
+
+    keys = list(p.population)
+    seeded = keys[:max(len(champions), int(round(len(keys) * (1.0 - random_fraction))))]
+    adapted = [adapt(g, config, num_inputs, num_outputs) for g in champions]
+
+    # 돌연변이로 새로 붙일 숨은 노드 번호가 champion 의 노드와 겹치지 않게 (복사본을 돌연변이하기 전에)
+    top = max(k for g in itertools.chain(adapted, p.population.values()) for k in g.nodes)
+    if gc.node_indexer is None:
+        gc.node_indexer = itertools.count(top + 1)
+    else:
+        gc.node_indexer = itertools.count(max(next(gc.node_indexer), top + 1))
+
+    for n, key in enumerate(seeded):
+        g = copy.deepcopy(adapted[n % len(adapted)])
+        g.key = key
+        g.fitness = None
+        if n >= len(adapted):
+            g.mutate(gc)   # 같은 champion 을 그대로 여러 개 두지 않게
+        p.population[key] = g
+
+    p.species = config.species_set_type(config.species_set_config, p.reporters)
+    p.species.speciate(config, p.population, p.generation)
+    return p
+
+
+def run(config_path, champions_path=None, save_path=None, generations=50):
+    """
+    big_world 를 champions_path 의 genome 으로 시작해 (없으면 무작위) 진화시키고
+    save_path 가 있으면 이번 실행의 상위 genome 을 저장 (다음 단계의 warm start 용).
+    """
+    config = load_config(config_path)
+    if champions_path:
+        champions, num_inputs, num_outputs = load_champions(champions_path)
+        p = seed_population(config, champions, num_inputs, num_outputs)
+        print("Warm start: {0} champions ({1} inputs, {2} outputs) -> {3} inputs, {4} outputs".format(
+            len(champions), num_inputs, num_outputs,
+            config.genome_config.num_inputs, config.genome_config.num_outputs))
+    else:
+        p = neat.Population(config)
+
+    p.add_reporter(neat.StdOutReporter(True))
+    stats = BoundedStatisticsReporter(spill_path=spill_file("warm_start"))
+    p.add_reporter(stats)
+    if save_path:
+        p.add_reporter(ChampionSaver(save_path, config))
+
+    return p.run(big_world.eval_genomes, generations)
+
+
+# python -m arena.warm_start --config <config> [--champions prev.pkl] [--save next.pkl]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__), "config-feedforward.txt"))
+    parser.add_argument("--champions", help="이전 실행에서 save_champions 로 저장한 파일")
+    parser.add_argument("--save", help="이번 실행의 상위 genome 을 저장할 파일")
+    parser.add_argument("--generations", type=int, default=50)
+    args = parser.parse_args()
+
+    run(args.config, args.champions, args.save, args.generations)
@@ -0,0 +1,288 @@
+import math
+import random
+
+import numpy as np
+
+from .swarm import MARGIN, PREDATOR_POLICY, PREDATOR_RAD, PredatorSwarm
+
+# --- 1. 월드 설정 ---
+WORLD_WIDTH = 4000    # 월드 전체 너비 (화면보다 훨씬 큼)
+WORLD_HEIGHT = 3000   # 월드 전체 높이
+CELL_SIZE = 100       # 청크(셀) 한 변의 길이, 먹기/충돌 거리보다 커야 함
+FOOD_COUNT = 10000    # 먹이 개수
+NUM_PREDATORS = 200   # 포식자 수
+
+CREATURE_SIZE = 20    # 생명체 사각형 크기
+FOOD_RAD = 10         # 먹이 반지름
+EAT_DIST = 20         # 이 거리 안이면 먹이를 먹음
+START_LIFE = 600      # 초기 수명 (10초)
+
+
+# --------------------------------
+# ▣ 청크(셀) 기반 공간 해시
+# --------------------------------
+class SpatialGrid:
+    """
+    월드를 CELL_SIZE 크기의 셀로 나누고, 셀마다 엔티티 인덱스를 연속 구간으로 모아둔다.
+    order[starts[c]:starts[c + 1]] 이 셀 c 에 들어있는 엔티티 배열이다.
+    """
+
+    def __init__(self, width, height, cell_size):
+        self.cell_size = cell_size
+        self.cols = int(math.ceil(width / cell_size))
+        self.rows = int(math.ceil(height / cell_size))
+        self.order = np.zeros(0, dtype=np.int64)
+        self.starts = np.zeros(self.cols * self.rows + 1, dtype=np.int64)
+
+    def cell_coords(self, xs, ys):
+        cx = np.clip((np.asarray(xs) // self.cell_size).astype(np.int64), 0, self.cols - 1)
+        cy = np.clip((np.asarray(ys) // self.cell_size).astype(np.int64), 0, self.rows - 1)
+        return cx, cy
+
+    def build(self, xs, ys, active=None):
+        """엔티티 위치로 셀별 배열을 다시 만든다. active 가 주어지면 그 엔티티만 넣는다."""
+        if active is None:
+            idx = np.arange(len(xs))
+        else:
+            idx = np.flatnonzero(active)
+
+        cx, cy = self.cell_coords(xs[idx], ys[idx])
+        cells = cy * self.cols + cx
+
+        self.order = idx[np.argsort(cells, kind="stable")]
+        counts = np.bincount(cells, minlength=self.cols * self.rows)
+        self.starts[0] = 0
+        np.cumsum(counts, out=self.starts[1:])
+
+    def neighbours(self, xs, ys, reach=1):
+        """
+        각 질의점 주변 (2*reach+1)^2 개 셀에 있는 엔티티를 모두 모은다.
+        반환값: (질의 인덱스 배열, 엔티티 인덱스 배열) 쌍
+        """
+        cx, cy = self.cell_coords(xs, ys)
+        offsets = np.arange(-reach, reach + 1)
+        ox, oy = np.meshgrid(offsets, offsets)
+
+        ncx = cx[:, None] + ox.ravel()[None, :]
+        ncy = cy[:, None] + oy.ravel()[None, :]
+        valid = (ncx >= 0) & (ncx < self.cols) & (ncy >= 0) & (ncy < self.rows)
+
+        query = np.broadcast_to(np.arange(len(cx))[:, None], ncx.shape)[valid]
+        cells = (ncy * self.cols + ncx)[valid]
+
+        begin = self.starts[cells]
+        counts = self.starts[cells + 1] - begin
+        total = int(counts.sum())
+
+        # 셀 구간들을 펼쳐서 (질의, 엔티티) 쌍으로 만든다 (파이썬 루프 없이)
+        group_start = np.cumsum(counts) - counts
+        within = np.arange(total) - np.repeat(group_start, counts)
+        entity = self.order[np.repeat(begin, counts) + within]
+        return np.repeat(query, counts), entity
+
+    def nearest(self, xs, ys, tx, ty, k=1, max_reach=None):
+        """
+        각 질의점에서 가장 가까운 엔티티 k개를 찾는다.
+        이웃 셀부터 찾고, k번째 거리가 탐색 반경보다 멀면 반경을 넓혀 다시 찾는다.
+        max_reach(셀 단위)까지 못 찾은 자리는 인덱스 -1, 거리 inf.
+        """
+        n = len(xs)
+        found = np.full((n, k), -1, dtype=np.int64)
+        dist = np.full((n, k), np.inf)
+        if n == 0 or len(tx) == 0:
+            return found, dist
+
+        limit = max(self.cols, self.rows)
+        if max_reach is not None:
+            limit = min(limit, max_reach)
+
+        todo = np.arange(n)
+        reach = 1
+        while len(todo) > 0:
+            q, e = self.neighbours(xs[todo], ys[todo], reach)
+            d2 = (tx[e] - xs[todo][q]) ** 2 + (ty[e] - ys[todo][q]) ** 2
+
+            # 질의별로 거리순 정렬 후 앞의 k개만 남김 (q 는 이미 오름차순이라 키 하나로 정렬)
+            order = np.argsort(q * (d2.max(initial=0.0) + 1.0) + d2, kind="stable")
+            q, e, d2 = q[order], e[order], d2[order]
+            first = np.searchsorted(q, np.arange(len(todo)))
+            rank = np.arange(len(q)) - first[q]
+            keep = rank < k
+
+            rows = todo[q[keep]]
+            found[todo] = -1
+            dist[todo] = np.inf
+            found[rows, rank[keep]] = e[keep]
+            dist[rows, rank[keep]] = np.sqrt(d2[keep])
+
+            # 탐색 반경(셀 reach 개) 안의 결과만 확실하므로 나머지는 더 넓게 찾는다
+            if reach >= limit:
+                break
+            todo = todo[dist[todo, k - 1] > reach * self.cell_size]
+            reach = min(reach * 2, limit)
+
+        return found, dist
+
+
+# --------------------------------
+# ▣ 청크 월드
+# --------------------------------
+class World:
+    """
+    먹이, 포식자, 생명체 상태를 배열로 들고 있는 월드.
+    먹기/포식자 충돌은 셀 그리드로 이웃 셀만 검사한다.
+    생명체 위치는 기존 스크립트와 같이 사각형의 왼쪽 위 좌표다.
+    """
+
+    def __init__(self, num_creatures, food_count=FOOD_COUNT, num_predators=NUM_PREDATORS,
+                 width=WORLD_WIDTH, height=WORLD_HEIGHT, cell_size=CELL_SIZE,
+                 predator_policy=PREDATOR_POLICY):
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+
+        # 먹이: 위치 배열 + 셀 그리드
+        self.food_x, self.food_y = self.random_points(food_count)
+        self.food_grid = SpatialGrid(width, height, cell_size)
+        self.food_grid.build(self.food_x, self.food_y)
+
+        # 포식자: 무리 전체를 배열로 이동, 위치 배열은 무리와 공유
+        self.swarm = PredatorSwarm(num_predators, width, height, predator_policy)
+        self.predator_x = self.swarm.x
+        self.predator_y = self.swarm.y
+        self.predator_grid = SpatialGrid(width, height, cell_size)
+        self.predator_grid.build(self.predator_x, self.predator_y)
+
+        # 생명체: 월드 전체에 흩어서 생성
+        self.x = np.array([random.uniform(0, width - CREATURE_SIZE) for _ in range(num_creatures)])
+        self.y = np.array([random.uniform(0, height - CREATURE_SIZE) for _ in range(num_creatures)])
+        self.vel = 5
+        self.life = np.full(num_creatures, float(START_LIFE))
+        self.alive = np.ones(num_creatures, dtype=bool)
+        self.eaten = np.zeros(num_creatures, dtype=np.int64)   # 생명체별로 먹은 먹이 수
+
+        # 포식자 추격용 생명체 그리드 (사각형 중심 좌표 기준)
+        self.creature_half = CREATURE_SIZE / 2
+        self.creature_grid = SpatialGrid(width, height, cell_size)
+
+    def spawn(self, i):
+        """i 번 생명체를 새 몸으로 다시 태어나게 한다 (정상 상태 진화용)"""
+        self.x[i] = random.uniform(0, self.width - CREATURE_SIZE)
+        self.y[i] = random.uniform(0, self.height - CREATURE_SIZE)
+        self.life[i] = START_LIFE
+        self.alive[i] = True
+        self.eaten[i] = 0
+
+    def random_points(self, n):
+        xs = np.array([random.randint(MARGIN, self.width - MARGIN) for _ in range(n)], dtype=float)
+        ys = np.array([random.randint(MARGIN, self.height - MARGIN) for _ in range(n)], dtype=float)
+        return xs, ys
+
+    # ——————————————
+    # 포식자
+    # ——————————————
+    def update_creature_grid(self):
+        self.creature_grid.build(self.x + self.creature_half, self.y + self.creature_half, self.alive)
+
+    def move_predators(self):
+        if self.swarm.policy == "chase":
+            self.update_creature_grid()
+        self.swarm.move(self)
+        self.predator_grid.build(self.predator_x, self.predator_y)
+
+    def sense_predators(self):
+        """
+        진화하는 포식자용 입력 4개: 가까운 생명체 2마리의 (dx, dy). 없으면 0.
+        update_creature_grid() 를 먼저 불러야 한다.
+        """
+        inputs = np.zeros((self.swarm.n, 4))
+        cx = self.x + self.creature_half
+        cy = self.y + self.creature_half
+
+        prey, _ = self.creature_grid.nearest(self.predator_x, self.predator_y, cx, cy, k=2)
+        for slot in range(2):
+            has = prey[:, slot] >= 0
+            inputs[has, 2 * slot] = cx[prey[has, slot]] - self.predator_x[has]
+            inputs[has, 2 * slot + 1] = cy[prey[has, slot]] - self.predator_y[has]
+        return inputs
+
+    # ——————————————
+    # 생명체
+    # ——————————————
+    def sense(self, idx):
+        """
+        신경망 입력 (second/eat2+pre2.py 와 같은 8개):
+        가까운 먹이 2개, 가까운 포식자 2개의 (dx, dy). 없으면 0.
+        """
+        xs, ys = self.x[idx], self.y[idx]
+        inputs = np.zeros((len(idx), 8))
+
+        food, _ = self.food_grid.nearest(xs, ys, self.food_x, self.food_y, k=2)
+        for slot in range(2):
+            has = food[:, slot] >= 0
+            inputs[has, 2 * slot] = self.food_x[food[has, slot]] - xs[has]
+            inputs[has, 2 * slot + 1] = self.food_y[food[has, slot]] - ys[has]
+
+        pred, _ = self.predator_grid.nearest(xs, ys, self.predator_x, self.predator_y, k=2)
+        for slot in range(2):
+            has = pred[:, slot] >= 0
+            inputs[has, 4 + 2 * slot] = self.predator_x[pred[has, slot]] - xs[has]
+            inputs[has, 4 + 2 * slot + 1] = self.predator_y[pred[has, slot]] - ys[has]
+
+        return inputs
+
+    def move_creatures(self, idx, outputs):
+        """output = [상, 하, 좌, 우] (0.5 초과면 해당 방향으로 이동)"""
+        press = np.asarray(outputs) > 0.5
+        self.x[idx] += self.vel * (press[:, 3].astype(float) - press[:, 2])
+        self.y[idx] += self.vel * (press[:, 1].astype(float) - press[:, 0])
+
+        self.x[idx] = np.clip(self.x[idx], 0, self.width - CREATURE_SIZE)
+        self.y[idx] = np.clip(self.y[idx], 0, self.height - CREATURE_SIZE)
+
+    def catches(self, idx):
+        """
+        이웃 셀의 포식자와 닿은 생명체를 찾는다.
+        반환값: (잡힌 생명체 인덱스, 잡은 포식자 인덱스), 생명체마다 가장 가까운 포식자 하나
+        """
+        if self.swarm.n == 0:
+            return idx[:0], idx[:0]
+
+        q, e = self.predator_grid.neighbours(self.x[idx], self.y[idx])
+        d2 = (self.predator_x[e] - self.x[idx][q]) ** 2 + (self.predator_y[e] - self.y[idx][q]) ** 2
+        reach = CREATURE_SIZE / 2 + PREDATOR_RAD
+        close = d2 < reach * reach
+        q, e, d2 = q[close], e[close], d2[close]
+
+        order = np.lexsort((d2, q))
+        q, e = q[order], e[order]
+        _, first = np.unique(q, return_index=True)
+        return idx[q[first]], e[first]
+
+    def eat(self, idx):
+        """
+        이웃 셀의 먹이를 먹는다. 생명체 하나는 한 프레임에 먹이 하나,
+        먹이 하나는 한 생명체만 먹을 수 있다. 먹은 생명체 인덱스를 반환하고
+        먹힌 먹이는 새 위치로 옮긴다.
+        """
+        q, e = self.food_grid.neighbours(self.x[idx], self.y[idx])
+        d2 = (self.food_x[e] - self.x[idx][q]) ** 2 + (self.food_y[e] - self.y[idx][q]) ** 2
+        close = d2 < EAT_DIST * EAT_DIST
+        if not close.any():
+            return idx[:0]
+        q, e, d2 = q[close], e[close], d2[close]
+
+        # 생명체마다 가장 가까운 먹이 하나
+        order = np.lexsort((d2, q))
+        q, e = q[order], e[order]
+        _, first = np.unique(q, return_index=True)
+        q, e = q[first], e[first]
+
+        # 같은 먹이를 노린 생명체가 여럿이면 하나만
+        _, first = np.unique(e, return_index=True)
+        q, e = q[first], e[first]
+
+        self.food_x[e], self.food_y[e] = self.random_points(len(e))
+        self.food_grid.build(self.food_x, self.food_y)
+        self.eaten[idx[q]] += 1
+        return idx[q]
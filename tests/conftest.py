@@ -0,0 +1,12 @@
+import os
+import sys
+
+# 창 없이 돌리고 저장소 루트에서 arena 를 import
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_addoption(parser):
+    parser.addoption("--update-perf", action="store_true",
+                     help="tests/perf 의 golden 궤적과 처리량 기준값을 지금 결과로 다시 쓴다")
@@ -0,0 +1,133 @@
+"""
+CompactGenome 이 같은 config 의 DefaultGenome 과 같은 규칙으로 움직이는지 본다.
+- 종 분류 거리: 같은 유전자면 값이 같아야 함
+- 교차 / 속성 돌연변이: 난수 흐름이 달라 값은 다르므로 여러 번 돌린 통계를 비교
+"""
+import copy
+import os
+import random
+
+import numpy as np
+import pytest
+from neat.genome import DefaultGenome
+
+from arena.benchmark import ROOT
+from arena.compact_genome import CompactGenome, load_compact_config, params
+from arena.evolution import derive_config, load_config
+
+CONFIG_PATH = os.path.join(ROOT, "arena", "config-feedforward.txt")
+SEED = 1234
+TRIALS = 300
+
+
+@pytest.fixture
+def config():
+    return load_config(CONFIG_PATH)
+
+
+def _new_genome(config, key):
+    g = DefaultGenome(key)
+    g.configure_new(config.genome_config)
+    return g
+
+
+def _no_structural_mutation(gc):
+    gc.node_add_prob = gc.node_delete_prob = gc.conn_add_prob = gc.conn_delete_prob = 0.0
+
+
+def test_params_follow_each_config(tmp_path):
+    # 앞 config 가 지워진 뒤 새 config 가 같은 id 를 받아도 자기 설정 값을 써야 한다
+    path = str(tmp_path / "config.txt")
+    for i in range(200):
+        rate = round(0.001 * (i + 1), 3)
+        gc = load_compact_config(derive_config(CONFIG_PATH, {"weight_mutate_rate": rate}, path)).genome_config
+        assert params(gc).weight.mutate_rate == rate
+
+
+def test_distance_matches_default(config):
+    random.seed(SEED)
+    gc = config.genome_config
+    genomes = [_new_genome(config, key) for key in range(20)]
+    for g in genomes:
+        for _ in range(5):
+            g.mutate(gc)
+    compact = [CompactGenome.from_genome(g) for g in genomes]
+
+    for a in range(len(genomes)):
+        for b in range(len(genomes)):
+            expected = genomes[a].distance(genomes[b], gc)
+            assert compact[a].distance(compact[b], gc) == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+
+def _crossover_share(genome_type, config):
+    """교차 자식의 연결 weight 중 (fitness 가 낮은) 두 번째 부모 값을 받은 비율 (자식 연결 구성은 첫 부모와 같아야 함)"""
+    random.seed(SEED)
+    gc = config.genome_config
+    taken = total = 0
+    for trial in range(TRIALS):
+        # 같은 유전자 구성에 weight / bias 만 다른 두 부모
+        parent1 = _new_genome(config, 0)
+        parent2 = copy.deepcopy(parent1)
+        parent2.key = 1
+        for c in parent2.connections.values():
+            c.weight = random.gauss(0.0, 1.0)
+        for n in parent2.nodes.values():
+            n.bias = random.gauss(0.0, 1.0)
+        parent1.fitness, parent2.fitness = 2.0, 1.0
+        if genome_type is CompactGenome:
+            parent1, parent2 = CompactGenome.from_genome(parent1), CompactGenome.from_genome(parent2)
+        child = genome_type(2)
+        child.configure_crossover(parent1, parent2, gc)
+
+        assert set(child.connections) == set(parent1.connections)
+        other = parent2.connections
+        for key, c in child.connections.items():
+            if key in other and other[key].weight != parent1.connections[key].weight:
+                taken += c.weight == other[key].weight
+                total += 1
+    return taken / total
+
+
+def test_crossover_matches_default(config):
+    default = _crossover_share(DefaultGenome, config)
+    compact = _crossover_share(CompactGenome, config)
+    assert default == pytest.approx(0.5, abs=0.03)
+    assert compact == pytest.approx(default, abs=0.03)
+
+
+def _mutation_stats(genome_type, config):
+    """속성 돌연변이 한 번에 weight / bias 가 바뀐 비율과 바뀐 크기 평균"""
+    random.seed(SEED)
+    gc = config.genome_config
+    _no_structural_mutation(gc)
+    stats = {"weight": [], "bias": []}
+    for trial in range(TRIALS):
+        g = _new_genome(config, 0)
+        if genome_type is CompactGenome:
+            g = CompactGenome.from_genome(g)
+        before = {"weight": [c.weight for c in g.connections.values()],
+                  "bias": [n.bias for n in g.nodes.values()]}
+        g.mutate(gc)
+        after = {"weight": [c.weight for c in g.connections.values()],
+                 "bias": [n.bias for n in g.nodes.values()]}
+        for name in stats:
+            stats[name].extend(np.subtract(after[name], before[name]).tolist())
+
+    result = {}
+    for name, deltas in stats.items():
+        deltas = np.abs(deltas)
+        changed = deltas > 0
+        result[name] = (changed.mean(), deltas[changed].mean())
+    return result
+
+
+def test_mutation_matches_default(config):
+    default = _mutation_stats(DefaultGenome, config)
+    compact = _mutation_stats(CompactGenome, load_compact_config(CONFIG_PATH))
+    gc = config.genome_config
+    expected = {"weight": gc.weight_mutate_rate + gc.weight_replace_rate,
+                "bias": gc.bias_mutate_rate + gc.bias_replace_rate}
+    for name in default:
+        assert default[name][0] == pytest.approx(expected[name], abs=0.03)
+        assert compact[name][0] == pytest.approx(default[name][0], abs=0.03)
+        assert compact[name][1] == pytest.approx(default[name][1], rel=0.1)
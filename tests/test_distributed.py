@@ -0,0 +1,117 @@
+"""
+localhost 에서 코디네이터 + 워커 프로세스로 분산 평가를 돌려 본다.
+- 작업 중인 워커 하나를 멈추면 (SIGSTOP) heartbeat 시간 초과 뒤 작업이 다른 워커로 다시 가고 fitness 가 모두 돌아와야 함
+- 키가 다른 워커는 받아들이지 않아야 함
+- 워커가 없으면 기다린다고 알리고 timeout 뒤 TimeoutError, 이미 보낸 작업의 늦은 결과는 버림
+워커는 fork 로 띄워 테스트에서 등록한 시나리오와 줄인 heartbeat 설정을 그대로 물려받는다.
+"""
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import types
+
+import pytest
+
+from arena import distributed
+from arena.benchmark import ROOT
+
+CONFIG_PATH = os.path.join(ROOT, "arena", "config-feedforward.txt")
+AUTHKEY = "test-key"
+POP_SIZE = 40
+BATCH_SIZE = 5
+TASK_SECONDS = 0.3
+
+pytestmark = pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                                reason="needs the fork start method")
+
+
+def slow_scenario(genomes, config, seed):
+    time.sleep(TASK_SECONDS)
+    return {genome_id: 2.0 * genome_id for genome_id, genome in genomes}
+
+
+@pytest.fixture
+def coordinator(monkeypatch):
+    monkeypatch.setattr(distributed, "HEARTBEAT_INTERVAL", 0.2)
+    monkeypatch.setattr(distributed, "HEARTBEAT_TIMEOUT", 1.5)
+    monkeypatch.setitem(distributed.SCENARIOS, "slow", slow_scenario)
+    c = distributed.Coordinator(CONFIG_PATH, "slow", port=0, batch_size=BATCH_SIZE, seed=1,
+                                authkey=AUTHKEY, timeout=60)
+    yield c
+    c.close()
+
+
+def start_worker(coordinator, name, authkey=AUTHKEY):
+    process = multiprocessing.get_context("fork").Process(
+        target=distributed.worker, args=("127.0.0.1", coordinator.address[1], name, 10.0, authkey), daemon=True)
+    process.start()
+    return process
+
+
+def wait_for(condition, seconds=20.0):
+    deadline = time.monotonic() + seconds
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.05)
+
+
+def test_stalled_worker_task_is_redispatched(coordinator, capsys):
+    workers = {name: start_worker(coordinator, name) for name in ("w0", "w1")}
+    wait_for(lambda: len(coordinator.workers) == 2)
+
+    genomes = [(genome_id, types.SimpleNamespace(fitness=None)) for genome_id in range(POP_SIZE)]
+    evaluation = threading.Thread(target=coordinator.eval_genomes, args=(genomes, None))
+    evaluation.start()
+    try:
+        # w0 가 작업을 받은 뒤 멈춘다 (연결은 열린 채 heartbeat 만 끊김)
+        wait_for(lambda: any(w.name == "w0" and w.task is not None for w in coordinator.workers))
+        os.kill(workers["w0"].pid, signal.SIGSTOP)
+        evaluation.join(60)
+        assert not evaluation.is_alive()
+    finally:
+        for process in workers.values():
+            process.kill()
+            process.join()
+
+    assert [genome.fitness for genome_id, genome in genomes] == [2.0 * i for i in range(POP_SIZE)]
+    assert "Lost worker w0, re-dispatching task" in capsys.readouterr().out
+
+
+def test_worker_with_wrong_key_is_rejected(coordinator, capsys):
+    process = start_worker(coordinator, "intruder", authkey="wrong-key")
+    process.join(20)
+    assert process.exitcode == 0
+    assert coordinator.workers == []
+    assert "Rejected unauthenticated peer" in capsys.readouterr().out
+
+
+def test_no_workers_times_out(coordinator, capsys):
+    coordinator.timeout = 1.0
+    genomes = [(genome_id, types.SimpleNamespace(fitness=None)) for genome_id in range(BATCH_SIZE)]
+    with pytest.raises(TimeoutError):
+        coordinator.eval_genomes(genomes, None)
+    assert "No workers connected" in capsys.readouterr().out
+    assert not coordinator.pending
+
+
+def test_late_results_after_timeout_are_discarded(coordinator):
+    process = start_worker(coordinator, "w0")
+    try:
+        wait_for(lambda: len(coordinator.workers) == 1)
+        coordinator.timeout = TASK_SECONDS / 3
+        genomes = [(genome_id, types.SimpleNamespace(fitness=None)) for genome_id in range(2 * BATCH_SIZE)]
+        with pytest.raises(TimeoutError):
+            coordinator.eval_genomes(genomes, None)
+        assert coordinator.abandoned
+
+        # 들고 있던 작업의 결과가 늦게 와도 쌓이지 않는다
+        wait_for(lambda: coordinator.workers[0].task is None)
+        assert coordinator.results == {}
+        assert not coordinator.abandoned
+        assert not coordinator.pending
+    finally:
+        process.kill()
+        process.join()
@@ -0,0 +1,184 @@
+"""
+시나리오별 짧은 headless 세대 성능 회귀 테스트.
+
+- 고정 시드로 한 세대를 FRAMES 프레임 돌리고 (기존 스크립트 그대로 + arena.scenarios 선언), SNAPSHOT_EVERY 프레임마다 상태를 기록해
+  tests/perf/golden/<시나리오>.json 과 똑같은지 본다 (최적화가 결과를 바꾸면 실패)
+- 초당 프레임이 tests/perf/baseline.json 의 기준값 * (1 - PERF_TOLERANCE) 아래로 떨어지면 실패
+
+기준값은 기계마다 다르므로 새 기계에서는 한 번
+    python -m pytest tests/test_performance.py --update-perf
+로 다시 쓰고, 결과를 일부러 바꾼 커밋에서도 같은 명령으로 golden 을 갱신한다.
+"""
+import json
+import os
+import random
+import tempfile
+import time
+
+import pytest
+
+from arena.benchmark import ROOT, SCENARIOS, episode, scenario_config
+from arena.evolution import derive_config, load_config
+from arena.scenarios import SCENARIOS as CORE_SCENARIOS, VecEnv
+
+# --- 테스트 설정 ---
+SEED = 1234
+POP_SIZE = 30
+FRAMES = 200
+SNAPSHOT_EVERY = 25
+REPEATS = 3          # 같은 시드로 몇 번 돌려서 (서로 같은지 + 가장 빠른 처리량)
+DIGITS = 6           # golden 비교 때 반올림 자리수
+TOLERANCE = float(os.environ.get("PERF_TOLERANCE", "0.5"))   # 기준 처리량보다 이만큼 느려져도 통과
+
+PERF_DIR = os.path.join(os.path.dirname(__file__), "perf")
+BASELINE_PATH = os.path.join(PERF_DIR, "baseline.json")
+
+
+def _round(values):
+    return [round(float(v), DIGITS) for v in values]
+
+
+def run_episode(scenario):
+    """고정 시드로 한 세대 → (스냅샷 목록, 초당 프레임)"""
+    import neat
+
+    random.seed(SEED)
+    config = scenario_config(scenario, {"pop_size": POP_SIZE})
+    genomes = list(neat.Population(config).population.items())
+    snapshots = []
+
+    # 기존 스크립트는 위치가 지역 변수라, 신경망 출력 합으로 입력(위치/거리)이 같았는지 본다
+    activate = neat.nn.FeedForwardNetwork.activate
+    outputs = [0.0]
+
+    def recorded_activate(self, inputs):
+        result = activate(self, inputs)
+        outputs[0] += sum(result)
+        return result
+
+    def on_frame(frame, world):
+        if frame % SNAPSHOT_EVERY:
+            return
+        if world is None:
+            snapshots.append({"frame": frame, "fitness": _round(g.fitness or 0.0 for _, g in genomes),
+                              "outputs": round(outputs[0], DIGITS)})
+        else:
+            snapshots.append({"frame": frame, "x": _round(world.x), "y": _round(world.y),
+                              "life": _round(world.life), "eaten": [int(e) for e in world.eaten]})
+
+    neat.nn.FeedForwardNetwork.activate = recorded_activate
+    try:
+        result = episode(scenario, config, genomes, FRAMES, on_frame=on_frame)
+    finally:
+        neat.nn.FeedForwardNetwork.activate = activate
+    snapshots.append({"frame": "end", "fitness": _round(g.fitness or 0.0 for _, g in genomes)})
+    return snapshots, result["steps"] / result["evaluate_seconds"]
+
+
+def _load(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def _dump(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+def check(name, runs, request):
+    """runs: 같은 시드로 돌린 (스냅샷 목록, 초당 프레임) 들 → golden / 기준값과 비교 (또는 갱신)"""
+    trajectory = runs[0][0]
+    steps_per_sec = max(speed for _, speed in runs)
+
+    # 같은 프로세스에서 같은 시드면 매번 같아야 함
+    for other, _ in runs[1:]:
+        assert other == trajectory, "{0}: same seed gave different trajectories".format(name)
+
+    golden_path = os.path.join(PERF_DIR, "golden", name + ".json")
+    if request.config.getoption("--update-perf"):
+        _dump(golden_path, trajectory)
+        baseline = _load(BASELINE_PATH, {})
+        baseline[name] = round(steps_per_sec, 1)
+        _dump(BASELINE_PATH, baseline)
+        return
+
+    golden = _load(golden_path, None)
+    if golden is None:
+        pytest.skip("no golden trajectory for {0} (run with --update-perf)".format(name))
+    for expected, actual in zip(golden, trajectory):
+        assert actual == expected, "{0}: trajectory differs from golden at frame {1}".format(
+            name, expected["frame"])
+    assert len(trajectory) == len(golden)
+
+    baseline = _load(BASELINE_PATH, {}).get(name)
+    if baseline is None:
+        pytest.skip("no throughput baseline for {0} (run with --update-perf)".format(name))
+    floor = baseline * (1 - TOLERANCE)
+    assert steps_per_sec >= floor, "{0}: {1:.1f} steps/s is below {2:.1f} ({3:.1f} baseline - {4:.0%})".format(
+        name, steps_per_sec, floor, baseline, TOLERANCE)
+
+
+@pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+def test_scenario(scenario, request):
+    check(scenario, [run_episode(scenario) for _ in range(REPEATS)], request)
+
+
+def run_core_episode(name):
+    """arena.scenarios 선언으로 같은 방식의 한 세대"""
+    import neat
+
+    scenario = CORE_SCENARIOS[name]
+    random.seed(SEED)
+    with tempfile.TemporaryDirectory() as tmp:
+        config = load_config(derive_config(os.path.join(ROOT, scenario.config), {"pop_size": POP_SIZE},
+                                           os.path.join(tmp, "config.txt")))
+    genomes = list(neat.Population(config).population.items())
+    snapshots = []
+    frames = [0]
+
+    def observer(frame, arena):
+        frames[0] = frame
+        if frame % SNAPSHOT_EVERY == 0:
+            snapshots.append({"frame": frame, "x": _round(arena.x[0]), "y": _round(arena.y[0]),
+                              "life": _round(arena.life[0]), "eaten": [int(e) for e in arena.eaten[0]]})
+
+    start = time.perf_counter()
+    scenario.eval_genomes(genomes, config, observer=observer, max_frames=FRAMES)
+    seconds = time.perf_counter() - start
+    snapshots.append({"frame": "end", "fitness": _round(g.fitness for _, g in genomes)})
+    return snapshots, frames[0] / seconds
+
+
+@pytest.mark.parametrize("name", sorted(CORE_SCENARIOS))
+def test_core_scenario(name, request):
+    check("core-" + name, [run_core_episode(name) for _ in range(REPEATS)], request)
+
+
+VEC_ENVS = 256
+
+
+def run_vec_env(name):
+    """VecEnv 에 고정 시드 무작위 행동 → 보상 / done 합계 스냅샷"""
+    import numpy as np
+
+    env = VecEnv(name, VEC_ENVS)
+    obs = env.reset(np.arange(VEC_ENVS) + SEED)
+    actions = np.random.default_rng(SEED).random((FRAMES, VEC_ENVS, env.action_size))
+    total = np.zeros(VEC_ENVS)
+    snapshots = []
+    start = time.perf_counter()
+    for t in range(FRAMES):
+        obs, reward, done, info = env.step(actions[t])
+        total += reward
+        if (t + 1) % SNAPSHOT_EVERY == 0:
+            snapshots.append({"frame": t + 1, "reward": _round(total), "done": int(done.sum()),
+                              "obs": round(float(obs.sum()), DIGITS)})
+    return snapshots, VEC_ENVS * FRAMES / (time.perf_counter() - start)
+
+
+@pytest.mark.parametrize("name", ["4_multiEating", "eat2+pre2"])
+def test_vec_env(name, request):
+    check("vec-" + name, [run_vec_env(name) for _ in range(REPEATS)], request)
@@ -0,0 +1,30 @@
+"""
+세대 재생 (arena.replay) 이 기록된 세대를 비트 단위로 같은 fitness 로 다시 만드는지 본다.
+짧게 돌리려고 시나리오 프레임 수와 population 크기를 줄인다.
+"""
+import os
+
+import pytest
+
+from arena import cli, replay
+from arena.evolution import derive_config
+from arena.scenarios import SCENARIOS as CORE_SCENARIOS
+
+SEED = 1234
+POP_SIZE = 20
+FRAMES = 150
+GENERATIONS = 3
+
+
+@pytest.mark.parametrize("name", ["eat2+pre2", "angle"])
+def test_replay_matches_log(name, tmp_path, monkeypatch):
+    monkeypatch.setattr(CORE_SCENARIOS[name], "max_frames", FRAMES)
+    config_path = derive_config(os.path.join(cli.ROOT, CORE_SCENARIOS[name].config), {"pop_size": POP_SIZE},
+                                str(tmp_path / "config.txt"))
+    log_path = str(tmp_path / "run.jsonl")
+    cli.run(name, config_path, GENERATIONS, SEED, log_path=log_path)
+
+    records = list(replay.read(log_path, replay.KIND))
+    assert [r["generation"] for r in records] == list(range(GENERATIONS))
+    for generation in range(GENERATIONS):
+        assert replay.replay(log_path, generation, window=False, verify=True)
@@ -0,0 +1,49 @@
+"""
+warm start (arena.warm_start) 로 숨은 노드가 있는 champion 에서 population 을 시작할 때
+돌연변이 복사본의 새 노드 번호가 champion 들의 노드 번호와 겹치지 않는지 본다.
+"""
+import os
+import random
+
+from arena.benchmark import ROOT
+from arena.evolution import derive_config, load_config
+from arena.warm_start import seed_population
+
+CONFIG_PATH = os.path.join(ROOT, "arena", "config-feedforward.txt")
+SEED = 1234
+CHAMPIONS = 4
+POP_SIZE = 12
+
+
+def evolved_champions(config):
+    """add-node 돌연변이를 여러 번 거쳐 숨은 노드 번호가 서로 다른 champion"""
+    gc = config.genome_config
+    champions = []
+    for key in range(CHAMPIONS):
+        g = config.genome_type(key)
+        g.configure_new(gc)
+        for _ in range(3 + key):
+            g.mutate_add_node(gc)
+        g.fitness = float(key)
+        champions.append(g)
+    return champions
+
+
+def test_seeded_mutations_do_not_reuse_champion_nodes(tmp_path):
+    random.seed(SEED)
+    path = derive_config(CONFIG_PATH, {"pop_size": POP_SIZE, "node_add_prob": 1.0}, str(tmp_path / "config.txt"))
+    champions = evolved_champions(load_config(path))
+    config = load_config(path)
+    num_inputs, num_outputs = config.genome_config.num_inputs, config.genome_config.num_outputs
+
+    p = seed_population(config, champions, num_inputs, num_outputs, random_fraction=0.0)
+
+    champion_nodes = {k for g in champions for k in g.nodes}
+    top = max(champion_nodes)
+    for n, g in enumerate(p.population.values()):
+        source = champions[n % CHAMPIONS]
+        new_nodes = set(g.nodes) - set(source.nodes)
+        if n < CHAMPIONS:
+            assert not new_nodes
+        else:
+            assert new_nodes and all(k > top for k in new_nodes)